@@ -163,6 +163,8 @@ rst_epilog = """
 
 .. |DirectoryFileSystem| replace:: :class:`DirectoryFileSystem`
 
+.. |DownsamplePolicy| replace:: :class:`.DownsamplePolicy`
+
 .. |Emu| replace:: :class:`.Emu`
 
 .. |False| replace:: :class:`False`
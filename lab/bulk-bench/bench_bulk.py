@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Times adding slides to a new presentation one at a time with
+`Slides.add_slide()` and all at once with `Slides.add_slides()`, and
+checks both produce the same slides.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/bulk-bench/bench_bulk.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from pptx import Presentation
+
+
+LAYOUT_IDX = 1
+
+
+def add_one_at_a_time(count):
+    prs = Presentation()
+    layout = prs.slide_layouts[LAYOUT_IDX]
+    for _ in range(count):
+        prs.slides.add_slide(layout)
+    return prs
+
+
+def add_in_bulk(count):
+    prs = Presentation()
+    layout = prs.slide_layouts[LAYOUT_IDX]
+    prs.slides.add_slides(layout, count)
+    return prs
+
+
+def timed(label, func, count):
+    start = time.time()
+    prs = func(count)
+    print('%-28s %6d slides %9.1f ms' % (
+        label, count, (time.time() - start) * 1000
+    ))
+    return prs
+
+
+def same_slides(prs_a, prs_b):
+    return [
+        (s.part.partname, s.slide_id, s.element.xml) for s in prs_a.slides
+    ] == [
+        (s.part.partname, s.slide_id, s.element.xml) for s in prs_b.slides
+    ]
+
+
+def main():
+    for count in (500, 1000, 2000):
+        prs_a = timed('add_slide() one at a time', add_one_at_a_time, count)
+        prs_b = timed('add_slides()', add_in_bulk, count)
+        assert same_slides(prs_a, prs_b)
+        print()
+    timed('add_slides()', add_in_bulk, 5000)
+
+
+if __name__ == '__main__':
+    main()
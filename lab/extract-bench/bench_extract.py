@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compares reading all the slide text of a deck with the functions in
+pptx.extract against loading a |Presentation| and reading the text frame of
+each shape. The deck has a title, a bulleted body, notes and a photo-sized
+picture on each slide, and a chart on every fifth slide. Requires Pillow.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/extract-bench/bench_extract.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+import timeit
+
+from PIL import Image
+
+from pptx import Presentation, extract
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+
+SLIDE_COUNT = 40
+REPEAT = 10
+
+
+def build_deck():
+    prs = Presentation()
+    layout = prs.slide_layouts[1]
+    for idx in range(SLIDE_COUNT):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = 'Slide %d' % idx
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = 'First point of slide %d' % idx
+        for line_idx in range(8):
+            text_frame.add_paragraph().text = (
+                'Point %d, lorem ipsum dolor sit amet' % line_idx
+            )
+        slide.shapes.add_picture(
+            photo(), Inches(6), Inches(5), Inches(3), Inches(2)
+        )
+        if idx % 5 == 0:
+            chart_data = CategoryChartData()
+            chart_data.categories = ['East', 'West', 'Midwest']
+            chart_data.add_series('Q1', (19.2, 21.4, 16.7))
+            slide.shapes.add_chart(
+                XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(5),
+                Inches(4), Inches(2), chart_data
+            )
+        slide.notes_slide.notes_text_frame.text = 'Notes for slide %d' % idx
+
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def photo():
+    """
+    Return a stream containing a distinct 800 x 600 JPEG image of noise,
+    which compresses about as poorly as a photo.
+    """
+    image = Image.frombytes('RGB', (800, 600), os.urandom(800 * 600 * 3))
+    stream = io.BytesIO()
+    image.save(stream, 'JPEG', quality=85)
+    stream.seek(0)
+    return stream
+
+
+def text_by_presentation(pptx_bytes):
+    prs = Presentation(io.BytesIO(pptx_bytes))
+    text = []
+    for slide_idx, slide in enumerate(prs.slides):
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                text.append((slide_idx, shape.id, shape.text_frame.text))
+    return text
+
+
+def text_by_extract(pptx_bytes):
+    return list(extract.iter_text(io.BytesIO(pptx_bytes)))
+
+
+def report(label, func):
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print('%-32s %8.2f ms' % (label, seconds * 1000))
+    return seconds
+
+
+def main():
+    pptx_bytes = build_deck()
+    print('deck: %d slides, %d bytes\n' % (SLIDE_COUNT, len(pptx_bytes)))
+    assert text_by_extract(pptx_bytes) == text_by_presentation(pptx_bytes)
+
+    by_presentation = report(
+        'Presentation + TextFrame.text',
+        lambda: text_by_presentation(pptx_bytes)
+    )
+    by_extract = report(
+        'extract.iter_text()', lambda: text_by_extract(pptx_bytes)
+    )
+    print('\n%.1fx faster' % (by_presentation / by_extract))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Times parsing and reading a large slide and a large chart, with the oxml
+parser and with the read-only parser, and opening a deck and reading all
+its text.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/parse-bench/bench_parse.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import timeit
+
+from pptx import Presentation
+from pptx.chart.data import XyChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.oxml import parse_xml, parse_xml_readonly
+from pptx.util import Inches
+
+
+SHAPE_COUNT = 300
+POINT_COUNT = 500
+REPEAT = 20
+
+
+def build_deck():
+    prs = Presentation()
+    blank_layout = prs.slide_layouts[6]
+    slide = prs.slides.add_slide(blank_layout)
+    for idx in range(SHAPE_COUNT):
+        textbox = slide.shapes.add_textbox(
+            Inches(idx % 10), Inches(idx // 10 * 0.2), Inches(1), Inches(0.2)
+        )
+        textbox.text_frame.text = 'Shape %d lorem ipsum dolor sit amet' % idx
+
+    chart_data = XyChartData()
+    series = chart_data.add_series('Series 1')
+    for idx in range(POINT_COUNT):
+        series.add_data_point(idx, idx * idx % 97)
+    slide = prs.slides.add_slide(blank_layout)
+    slide.shapes.add_chart(
+        XL_CHART_TYPE.XY_SCATTER, 0, 0, Inches(8), Inches(6), chart_data
+    )
+
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def read_all_text(pptx_bytes):
+    prs = Presentation(io.BytesIO(pptx_bytes))
+    text = []
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if shape.has_text_frame:
+                text.append(shape.text_frame.text)
+    return text
+
+
+def walk(element):
+    return sum(1 for _ in element.iter())
+
+
+def report(label, func):
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print('%-36s %8.2f ms' % (label, seconds * 1000))
+
+
+def main():
+    pptx_bytes = build_deck()
+    prs = Presentation(io.BytesIO(pptx_bytes))
+    slide_xml = prs.slides[0].part.blob
+    chart_xml = prs.slides[1].shapes[0].chart.part.blob
+    print('slide XML: %d bytes, chart XML: %d bytes\n' % (
+        len(slide_xml), len(chart_xml)
+    ))
+
+    for name, xml in (('slide', slide_xml), ('chart', chart_xml)):
+        report('parse %s, oxml' % name, lambda: parse_xml(xml))
+        report('parse %s, read-only' % name, lambda: parse_xml_readonly(xml))
+        report('parse+walk %s, oxml' % name, lambda: walk(parse_xml(xml)))
+        report(
+            'parse+walk %s, read-only' % name,
+            lambda: walk(parse_xml_readonly(xml))
+        )
+    report('open deck and read all text', lambda: read_all_text(pptx_bytes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Walks the shapes of a 500-slide deck several times, reading the fill and
+line of each shape, with and without shape proxy caching, and reports the
+time taken, the number of proxy objects created, the peak memory
+allocated while walking and the memory kept by the first walk, such as the
+slide objects and any cached proxies.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/proxy-bench/bench_proxy.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import time
+import tracemalloc
+
+from pptx import Presentation
+from pptx.dml.fill import FillFormat
+from pptx.dml.line import LineFormat
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.shapes.base import BaseShape
+from pptx.util import Inches
+
+
+SLIDE_COUNT = 500
+SHAPE_COUNT = 8
+PASSES = 5
+
+created = {}
+
+
+def count_instances(cls):
+    """
+    Wrap the initializer of *cls* so each instance created is counted.
+    """
+    init = cls.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created[cls.__name__] = created.get(cls.__name__, 0) + 1
+        init(self, *args, **kwargs)
+
+    cls.__init__ = counting_init
+
+
+def build_deck():
+    prs = Presentation()
+    blank_layout = prs.slide_layouts[6]
+    for _ in range(SLIDE_COUNT):
+        shapes = prs.slides.add_slide(blank_layout).shapes
+        for idx in range(SHAPE_COUNT):
+            shapes.add_shape(
+                MSO_SHAPE.RECTANGLE, Inches(idx), 0, Inches(1), Inches(1)
+            )
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def walk(prs):
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            shape.fill
+            shape.line
+
+
+def measure(prs):
+    tracemalloc.start()
+    walk(prs)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.time()
+    for _ in range(PASSES):
+        walk(prs)
+    seconds = time.time() - start
+
+    created.clear()
+    tracemalloc.start()
+    for _ in range(PASSES):
+        walk(prs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, dict(created), peak, retained
+
+
+def main():
+    for cls in (BaseShape, FillFormat, LineFormat):
+        count_instances(cls)
+    pptx_bytes = build_deck()
+    print('%d slides of %d shapes, walked %d times\n' % (
+        SLIDE_COUNT, SHAPE_COUNT, PASSES
+    ))
+    for caching in (False, True):
+        prs = Presentation(io.BytesIO(pptx_bytes))
+        prs.cache_shape_proxies = caching
+        seconds, counts, peak, retained = measure(prs)
+        print('cache_shape_proxies = %s' % caching)
+        print('  time                %8.1f ms' % (seconds * 1000))
+        for name in sorted(counts):
+            print('  %-19s %8d created' % (name, counts[name]))
+        print('  peak allocated      %8.1f KiB' % (peak / 1024))
+        print('  kept by first walk  %8.1f KiB\n' % (retained / 1024))
+
+
+if __name__ == '__main__':
+    main()
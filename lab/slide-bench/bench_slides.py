@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Times resolving the jump links of a 1,000-slide deck, each slide having
+a "next slide" link, "previous slide" on the last one, and a link to
+another slide, and looking up each slide by its slide id and each slide id
+by its slide.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/slide-bench/bench_slides.py
+
+To compare with another version of the package, run it with that version
+first on `PYTHONPATH`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import time
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches
+
+
+SLIDE_COUNT = 1000
+
+HLINK = (
+    '<a:hlinkClick %s r:id="%%s" action="ppaction://hlinkshowjump?jump=%%s"/>'
+    % nsdecls('a', 'r')
+)
+SLDJUMP = (
+    '<a:hlinkClick %s r:id="%%s" action="ppaction://hlinksldjump"/>'
+    % nsdecls('a', 'r')
+)
+
+
+def build_deck():
+    prs = Presentation()
+    blank_layout = prs.slide_layouts[6]
+    slides = [prs.slides.add_slide(blank_layout) for _ in range(SLIDE_COUNT)]
+    for idx, slide in enumerate(slides):
+        shapes = slide.shapes
+        next_link = shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        jump = 'nextslide' if idx < SLIDE_COUNT - 1 else 'previousslide'
+        next_link.element.nvSpPr.cNvPr.append(parse_xml(HLINK % ('', jump)))
+        jump_link = shapes.add_textbox(0, Inches(1), Inches(1), Inches(1))
+        target = slides[(idx * 7 + 3) % SLIDE_COUNT]
+        rId = slide.part.relate_to(target.part, RT.SLIDE)
+        jump_link.element.nvSpPr.cNvPr.append(parse_xml(SLDJUMP % rId))
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def resolve_links(prs):
+    targets = []
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            target = shape.click_action.target_slide
+            if target is not None:
+                targets.append(target.slide_id)
+    return targets
+
+
+def look_up_slides(prs):
+    slides = prs.slides
+    return [slides.get(slide.slide_id) for slide in slides]
+
+
+def report(label, func, prs):
+    start = time.time()
+    func(prs)
+    print('%-36s %9.1f ms' % (label, (time.time() - start) * 1000))
+
+
+def main():
+    prs = Presentation(io.BytesIO(build_deck()))
+    for slide in prs.slides:  # load each slide before timing
+        slide.shapes
+    print('%d slides\n' % SLIDE_COUNT)
+    report('resolve all jump links', resolve_links, prs)
+    report('look up each slide by its slide id', look_up_slides, prs)
+
+
+if __name__ == '__main__':
+    main()
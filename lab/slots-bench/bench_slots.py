@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measures the memory used by and the time taken to create the proxy objects
+most often created while reading a presentation, and how many of them
+a cyclic garbage collection pass has to visit.
+
+Run from the repository root::
+
+    $ PYTHONPATH=. python lab/slots-bench/bench_slots.py
+
+To compare with another version of the package, run it with that version
+first on `PYTHONPATH`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import time
+import tracemalloc
+
+from pptx.dml.color import ColorFormat
+from pptx.dml.fill import FillFormat
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.shapes.autoshape import Shape
+from pptx.shapes.table import _Cell
+from pptx.text.text import Font, _Paragraph, _Run
+
+
+COUNT = 100000
+
+sp = parse_xml(
+    '<p:sp %s><p:nvSpPr><p:cNvPr id="2" name="Foo"/><p:cNvSpPr/><p:nvPr/>'
+    '</p:nvSpPr><p:spPr/><p:txBody><a:bodyPr/><a:p><a:r><a:rPr/><a:t>Foo'
+    '</a:t></a:r></a:p></p:txBody></p:sp>' % nsdecls('a', 'p')
+)
+p = sp.xpath('.//a:p')[0]
+r = sp.xpath('.//a:r')[0]
+rPr = sp.xpath('.//a:rPr')[0]
+spPr = sp.xpath('./p:spPr')[0]
+
+# each class and a function creating one of its instances
+PROXIES = (
+    (Shape, lambda cls: cls(sp, None)),
+    (_Paragraph, lambda cls: cls(p, None)),
+    (_Run, lambda cls: cls(r, None)),
+    (Font, lambda cls: cls(rPr)),
+    (FillFormat, lambda cls: cls(spPr, None)),
+    (ColorFormat, lambda cls: cls(spPr, None)),
+    (_Cell, lambda cls: cls(None, None)),
+)
+
+
+def measure(new):
+    gc.collect()
+    tracemalloc.start()
+    objs = [new() for _ in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracked = len(gc.get_objects())
+    del objs
+    tracked -= len(gc.get_objects())
+
+    gc.collect()
+    start = time.time()
+    objs = [new() for _ in range(COUNT)]
+    seconds = time.time() - start
+    return size / COUNT, seconds, tracked / COUNT
+
+
+def main():
+    print('%d instances of each class\n' % COUNT)
+    print('%-12s %10s %10s %14s' % (
+        'class', 'bytes', 'time', 'gc-tracked'
+    ))
+    total_size = total_seconds = 0
+    for cls, new in PROXIES:
+        size, seconds, tracked = measure(lambda: new(cls))
+        total_size += size
+        total_seconds += seconds
+        print('%-12s %10.0f %8.1fms %14.1f' % (
+            cls.__name__, size, seconds * 1000, tracked
+        ))
+    print('%-12s %10.0f %8.1fms' % (
+        'total', total_size, total_seconds * 1000
+    ))
+
+
+if __name__ == '__main__':
+    main()
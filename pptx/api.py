@@ -17,17 +17,24 @@ from .opc.constants import CONTENT_TYPE as CT
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, lazy=False, use_mmap=False):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
-    "template" is loaded.
+    "template" is loaded. If *lazy* is |True|, each part of the package is
+    read and parsed only when first accessed, which makes opening a large
+    file much cheaper when only a few of its parts are used. The file must
+    remain unchanged while a lazily opened presentation is in use. If
+    *use_mmap* is |True| and *pptx* is a path, the file is memory-mapped
+    instead of read through buffered I/O, so large media stored without
+    compression is not copied into memory; the file must likewise remain
+    unchanged while the presentation is in use.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, lazy, use_mmap).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -36,6 +43,19 @@ def Presentation(pptx=None):
     return presentation_part.presentation
 
 
+def compact(pptx):
+    """
+    Rewrite the ``.pptx`` file at path *pptx* to reclaim the space taken by
+    the members superseded when a presentation is saved to it with
+    ``append=True``. Members are copied without being recompressed. A
+    presentation still open lazily from *pptx* keeps reading the file as
+    it was before compaction, so it can still be saved, including to
+    *pptx* with ``append=True``, though that save then writes all of its
+    parts again.
+    """
+    Package.compact(pptx)
+
+
 def _default_pptx_path():
     """
     Return the path to the built-in default .pptx package.
@@ -427,6 +427,6 @@ class ValueAxis(_BaseAxis):
         this axis.
         """
         crossAx_id = self._element.crossAx.val
-        expr = '(../c:catAx | ../c:valAx)/c:axId[@val="%d"]' % crossAx_id
-        cross_axId = self._element.xpath(expr)[0]
+        expr = '(../c:catAx | ../c:valAx)/c:axId[@val=$axId]'
+        cross_axId = self._element.xpath(expr, axId=crossAx_id)[0]
         return cross_axId.getparent()
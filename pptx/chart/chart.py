@@ -21,6 +21,9 @@ class Chart(PartElementProxy):
     """
     A chart object.
     """
+
+    __slots__ = ('_chartSpace', '_plots', '_series')
+
     def __init__(self, chartSpace, chart_part):
         super(Chart, self).__init__(chartSpace, chart_part)
         self._chartSpace = chartSpace
@@ -18,6 +18,9 @@ class ColorFormat(object):
     Provides access to color settings such as RGB color, theme color, and
     luminance adjustments.
     """
+
+    __slots__ = ('_xFill', '_color')
+
     def __init__(self, eg_colorChoice_parent, color):
         super(ColorFormat, self).__init__()
         self._xFill = eg_colorChoice_parent
@@ -110,6 +113,9 @@ class _Color(object):
     Object factory for color object of the appropriate type, also the base
     class for all color type classes such as SRgbColor.
     """
+
+    __slots__ = ('_xClr',)
+
     def __new__(cls, xClr):
         color_cls = {
             type(None):     _NoneColor,
@@ -185,6 +191,8 @@ class _Color(object):
 
 class _HslColor(_Color):
 
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.HSL
@@ -192,6 +200,8 @@ class _HslColor(_Color):
 
 class _NoneColor(_Color):
 
+    __slots__ = ()
+
     @property
     def color_type(self):
         return None
@@ -208,6 +218,8 @@ class _NoneColor(_Color):
 
 class _PrstColor(_Color):
 
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.PRESET
@@ -215,6 +227,8 @@ class _PrstColor(_Color):
 
 class _SchemeColor(_Color):
 
+    __slots__ = ('_schemeClr',)
+
     def __init__(self, schemeClr):
         super(_SchemeColor, self).__init__(schemeClr)
         self._schemeClr = schemeClr
@@ -241,6 +255,8 @@ class _SchemeColor(_Color):
 
 class _ScRgbColor(_Color):
 
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.SCRGB
@@ -248,6 +264,8 @@ class _ScRgbColor(_Color):
 
 class _SRgbColor(_Color):
 
+    __slots__ = ('_srgbClr',)
+
     def __init__(self, srgbClr):
         super(_SRgbColor, self).__init__(srgbClr)
         self._srgbClr = srgbClr
@@ -271,6 +289,8 @@ class _SRgbColor(_Color):
 
 class _SysColor(_Color):
 
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.SYSTEM
@@ -280,6 +300,9 @@ class RGBColor(tuple):
     """
     Immutable value object defining a particular RGB color.
     """
+
+    __slots__ = ()
+
     def __new__(cls, r, g, b):
         msg = 'RGBColor() takes three integer values 0-255'
         for val in (r, g, b):
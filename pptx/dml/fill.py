@@ -22,6 +22,9 @@ class FillFormat(object):
     Provides access to the current fill properties object and provides
     methods to change the fill type.
     """
+
+    __slots__ = ('_xPr', '_fill')
+
     def __init__(self, eg_fill_properties_parent, fill_obj):
         super(FillFormat, self).__init__()
         self._xPr = eg_fill_properties_parent
@@ -79,6 +82,9 @@ class _Fill(object):
     _SolidFill for ``<a:solidFill>``; also serves as the base class for all
     fill classes
     """
+
+    __slots__ = ()
+
     def __new__(cls, xFill):
         if xFill is None:
             fill_cls = _NoneFill
@@ -115,6 +121,8 @@ class _Fill(object):
 
 class _BlipFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def fore_color(self):
         """
@@ -130,6 +138,8 @@ class _BlipFill(_Fill):
 
 class _GradFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def type(self):
         return MSO_FILL.GRADIENT
@@ -137,6 +147,8 @@ class _GradFill(_Fill):
 
 class _GrpFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def fore_color(self):
         """
@@ -152,6 +164,8 @@ class _GrpFill(_Fill):
 
 class _NoFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def fore_color(self):
         """
@@ -167,6 +181,8 @@ class _NoFill(_Fill):
 
 class _NoneFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def fore_color(self):
         """
@@ -182,6 +198,8 @@ class _NoneFill(_Fill):
 
 class _PattFill(_Fill):
 
+    __slots__ = ()
+
     @property
     def type(self):
         return MSO_FILL.PATTERNED
@@ -191,6 +209,9 @@ class _SolidFill(_Fill):
     """
     Provides access to fill properties such as color for solid fills.
     """
+
+    __slots__ = ('_solidFill', '_fore_color')
+
     def __init__(self, solidFill):
         super(_SolidFill, self).__init__()
         self._solidFill = solidFill
@@ -17,6 +17,9 @@ class LineFormat(object):
     Typically accessed via the ``.line`` property of a shape such as |Shape|
     or |Picture|.
     """
+
+    __slots__ = ('_parent', '_color', '_fill')
+
     def __init__(self, parent):
         super(LineFormat, self).__init__()
         self._parent = parent
@@ -0,0 +1,212 @@
+# encoding: utf-8
+
+"""
+Read-only extraction of the text and core properties of a presentation,
+for uses like search indexing that need only its content. The package is
+read directly, without loading a |Presentation| object; only the parts
+holding the content asked for are read, and the XML of each slide is
+streamed, so memory use doesn't grow with the size of the presentation.
+
+Only the text of shapes having a text frame is extracted; the text in the
+cells of a table, which is held in a graphic frame, is not.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from zipfile import ZipFile
+
+from lxml import etree
+
+from .compat import to_unicode
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.pkgreader import _SerializedRelationshipCollection
+from .oxml import parse_xml_readonly
+from .oxml.ns import namespaces, qn
+from .oxml.xmlchemy import compiled_xpath
+from .parts.coreprops import CorePropertiesPart
+
+
+def core_properties(pkg_file):
+    """
+    Return a |CoreProperties| object holding the Dublin Core document
+    properties of the presentation in *pkg_file*, a path or a file-like
+    object, such as its title and author, or |None| if it has none. It has
+    the same properties as :attr:`Presentation.core_properties`, but
+    changes to it are not saved anywhere.
+    """
+    with ZipFile(pkg_file) as zipf:
+        partname = _target_partname(
+            _srels(zipf, PACKAGE_URI), RT.CORE_PROPERTIES
+        )
+        if partname is None:
+            return None
+        return CorePropertiesPart.load(
+            partname, CT.OPC_CORE_PROPERTIES, zipf.read(partname.membername),
+            None
+        )
+
+
+def iter_notes_text(pkg_file):
+    """
+    Generate a `(slide_idx, text)` 2-tuple for each slide having a notes
+    page in the presentation in *pkg_file*, a path or a file-like object.
+    *slide_idx* is the zero-based position of the slide in the
+    presentation and *text* is the text of its notes placeholder, as
+    :attr:`TextFrame.text` would give it.
+    """
+    with ZipFile(pkg_file) as zipf:
+        for slide_idx, partname in enumerate(_slide_partnames(zipf)):
+            notes_partname = _target_partname(
+                _srels(zipf, partname), RT.NOTES_SLIDE
+            )
+            if notes_partname is None:
+                continue
+            for _, ph_type, text in _iter_shape_text(zipf, notes_partname):
+                if ph_type == 'body':
+                    yield slide_idx, text
+                    break
+
+
+def iter_text(pkg_file):
+    """
+    Generate a `(slide_idx, shape_id, text)` 3-tuple for each shape having
+    a text frame, including those in a group, on each slide of the
+    presentation in *pkg_file*, a path or a file-like object, in
+    presentation order. *slide_idx* is the zero-based position of the slide
+    in the presentation, *shape_id* is the integer id of the shape on its
+    slide and *text* is the text of the shape as :attr:`TextFrame.text`
+    would give it. A shape without an id is skipped, as is the text of a
+    table, which is not in a text frame of its own.
+    """
+    with ZipFile(pkg_file) as zipf:
+        for slide_idx, partname in enumerate(_slide_partnames(zipf)):
+            for shape_id, _, text in _iter_shape_text(zipf, partname):
+                yield slide_idx, shape_id, text
+
+
+def iter_titles(pkg_file):
+    """
+    Generate a `(slide_idx, title)` 2-tuple for each slide having a title
+    placeholder in the presentation in *pkg_file*, a path or a file-like
+    object. *title* is the text of the placeholder.
+    """
+    with ZipFile(pkg_file) as zipf:
+        for slide_idx, partname in enumerate(_slide_partnames(zipf)):
+            for _, ph_type, text in _iter_shape_text(zipf, partname):
+                if ph_type in ('title', 'ctrTitle'):
+                    yield slide_idx, text
+                    break
+
+
+def _iter_shape_text(zipf, partname):
+    """
+    Generate a `(shape_id, ph_type, text)` 3-tuple for each ``<p:sp>``
+    element having a ``<p:txBody>`` child and an id in the part *partname*
+    of *zipf*. *ph_type* is the value of the ``type`` attribute of its
+    placeholder element, or |None| if it is not a placeholder. A table
+    has no ``<p:sp>`` element, so its text is not generated. The XML is
+    streamed, each shape element being discarded once it's been read, and
+    is parsed with the same settings as :func:`parse_xml`.
+    """
+    with zipf.open(partname.membername) as f:
+        for _, sp in etree.iterparse(
+                f, tag=_sp_tag, remove_blank_text=True,
+                resolve_entities=False, huge_tree=False):
+            shape_text = _shape_text(sp)
+            if shape_text is not None:
+                yield shape_text
+            # discard the shape and the elements read before it
+            sp.clear()
+            while sp.getprevious() is not None:
+                del sp.getparent()[0]
+
+
+def _shape_text(sp):
+    """
+    Return a `(shape_id, ph_type, text)` 3-tuple for *sp*, a ``<p:sp>``
+    element, or |None| if it has no ``<p:txBody>`` child or no id, as a
+    shape in a malformed file may not. The text has
+    a line feed between paragraphs and for each line break, like
+    |TextFrame|.
+    """
+    items = iter(_sp_items(sp))
+    shape_id = next(items, None)
+    if shape_id is None or isinstance(shape_id, etree._Element):
+        return None
+    shape_id = int(shape_id)
+    ph_type, has_txBody, paragraph_count, text = None, False, 0, []
+    for item in items:
+        if not isinstance(item, etree._Element):
+            text.append(item)
+        elif item.tag == _ph_tag:
+            ph_type = item.get('type', 'obj')
+        elif item.tag == _txBody_tag:
+            has_txBody = True
+        elif item.tag == _p_tag:
+            if paragraph_count:
+                text.append('\n')
+            paragraph_count += 1
+        else:  # a:br
+            text.append('\n')
+    if not has_txBody:
+        return None
+    return shape_id, ph_type, to_unicode(''.join(text))
+
+
+def _slide_partnames(zipf):
+    """
+    Return a list of the partnames of the slide parts of the presentation
+    in *zipf*, in presentation order.
+    """
+    prs_partname = _target_partname(
+        _srels(zipf, PACKAGE_URI), RT.OFFICE_DOCUMENT
+    )
+    prs_srels = dict(
+        (srel.rId, srel) for srel in _srels(zipf, prs_partname)
+    )
+    presentation = parse_xml_readonly(zipf.read(prs_partname.membername))
+    rIds = compiled_xpath('./p:sldIdLst/p:sldId/@r:id')(presentation)
+    return [prs_srels[rId].target_partname for rId in rIds]
+
+
+def _srels(zipf, source_uri):
+    """
+    Return the |_SerializedRelationshipCollection| of the relationships
+    from *source_uri* in *zipf*, empty if it has no relationships item.
+    """
+    try:
+        rels_xml = zipf.read(source_uri.rels_uri.membername)
+    except KeyError:
+        rels_xml = None
+    return _SerializedRelationshipCollection.load_from_xml(
+        source_uri.baseURI, rels_xml
+    )
+
+
+def _target_partname(srels, reltype):
+    """
+    Return the partname of the target of the first internal relationship
+    of *reltype* in *srels*, or |None| if there is none.
+    """
+    for srel in srels:
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    return None
+
+
+_p_tag = qn('a:p')
+_ph_tag = qn('p:ph')
+_sp_tag = qn('p:sp')
+_txBody_tag = qn('p:txBody')
+
+# the id and placeholder of a p:sp element, then its txBody with each of its
+# paragraphs, line breaks and run and field text, in document order; one
+# compiled XPath call creates far fewer Python objects than walking the
+# elements, and the id and text come back as plain strings
+_sp_items = etree.XPath(
+    'p:nvSpPr/p:cNvPr/@id | p:nvSpPr/p:nvPr/p:ph | p:txBody | p:txBody/a:p |'
+    ' p:txBody/a:p/a:br | p:txBody/a:p/a:r/a:t/text() |'
+    ' p:txBody/a:p/a:fld/a:t/text()',
+    namespaces=namespaces('a', 'p'), smart_strings=False
+)
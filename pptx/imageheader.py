@@ -0,0 +1,198 @@
+# encoding: utf-8
+
+"""
+Reads the format, pixel size and resolution of an image from its header,
+without decoding the image. PNG, JPEG, GIF, BMP and TIFF images are
+recognized.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+
+def probe(blob):
+    """
+    Return a `(format, (width, height), dpi)` 3-tuple for the image in
+    *blob*, where *format* is the name Pillow uses for the image format,
+    e.g. ``'PNG'``, and *dpi* is a `(horz_dpi, vert_dpi)` 2-tuple of floats,
+    or |None| when the image doesn't specify its resolution. Returns |None|
+    if the format of *blob* isn't recognized or its header can't be read.
+    Only the header of the image is looked at.
+    """
+    head = bytes(blob[:8])
+    for signature, probe_format in _probes:
+        if head.startswith(signature):
+            try:
+                return probe_format(blob)
+            except (IndexError, KeyError, struct.error, ValueError,
+                    ZeroDivisionError):
+                return None
+    return None
+
+
+def _probe_bmp(blob):
+    """
+    Return the properties of the BMP image in *blob*.
+    """
+    header_size = _unpack('<I', blob, 14)
+    if header_size == 12:
+        width, height = _unpack('<HH', blob, 18)
+        return 'BMP', (width, height), None
+    width, height = _unpack('<ii', blob, 18)
+    x_ppm, y_ppm = _unpack('<ii', blob, 38)
+    dpi = None
+    if x_ppm > 0 and y_ppm > 0:
+        dpi = (x_ppm * 0.0254, y_ppm * 0.0254)
+    return 'BMP', (width, abs(height)), dpi
+
+
+def _probe_gif(blob):
+    """
+    Return the properties of the GIF image in *blob*.
+    """
+    width, height = _unpack('<HH', blob, 6)
+    return 'GIF', (width, height), None
+
+
+def _probe_jpeg(blob):
+    """
+    Return the properties of the JPEG image in *blob*. Its resolution is
+    taken from its JFIF header, or failing that its EXIF header.
+    """
+    jfif_dpi = exif_dpi = None
+    offset = 2
+    while True:
+        # any number of 0xFF fill bytes may come before a marker code
+        while bytes(blob[offset:offset+1]) == b'\xFF':
+            offset += 1
+        marker = _unpack('B', blob, offset)
+        offset += 1
+        if marker in _jpeg_standalone_markers:
+            continue
+        length = _unpack('>H', blob, offset)
+        if marker in _jpeg_sof_markers:
+            height, width = _unpack('>HH', blob, offset+3)
+            return 'JPEG', (width, height), jfif_dpi or exif_dpi
+        if marker == 0xE0 and bytes(blob[offset+2:offset+7]) == b'JFIF\x00':
+            units, x_density, y_density = _unpack('>BHH', blob, offset+9)
+            jfif_dpi = _dpi(x_density, y_density, units)
+        elif (marker == 0xE1 and
+                bytes(blob[offset+2:offset+8]) == b'Exif\x00\x00'):
+            exif_dpi = _tiff_dpi(_tiff_tags(blob, offset+8))
+        elif marker == 0xDA:  # start of scan without a frame header
+            raise ValueError('no JPEG frame header')
+        offset += length
+
+
+def _probe_png(blob):
+    """
+    Return the properties of the PNG image in *blob*. Its resolution is
+    taken from its ``pHYs`` chunk, if it has one before the image data.
+    """
+    width, height = _unpack('>II', blob, 16)
+    dpi = None
+    offset = 8
+    while True:
+        length, chunk_type = _unpack('>I4s', blob, offset)
+        if chunk_type in (b'IDAT', b'IEND'):
+            break
+        if chunk_type == b'pHYs':
+            x_ppu, y_ppu, unit = _unpack('>IIB', blob, offset+8)
+            if unit == 1:
+                dpi = (x_ppu * 0.0254, y_ppu * 0.0254)
+            break
+        offset += length + 12
+    return 'PNG', (width, height), dpi
+
+
+def _probe_tiff(blob):
+    """
+    Return the properties of the TIFF image in *blob*.
+    """
+    tags = _tiff_tags(blob, 0)
+    return 'TIFF', (tags[256], tags[257]), _tiff_dpi(tags)
+
+
+def _dpi(x_density, y_density, units):
+    """
+    Return a `(horz_dpi, vert_dpi)` 2-tuple for a resolution of *x_density*
+    by *y_density* dots per inch when *units* is 1 or per centimeter when
+    it is 2, or |None| for any other *units*, which specifies no resolution.
+    """
+    if not x_density or not y_density:
+        return None
+    if units == 1:
+        return (float(x_density), float(y_density))
+    if units == 2:
+        return (x_density * 2.54, y_density * 2.54)
+    return None
+
+
+def _tiff_dpi(tags):
+    """
+    Return the resolution specified by the TIFF *tags*, a dict like that
+    returned by :func:`_tiff_tags`, or |None| if there isn't one.
+    """
+    if 282 not in tags or 283 not in tags:
+        return None
+    # TIFF resolution unit, 1: none, 2: inch (default), 3: centimeter
+    units = {2: 1, 3: 2}.get(tags.get(296, 2))
+    return _dpi(tags[282], tags[283], units)
+
+
+def _tiff_tags(blob, base):
+    """
+    Return a dict mapping tag to value for the SHORT, LONG and RATIONAL
+    tags of the first image file directory of the TIFF structure starting
+    at offset *base* in *blob*, as found in a TIFF file or a JPEG EXIF
+    header. A RATIONAL value is converted to a float.
+    """
+    byte_order = {b'II': '<', b'MM': '>'}[bytes(blob[base:base+2])]
+    ifd_offset = _unpack(byte_order + 'I', blob, base+4)
+    entry_count = _unpack(byte_order + 'H', blob, base+ifd_offset)
+    tags = {}
+    for idx in range(entry_count):
+        entry_offset = base + ifd_offset + 2 + idx*12
+        tag, field_type = _unpack(byte_order + 'HH', blob, entry_offset)
+        if field_type == 3:  # SHORT
+            tags[tag] = _unpack(byte_order + 'H', blob, entry_offset+8)
+        elif field_type == 4:  # LONG
+            tags[tag] = _unpack(byte_order + 'I', blob, entry_offset+8)
+        elif field_type == 5:  # RATIONAL, stored at an offset
+            value_offset = _unpack(byte_order + 'I', blob, entry_offset+8)
+            numerator, denominator = _unpack(
+                byte_order + 'II', blob, base+value_offset
+            )
+            if denominator:
+                tags[tag] = numerator / denominator
+    return tags
+
+
+def _unpack(fmt, blob, offset):
+    """
+    Return the value unpacked from *blob* at *offset* according to struct
+    format *fmt*, or a tuple of values when *fmt* describes more than one.
+    """
+    values = struct.unpack_from(fmt, blob, offset)
+    return values[0] if len(values) == 1 else values
+
+
+_jpeg_sof_markers = frozenset((
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE,
+    0xCF
+))
+
+_jpeg_standalone_markers = frozenset(
+    (0x01, 0xD8) + tuple(range(0xD0, 0xD8))
+)
+
+_probes = (
+    (b'\x89PNG\r\n\x1a\n', _probe_png),
+    (b'\xFF\xD8',          _probe_jpeg),
+    (b'GIF87a',            _probe_gif),
+    (b'GIF89a',            _probe_gif),
+    (b'BM',                _probe_bmp),
+    (b'II*\x00',           _probe_tiff),
+    (b'MM\x00*',           _probe_tiff),
+)
@@ -0,0 +1,119 @@
+# encoding: utf-8
+
+"""
+Sources a part's contents can be read from a chunk at a time, so a large
+part such as an embedded video need not be held in memory. A part created
+with one of these as its blob is streamed into the package when it's saved.
+"""
+
+from __future__ import absolute_import
+
+import os
+
+from zipfile import ZipFile
+
+
+#: Size in bytes of each chunk read from a file or zip member.
+CHUNK_SIZE = 1024 * 1024
+
+
+class BlobSource(object):
+    """
+    Base class for a source of the contents of a part, read a chunk at
+    a time when they are needed rather than held in memory.
+    """
+    # a blob source has no zip member to copy as-is; these let it stand in
+    # for the source of a lazily loaded part
+    source_member = None
+    source_zipinfo = None
+
+    @property
+    def blob(self):
+        """
+        The whole contents of this source as bytes, read into memory. Only
+        read when something needs all of them at once.
+        """
+        return b''.join(self.iter_chunks())
+
+    def iter_chunks(self):
+        """
+        Generate the contents of this source as a sequence of bytes chunks.
+        """
+        raise NotImplementedError('Must be implemented by all subclasses.')
+
+    @property
+    def size(self):
+        """
+        Size in bytes of the contents of this source, or |None| if it is not
+        known before they are read.
+        """
+        return None
+
+
+class FileBlobSource(BlobSource):
+    """
+    Contents of the file at *path*, read each time they are needed.
+    """
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        super(FileBlobSource, self).__init__()
+        self._path = path
+        self._chunk_size = chunk_size
+
+    def iter_chunks(self):
+        with open(self._path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self._chunk_size), b''):
+                yield chunk
+
+    @property
+    def size(self):
+        return os.path.getsize(self._path)
+
+
+class ZipMemberBlobSource(BlobSource):
+    """
+    Contents of the member named *membername* of the zip archive
+    *zip_file*, a path or a seekable file-like object, decompressed a chunk
+    at a time each time they are needed.
+    """
+    def __init__(self, zip_file, membername, chunk_size=CHUNK_SIZE):
+        super(ZipMemberBlobSource, self).__init__()
+        self._zip_file = zip_file
+        self._membername = membername
+        self._chunk_size = chunk_size
+
+    def iter_chunks(self):
+        with ZipFile(self._zip_file) as zipf:
+            with zipf.open(self._membername) as f:
+                for chunk in iter(lambda: f.read(self._chunk_size), b''):
+                    yield chunk
+
+    @property
+    def size(self):
+        with ZipFile(self._zip_file) as zipf:
+            return zipf.getinfo(self._membername).file_size
+
+
+class IterBlobSource(BlobSource):
+    """
+    Contents generated by *chunks*, an iterable of bytes chunks, of *size*
+    bytes if known. When *chunks* is an iterator rather than a collection it
+    can only be read once, so a part using it can only be saved once, and
+    |ValueError| is raised when it is read again.
+    """
+    def __init__(self, chunks, size=None):
+        super(IterBlobSource, self).__init__()
+        self._chunks = chunks
+        self._size = size
+        self._is_iterator = iter(chunks) is chunks
+        self._consumed = False
+
+    def iter_chunks(self):
+        if self._consumed:
+            raise ValueError('chunk iterator was already read')
+        self._consumed = self._is_iterator
+        for chunk in self._chunks:
+            yield chunk
+
+    @property
+    def size(self):
+        return self._size
@@ -7,8 +7,13 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+import os
+import re
+
+from pptx.compat import is_string
 from pptx.util import lazyproperty
 
+from .blobsource import BlobSource
 from .constants import RELATIONSHIP_TYPE as RT
 from .oxml import CT_Relationships, serialize_part_xml
 from ..oxml import parse_xml
@@ -25,6 +30,13 @@ class OpcPackage(object):
     """
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._source_pkg_file = None
+        self._partname_index = None
+        self._parts_cache = None
+        self._rels_cache = None
+        self._rels_generation = 0
+        self._rels_removals = 0
+        self._part_refs = None
 
     def after_unmarshal(self):
         """
@@ -38,45 +50,26 @@ class OpcPackage(object):
     def iter_parts(self):
         """
         Generate exactly one reference to each of the parts in the package by
-        performing a depth-first traversal of the rels graph.
+        performing a depth-first traversal of the rels graph. The parts
+        found are cached until a relationship of this package is added or
+        removed.
         """
-        def walk_parts(source, visited=list()):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
-            yield part
+        generation = self._rels_generation
+        if self._parts_cache is None or self._parts_cache[0] != generation:
+            self._parts_cache = (generation, list(self._walk_parts()))
+        return iter(self._parts_cache[1])
 
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
-        performing a depth-first traversal of the rels graph.
+        performing a depth-first traversal of the rels graph. The
+        relationships found are cached until a relationship of this package
+        is added or removed.
         """
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
-                yield rel
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
-            yield rel
+        generation = self._rels_generation
+        if self._rels_cache is None or self._rels_cache[0] != generation:
+            self._rels_cache = (generation, list(self._walk_rels()))
+        return iter(self._rels_cache[1])
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
@@ -104,24 +97,37 @@ class OpcPackage(object):
         Return a |PackURI| instance representing the next available partname
         matching *tmpl*, which is a printf (%)-style template string
         containing a single replacement item, a '%d' to be used to insert the
-        integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
+        integer portion of the partname. Example: '/ppt/slides/slide%d.xml'.
+        A number is taken when any partname uses it with the same prefix,
+        whatever its extension. The partnames in use are indexed on the
+        first call, and the index is kept up to date as parts are added,
+        renamed and dropped, so each call takes constant time until
+        :attr:`rels_removals` advances.
         """
-        partnames = [part.partname for part in self.iter_parts()]
-        for n in range(1, len(partnames)+2):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception('ProgrammingError: ran out of candidate_partnames')
+        prefix = tmpl.split('%d')[0]
+        return PackURI(tmpl % self._partnames.next_available_idx(prefix))
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False, use_mmap=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        *pkg_file*. If *lazy* is |True|, the part graph is built from the
+        relationship items and content types alone and the contents of each
+        part are read (and parsed, for an XML part) only when first accessed.
+        If *use_mmap* is |True| and *pkg_file* is a path, the file is
+        memory-mapped and the blob of a stored member is a `memoryview` of
+        the mapping rather than a copy. In either case *pkg_file* remains in
+        use for the lifetime of the package and must not be changed or
+        overwritten during that time. Otherwise the whole package is read at
+        once, but each XML part in a zip package is kept still compressed
+        and parsed only when first accessed, so it's copied unchanged on
+        save when it hasn't been changed.
+        """
+        pkg_reader = PackageReader.from_file(pkg_file, lazy, use_mmap)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if lazy or use_mmap:
+            package._source_pkg_file = pkg_file
         return package
 
     def part_related_by(self, reltype):
@@ -154,16 +160,260 @@ class OpcPackage(object):
         Return a reference to the |RelationshipCollection| holding the
         relationships for this package.
         """
-        return RelationshipCollection(PACKAGE_URI.baseURI)
+        return RelationshipCollection(PACKAGE_URI.baseURI, self)
 
-    def save(self, pkg_file):
+    @property
+    def rels_generation(self):
         """
-        Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        Integer identifying the state of the relationship graph of this
+        package, changed each time a relationship is added to or removed
+        from the package or one of its parts.
         """
+        return self._rels_generation
+
+    @property
+    def rels_removals(self):
+        """
+        Integer count of the relationships removed from this package or its
+        parts whose target part has relationships of its own, after which
+        parts other than that target may have left the package. A removed
+        relationship to a part without relationships, like an image, is not
+        counted. The package instead checks whether that part is still
+        referenced and calls :meth:`_part_dropped` when it is not.
+        """
+        return self._rels_removals
+
+    def save(self, pkg_file, compression=None, workers=None, append=False):
+        """
+        Save this package to *pkg_file*, where *file* can be either a path to
+        a file (a string) or a file-like object. If *compression* is not
+        |None|, it is the deflate level (0-9) used for each member, and
+        members having an already-compressed content type are stored rather
+        than deflated. If *workers* is not |None|, parts are serialized and
+        compressed by a pool of that many threads. Raises |ValueError| if
+        *pkg_file* is the file a lazy or memory-mapped package was opened
+        from, since part contents still read from it would be lost when it
+        is overwritten.
+
+        If *append* is |True|, *pkg_file* must instead be the path of the zip
+        file this package was opened from with *lazy* or *use_mmap*, and that
+        file is updated in place by appending only the parts and rels items
+        that have changed. Raises |ValueError| if it is any other file. Only
+        parts loaded lazily and XML parts kept still compressed can be
+        recognized as unchanged. *workers* has no effect on an append
+        save.
+        """
+        if append:
+            if not (is_string(pkg_file) and
+                    self._is_source_pkg_file(pkg_file)):
+                raise ValueError(
+                    'append save requires the path of the file the package '
+                    'was opened from with lazy or use_mmap'
+                )
+        elif self._is_source_pkg_file(pkg_file):
+            raise ValueError(
+                'cannot save over the file a package is still reading from'
+            )
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        if append:
+            PackageWriter.append(pkg_file, self.rels, self.parts, compression)
+            return
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, compression, workers
+        )
+
+    @staticmethod
+    def compact(pkg_file):
+        """
+        Rewrite the zip package at path *pkg_file* without the superseded
+        members an append save leaves behind as dead space. Live members are
+        copied without being recompressed.
+        """
+        PackageWriter.compact(pkg_file)
+
+    def _is_source_pkg_file(self, pkg_file):
+        """
+        Return |True| if *pkg_file* refers to the file or stream this package
+        still reads part contents from, |False| otherwise.
+        """
+        source_pkg_file = self._source_pkg_file
+        if source_pkg_file is None:
+            return False
+        if is_string(source_pkg_file) and is_string(pkg_file):
+            return (
+                os.path.realpath(source_pkg_file) ==
+                os.path.realpath(pkg_file)
+            )
+        return pkg_file is source_pkg_file
+
+    def _partname_changed(self, old_partname, new_partname):
+        """
+        Called by a part of this package when it is created with
+        *new_partname* (*old_partname* is then |None|) or renamed from
+        *old_partname* to *new_partname*, to keep the index of partnames in
+        use up to date.
+        """
+        if self._partname_index is None:
+            return
+        index = self._partname_index[1]
+        if old_partname is not None:
+            index.remove(old_partname)
+        index.add(new_partname)
+
+    def _part_dropped(self, part):
+        """
+        Called when the last relationship to *part*, a part without
+        relationships of its own, has been removed, so it is no longer in
+        this package. Releases the partname of *part* in the index of
+        partnames in use. May be extended by subclasses.
+        """
+        index = self._partname_index
+        if index is not None and index[0] == self._rels_removals:
+            index[1].remove(part.partname)
+
+    def _part_restored(self, part):
+        """
+        Called when a relationship to *part* is added after
+        :meth:`_part_dropped` was called for it, so it is again in this
+        package. Takes the partname of *part* again in the index of
+        partnames in use. May be extended by subclasses.
+        """
+        index = self._partname_index
+        if index is not None and index[0] == self._rels_removals:
+            index[1].add(part.partname)
+
+    def _part_referenced(self, rel):
+        """
+        Record internal relationship *rel*, just added, as referring to its
+        target part. A target part not yet recorded brings the relationships
+        of the parts only it reaches, which are recorded along with it, so
+        a dropped part referred to again through any of them is restored.
+        """
+        part_refs = self._part_refs
+        if part_refs is None or part_refs[0] != self._rels_removals:
+            return
+        refs = part_refs[1]
+        rels_stack = [iter((rel,))]
+        while rels_stack:
+            for rel in rels_stack[-1]:
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                rels = refs.get(part)
+                if rels is None:
+                    rels = refs[part] = set()
+                    rels_stack.append(iter(part.rels.values()))
+                elif not rels:
+                    self._part_restored(part)
+                rels.add(rel)
+                break
+            else:
+                rels_stack.pop()
+
+    def _part_unreferenced(self, rel):
+        """
+        Account for the removal of internal relationship *rel*. Removing
+        a relationship to a part having relationships of its own advances
+        :attr:`rels_removals`. Otherwise only the target part can have left
+        the package, which it has when no other relationship in the package
+        refers to it. The relationships referring to each part are recorded
+        from a traversal of the graph the first time this is needed after
+        :attr:`rels_removals` advances, so this takes constant time until
+        then.
+        """
+        part = rel.target_part
+        if part.rels:
+            self._rels_removals += 1
+            return
+        part_refs = self._part_refs
+        if part_refs is None or part_refs[0] != self._rels_removals:
+            refs = {}
+            for graph_rel in self.iter_rels():
+                if not graph_rel.is_external:
+                    refs.setdefault(graph_rel.target_part, set()).add(
+                        graph_rel
+                    )
+            self._part_refs = (self._rels_removals, refs)
+            rels = refs.setdefault(part, set())
+        else:
+            rels = part_refs[1].get(part)
+            if not rels or rel not in rels:
+                return
+            rels.remove(rel)
+        if not rels:
+            self._part_dropped(part)
+
+    def _rels_changed(self, added, removed):
+        """
+        Called by a relationship collection of this package when relationship
+        *added* is added to it or *removed* is removed from it, or both when
+        one replaces the other. Either may be |None|.
+        """
+        self._rels_generation += 1
+        if added is not None and not added.is_external:
+            self._part_referenced(added)
+        if removed is not None and not removed.is_external:
+            self._part_unreferenced(removed)
+
+    @property
+    def _partnames(self):
+        """
+        |_PartnameIndex| object for the partnames of the parts in this
+        package. It is built from a traversal of the relationship graph and
+        built again after :attr:`rels_removals` advances, since parts may
+        then have left the package.
+        """
+        removals = self._rels_removals
+        index = self._partname_index
+        if index is None or index[0] != removals:
+            self._partname_index = index = (removals, _PartnameIndex(
+                part.partname for part in self.iter_parts()
+            ))
+        return index[1]
+
+    def _walk_parts(self):
+        """
+        Generate each part reachable from this package, depth-first in the
+        order of the relationships of each source, visiting each part once.
+        """
+        visited = set()
+        rels_stack = [iter(self.rels.values())]
+        while rels_stack:
+            for rel in rels_stack[-1]:
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                if id(part) in visited:
+                    continue
+                visited.add(id(part))
+                yield part
+                rels_stack.append(iter(part.rels.values()))
+                break
+            else:
+                rels_stack.pop()
+
+    def _walk_rels(self):
+        """
+        Generate each relationship reachable from this package, depth-first
+        in the order of the relationships of each source, visiting the
+        relationships of each part once.
+        """
+        visited = set()
+        rels_stack = [iter(self.rels.values())]
+        while rels_stack:
+            for rel in rels_stack[-1]:
+                yield rel
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                if id(part) in visited:
+                    continue
+                visited.add(id(part))
+                rels_stack.append(iter(part.rels.values()))
+                break
+            else:
+                rels_stack.pop()
 
 
 class Part(object):
@@ -178,6 +428,11 @@ class Part(object):
         self._content_type = content_type
         self._blob = blob
         self._package = package
+        self._blob_source = None
+        if isinstance(blob, BlobSource):
+            self._blob, self._blob_source = None, blob
+        if package is not None:
+            package._partname_changed(None, partname)
 
     # load/save interface to OpcPackage ------------------------------
 
@@ -206,8 +461,14 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
-        """
+        to return load blob, reading it from the blob source on first access
+        when this part was loaded lazily. The contents of a part streamed
+        from a |BlobSource| are read each time and not kept.
+        """
+        if self._blob is None and self._blob_source is not None:
+            if self.blob_stream is not None:
+                return self._blob_source.blob
+            self._blob = self._blob_source.blob
         return self._blob
 
     @blob.setter
@@ -216,8 +477,49 @@ class Part(object):
         Note that not all subclasses use the part blob as their blob source.
         In particular, the |XmlPart| subclass uses its `self._element` to
         serialize a blob on demand. This works find for binary parts though.
+        *bytes_* can also be a |BlobSource| object, such as
+        a |FileBlobSource|, which the contents of this part are then read
+        from a chunk at a time, including when it is saved.
         """
+        if isinstance(bytes_, BlobSource):
+            self._blob, self._blob_source = None, bytes_
+            return
         self._blob = bytes_
+        self._blob_source = None
+
+    @property
+    def blob_stream(self):
+        """
+        The |BlobSource| object the contents of this part are streamed from
+        on save, or |None| if they are written from memory.
+        """
+        if isinstance(self._blob_source, BlobSource):
+            return self._blob_source
+        return None
+
+    @property
+    def source_member(self):
+        """
+        The `(zipinfo, raw_chunks)` 2-tuple for the still-compressed zip
+        member this part was lazily loaded from, or |None| if this part was
+        not loaded lazily or has been changed since. Used on save to copy an
+        unchanged part into the new package without recompressing it.
+        """
+        if self._blob_source is None or not self._is_unchanged:
+            return None
+        return self._blob_source.source_member
+
+    @property
+    def source_zipinfo(self):
+        """
+        The |ZipInfo| object describing the zip member this part was loaded
+        from, or |None| if this part was neither loaded lazily nor kept
+        still compressed, or has been changed since. Used on an append save
+        to leave an unchanged part where it already is in the package.
+        """
+        if self._blob_source is None or not self._is_unchanged:
+            return None
+        return self._blob_source.source_zipinfo
 
     @property
     def content_type(self):
@@ -230,6 +532,18 @@ class Part(object):
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    @classmethod
+    def load_lazy(cls, partname, content_type, blob_source, package):
+        """
+        Return a new instance of this part class whose contents are read from
+        *blob_source* the first time they are needed. *blob_source* is an
+        object having a `blob` property, such as the |_SerializedPart|
+        object for this part in a lazily opened package.
+        """
+        part = cls(partname, content_type, None, package)
+        part._blob_source = blob_source
+        return part
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -261,7 +575,9 @@ class Part(object):
         if not isinstance(partname, PackURI):
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
-        self._partname = partname
+        old_partname, self._partname = self._partname, partname
+        if self._package is not None:
+            self._package._partname_changed(old_partname, partname)
 
     # relationship management interface for child objects ------------
 
@@ -309,7 +625,7 @@ class Part(object):
         |RelationshipCollection| instance holding the relationships for this
         part.
         """
-        return RelationshipCollection(self._partname.baseURI)
+        return RelationshipCollection(self._partname.baseURI, self._package)
 
     def target_ref(self, rId):
         """
@@ -327,6 +643,14 @@ class Part(object):
         rIds = self._element.xpath('//@r:id')
         return len([_rId for _rId in rIds if _rId == rId])
 
+    @property
+    def _is_unchanged(self):
+        """
+        |True| if this part was lazily loaded and its blob has not been
+        replaced since, |False| otherwise.
+        """
+        return self._blob_source is not None
+
 
 class XmlPart(Part):
     """
@@ -334,15 +658,31 @@ class XmlPart(Part):
     them. Provides additional methods to the |Part| base class that take care
     of parsing and reserializing the XML payload and managing relationships
     to other parts.
+
+    A part read from a zip package, whether lazily or not, is saved from
+    the bytes it was read from while the generation of its XML is
+    unchanged. Only changes made through the
+    oxml element methods are counted; code that changes the XML with an
+    lxml function instead, such as ``etree.SubElement()``, or through the
+    ``attrib`` mapping of an element, must call ``_mark_changed()`` on an
+    element of the tree afterward.
     """
     def __init__(self, partname, content_type, element, package=None):
         super(XmlPart, self).__init__(
             partname, content_type, package=package
         )
+        self._loaded_generation = None
         self._element = element
 
     @property
     def blob(self):
+        """
+        XML of this part serialized as bytes. When this part was read from
+        a package and its XML has not been changed since, the bytes it was
+        read from are returned instead, avoiding the cost of serializing it.
+        """
+        if self._is_unchanged:
+            return self._blob_source.blob
         return serialize_part_xml(self._element)
 
     @classmethod
@@ -359,6 +699,38 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def _element(self):
+        """
+        Root element of the XML of this part, parsed from the blob source on
+        first access when this part was loaded with one, as a part read from
+        a zip package or opened lazily is.
+        """
+        if self._elm is None and self._blob_source is not None:
+            self._elm = parse_xml(self._blob_source.blob)
+            self._loaded_generation = self._elm.generation
+        return self._elm
+
+    @_element.setter
+    def _element(self, element):
+        self._elm = element
+        self._blob_source = None
+
+    @property
+    def _is_unchanged(self):
+        """
+        |True| if this part was loaded with a blob source and its XML has
+        not been changed since, as indicated by the generation of its
+        element tree. |False| for a part newly created, given a new element
+        or read eagerly from an expanded package directory, none of which
+        keeps the bytes it was read from.
+        """
+        if self._blob_source is None:
+            return False
+        if self._elm is None:
+            return True
+        return self._elm.generation == self._loaded_generation
+
 
 class PartFactory(object):
     """
@@ -372,6 +744,17 @@ class PartFactory(object):
         PartClass = cls._part_cls_for(content_type)
         return PartClass.load(partname, content_type, blob, package)
 
+    @classmethod
+    def load_lazy(cls, partname, content_type, blob_source, package):
+        """
+        Return a part of the class registered for *content_type* whose
+        contents are read from *blob_source* only when first needed.
+        """
+        PartClass = cls._part_cls_for(content_type)
+        return PartClass.load_lazy(
+            partname, content_type, blob_source, package
+        )
+
     @classmethod
     def _part_cls_for(cls, content_type):
         """
@@ -387,12 +770,29 @@ class PartFactory(object):
 class RelationshipCollection(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+    Each change advances the generation of the collection, which callers
+    caching what they found in it compare to tell when it may have changed,
+    and is reported to *package*, the package the collection belongs to,
+    when there is one.
     """
-    def __init__(self, baseURI):
+    def __init__(self, baseURI, package=None):
         super(RelationshipCollection, self).__init__()
         self._baseURI = baseURI
+        self._package = package
+        self._generation = 0
         self._target_parts_by_rId = {}
 
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        self._changed(removed=rel)
+
+    def __setitem__(self, rId, rel):
+        old_rel = self.get(rId)
+        super(RelationshipCollection, self).__setitem__(rId, rel)
+        self._changed(added=rel, removed=old_rel)
+
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
         Return a newly added |_Relationship| instance.
@@ -403,6 +803,40 @@ class RelationshipCollection(dict):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def add_relationships(self, reltype, target_parts):
+        """
+        Return a list of newly added |_Relationship| instances of *reltype*,
+        one to each part in *target_parts*, in that order. Their rIds are
+        allocated in a single pass, filling any gaps in numbering like
+        :meth:`get_or_add`, rather than by searching the collection for each
+        one. No existing relationship is reused, so each target part should
+        not already be related by this collection.
+        """
+        rels, n = [], 0
+        for target_part in target_parts:
+            n += 1
+            while 'rId%d' % n in self:
+                n += 1
+            rels.append(
+                self.add_relationship(reltype, target_part, 'rId%d' % n)
+            )
+        return rels
+
+    def clear(self):
+        rels = list(self.values())
+        super(RelationshipCollection, self).clear()
+        self._target_parts_by_rId.clear()
+        for rel in rels:
+            self._changed(removed=rel)
+
+    @property
+    def generation(self):
+        """
+        Integer identifying the state of this relationship collection,
+        changed each time a relationship is added to or removed from it.
+        """
+        return self._generation
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -427,6 +861,14 @@ class RelationshipCollection(dict):
             )
         return rel.rId
 
+    def pop(self, rId, *default):
+        if rId not in self:
+            return super(RelationshipCollection, self).pop(rId, *default)
+        rel = super(RelationshipCollection, self).pop(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        self._changed(removed=rel)
+        return rel
+
     def part_with_reltype(self, reltype):
         """
         Return target part of rel with matching *reltype*, raising |KeyError|
@@ -457,6 +899,29 @@ class RelationshipCollection(dict):
             )
         return rels_elm.xml
 
+    def retarget(self, rId, target_part):
+        """
+        Make the internal relationship identified by *rId* refer to
+        *target_part* instead, keeping its rId and relationship type. This
+        is reported to the package as the removal of the old relationship,
+        since the part it referred to may then have left the graph, and the
+        addition of the new one.
+        """
+        rel = self[rId]
+        new_rel = _Relationship(rId, rel.reltype, target_part, self._baseURI)
+        super(RelationshipCollection, self).__setitem__(rId, new_rel)
+        self._target_parts_by_rId[rId] = target_part
+        self._changed(added=new_rel, removed=rel)
+
+    def _changed(self, added=None, removed=None):
+        """
+        Advance the generation of this collection and report relationship
+        *added* and *removed* to the package of this collection.
+        """
+        self._generation += 1
+        if self._package is not None:
+            self._package._rels_changed(added, removed)
+
     def _get_matching(self, reltype, target, is_external=False):
         """
         Return relationship of matching *reltype*, *target*, and
@@ -529,9 +994,15 @@ class Unmarshaller(object):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
-        *pkg_reader* is constructed using *part_factory*.
+        *pkg_reader* is constructed using *part_factory*, with its
+        `load_lazy()` method for a part whose blob is read only when first
+        needed.
         """
         parts = {}
+        for partname, content_type, spart in pkg_reader.iter_lazy_sparts():
+            parts[partname] = part_factory.load_lazy(
+                partname, content_type, spart, package
+            )
         for partname, content_type, blob in pkg_reader.iter_sparts():
             parts[partname] = part_factory(
                 partname, content_type, blob, package
@@ -552,6 +1023,80 @@ class Unmarshaller(object):
             source.load_rel(srel.reltype, target, srel.rId, srel.is_external)
 
 
+class _PartnameIndex(object):
+    """
+    Index of the numbers used by numbered partnames like
+    ``'/ppt/slides/slide3.xml'``, by the prefix preceding the number
+    (``'/ppt/slides/slide'``). A number is used for a prefix when any
+    partname has it, whatever the extension of that partname. Intended to
+    be kept up to date as parts are added and renamed, so the lowest unused
+    number can be found without looking at each part.
+    """
+    _numbered_partname_re = re.compile(r'^(.*[^0-9])([1-9][0-9]*)(\.[^./]*)$')
+
+    def __init__(self, partnames):
+        super(_PartnameIndex, self).__init__()
+        self._counts = {}
+        self._lowest_free = {}
+        for partname in partnames:
+            self.add(partname)
+
+    def add(self, partname):
+        """
+        Record the number of *partname*, if it has one, as used.
+        """
+        prefix, idx = self._split(partname)
+        if prefix is None:
+            return
+        counts = self._counts.setdefault(prefix, {})
+        counts[idx] = counts.get(idx, 0) + 1
+
+    def next_available_idx(self, prefix):
+        """
+        Return the lowest number not used by a partname starting with
+        *prefix*. Takes constant time on average, since the numbers below
+        the lowest found unused at the last call are only looked at again
+        when one of them is released.
+        """
+        counts = self._counts.get(prefix, {})
+        idx = self._lowest_free.get(prefix, 1)
+        while idx in counts:
+            idx += 1
+        self._lowest_free[prefix] = idx
+        return idx
+
+    def remove(self, partname):
+        """
+        Release the number of *partname*, if it has one, unless another
+        partname with the same prefix still uses it.
+        """
+        prefix, idx = self._split(partname)
+        if prefix is None:
+            return
+        counts = self._counts.get(prefix, {})
+        count = counts.pop(idx, 0)
+        if count > 1:
+            counts[idx] = count - 1
+        elif idx < self._lowest_free.get(prefix, 1):
+            self._lowest_free[prefix] = idx
+
+    @classmethod
+    def _split(cls, partname):
+        """
+        Return a `(prefix, idx)` 2-tuple for *partname*, where *idx* is the
+        integer number in its filename, e.g. ``('/ppt/slides/slide', 3)``
+        for ``'/ppt/slides/slide3.xml'``. The number is the one just before
+        the extension, so digits in the extension, like those of
+        ``'/ppt/media/media1.mp4'``, are not taken for it. Returns `(None,
+        None)` for a partname without such a number, like
+        ``'/ppt/presentation.xml'``.
+        """
+        match = cls._numbered_partname_re.match(partname)
+        if match is None:
+            return None, None
+        return match.group(1), int(match.group(2))
+
+
 class _Relationship(object):
     """
     Value object for relationship to part.
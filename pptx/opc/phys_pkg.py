@@ -6,27 +6,45 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import copy
+import mmap
 import os
+import struct
+import sys
+import threading
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import (
+    BadZipfile, ZipFile, ZipInfo, is_zipfile, sizeFileHeader,
+    stringFileHeader, structFileHeader, ZIP_DEFLATED, ZIP_STORED,
+    _FH_EXTRA_FIELD_LENGTH, _FH_FILENAME_LENGTH, _FH_SIGNATURE
+)
 
-from ..compat import is_string
+from ..compat import is_integer, is_string
 from ..exceptions import PackageNotFoundError
 
-from .packuri import CONTENT_TYPES_URI
+from .blobsource import CHUNK_SIZE
+from .packuri import CONTENT_TYPES_URI, PackURI
+from .spec import precompressed_content_types
 
 
 class PhysPkgReader(object):
     """
-    Factory for physical package reader objects.
+    Factory for physical package reader objects. If *use_mmap* is |True|
+    and *pkg_file* is the path of a zip file, the file is memory-mapped
+    rather than read through buffered file I/O.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, use_mmap=False):
+        # a reader class constructed directly gets no say from the factory
+        if cls is not PhysPkgReader:
+            return super(PhysPkgReader, cls).__new__(cls)
         # if *pkg_file* is a string, treat it as a path
         if is_string(pkg_file):
             if os.path.isdir(pkg_file):
                 reader_cls = _DirPkgReader
             elif is_zipfile(pkg_file):
-                reader_cls = _ZipPkgReader
+                reader_cls = _MmapZipPkgReader if use_mmap else _ZipPkgReader
             else:
                 raise PackageNotFoundError(
                     "Package not found at '%s'" % pkg_file
@@ -41,7 +59,7 @@ class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, compression=None, append=False):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -50,9 +68,11 @@ class _DirPkgReader(PhysPkgReader):
     Implements |PhysPkgReader| interface for an OPC package extracted into a
     directory.
     """
-    def __init__(self, path):
+    def __init__(self, path, use_mmap=False):
         """
         *path* is the path to a directory containing an expanded package.
+        *use_mmap* is accepted for interface consistency with the zip
+        readers and has no effect.
         """
         super(_DirPkgReader, self).__init__()
         self._path = os.path.abspath(path)
@@ -81,6 +101,13 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def raw_member_for(self, pack_uri):
+        """
+        Return None; the files of an expanded package have no compressed
+        form that could be copied into a zip package unchanged.
+        """
+        return None
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -92,14 +119,23 @@ class _DirPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def zipinfo_for(self, pack_uri):
+        """
+        Return None; the files of an expanded package are not zip members.
+        """
+        return None
+
 
 class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, use_mmap=False):
         super(_ZipPkgReader, self).__init__()
         self._zipf = ZipFile(pkg_file, 'r')
+        # the archive's own lock where it has one, so reading a raw member
+        # doesn't disturb a member being read through the zip file
+        self._lock = getattr(self._zipf, '_lock', None) or threading.RLock()
 
     def blob_for(self, pack_uri):
         """
@@ -121,6 +157,42 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def raw_member_for(self, pack_uri):
+        """
+        Return a `(zipinfo, raw_chunks)` 2-tuple for the zip member
+        corresponding to *pack_uri*, where *raw_chunks* generates the member
+        data exactly as stored in the archive, compressed and without its
+        local file header, in chunks of at most |CHUNK_SIZE| bytes. Each
+        chunk is read from the archive as it is generated, so the archive
+        must not be closed before then. Raises |KeyError| if no matching
+        member is present.
+        """
+        zipinfo = self._zipf.getinfo(pack_uri.membername)
+        with self._lock:
+            fp = self._zipf.fp
+            fp.seek(zipinfo.header_offset)
+            fheader = struct.unpack(
+                structFileHeader, fp.read(sizeFileHeader)
+            )
+            if fheader[_FH_SIGNATURE] != stringFileHeader:
+                raise BadZipfile(
+                    "bad local file header for '%s'" % pack_uri.membername
+                )
+            start = (
+                zipinfo.header_offset + sizeFileHeader +
+                fheader[_FH_FILENAME_LENGTH] + fheader[_FH_EXTRA_FIELD_LENGTH]
+            )
+        return zipinfo, self._iter_raw_chunks(start, zipinfo.compress_size)
+
+    def iter_raw_members(self):
+        """
+        Generate a `(zipinfo, raw_chunks)` 2-tuple like that returned by
+        :meth:`raw_member_for` for each member of the archive, in the order
+        of its central directory.
+        """
+        for zipinfo in self._zipf.infolist():
+            yield self.raw_member_for(PackURI('/%s' % zipinfo.filename))
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -132,14 +204,159 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def zipinfo_for(self, pack_uri):
+        """
+        Return the |ZipInfo| object describing the zip member corresponding
+        to *pack_uri*. Raises |KeyError| if no matching member is present.
+        """
+        return self._zipf.getinfo(pack_uri.membername)
+
+    def _iter_raw_chunks(self, start, size):
+        """
+        Generate the *size* bytes of the archive starting at offset *start*
+        in chunks of at most |CHUNK_SIZE| bytes. The file position is set
+        again for each chunk, since the archive may be read elsewhere
+        between chunks.
+        """
+        end = start + size
+        while start < end:
+            with self._lock:
+                fp = self._zipf.fp
+                fp.seek(start)
+                chunk = fp.read(min(CHUNK_SIZE, end - start))
+            if not chunk:
+                raise BadZipfile('zip member data is truncated')
+            start += len(chunk)
+            yield chunk
+
+
+class _MmapZipPkgReader(_ZipPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a zip file OPC package by
+    memory-mapping the file at *path*. The blob of a stored (uncompressed)
+    member is a zero-copy `memoryview` of the mapped file and a deflated
+    member is decompressed straight from the mapping. The CRC of a member
+    read this way is not checked.
+    """
+    def __init__(self, path, use_mmap=True):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        super(_MmapZipPkgReader, self).__init__(self._mmap)
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*, a `memoryview` when the
+        member is stored. Raises |KeyError| if no matching member is present
+        in the zip archive.
+        """
+        zipinfo = self._zipf.getinfo(pack_uri.membername)
+        if zipinfo.flag_bits & 0x01:  # encrypted, let zipfile complain
+            return self._zipf.read(pack_uri.membername)
+        if zipinfo.compress_type == ZIP_STORED:
+            return self._data_for(zipinfo)
+        if zipinfo.compress_type == ZIP_DEFLATED:
+            return zlib.decompress(
+                self._data_for(zipinfo), -zlib.MAX_WBITS, zipinfo.file_size
+            )
+        return self._zipf.read(pack_uri.membername)
+
+    def close(self):
+        """
+        Close the zip archive and unmap the file. The mapping outlives this
+        call while a `memoryview` of it is still referenced, and is released
+        when the last one is.
+        """
+        super(_MmapZipPkgReader, self).close()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    @property
+    def content_types_xml(self):
+        """
+        Return the `[Content_Types].xml` blob from the zip package.
+        """
+        return bytes(self.blob_for(CONTENT_TYPES_URI))
+
+    def raw_member_for(self, pack_uri):
+        """
+        Return a `(zipinfo, raw_chunks)` 2-tuple for the zip member
+        corresponding to *pack_uri*, where *raw_chunks* generates the member
+        data as stored in the mapped file as `memoryview` slices of at most
+        |CHUNK_SIZE| bytes.
+        """
+        zipinfo = self._zipf.getinfo(pack_uri.membername)
+        data = self._data_for(zipinfo)
+        raw_chunks = (
+            data[start:start+CHUNK_SIZE]
+            for start in range(0, len(data), CHUNK_SIZE)
+        )
+        return zipinfo, raw_chunks
+
+    def rels_xml_for(self, source_uri):
+        """
+        Return rels item XML for source with *source_uri* or None if no rels
+        item is present.
+        """
+        rels_xml = super(_MmapZipPkgReader, self).rels_xml_for(source_uri)
+        if rels_xml is None:
+            return None
+        return bytes(rels_xml)
+
+    def _data_for(self, zipinfo):
+        """
+        Return a `memoryview` of the data of the member described by
+        *zipinfo*, as stored in the mapped file.
+        """
+        fheader = struct.unpack_from(
+            structFileHeader, self._mmap, zipinfo.header_offset
+        )
+        if fheader[_FH_SIGNATURE] != stringFileHeader:
+            raise BadZipfile(
+                "bad local file header for '%s'" % zipinfo.filename
+            )
+        start = (
+            zipinfo.header_offset + sizeFileHeader +
+            fheader[_FH_FILENAME_LENGTH] + fheader[_FH_EXTRA_FIELD_LENGTH]
+        )
+        return memoryview(self._mmap)[start:start+zipinfo.compress_size]
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
-    Implements |PhysPkgWriter| interface for a zip file OPC package.
+    Implements |PhysPkgWriter| interface for a zip file OPC package. When
+    *compression* is |None|, each member is deflated at the zlib default
+    level. Otherwise it is the deflate level (0-9) for each member, and a
+    member having an already-compressed content type is stored instead.
+    A stream *pkg_file* that cannot seek is written to strictly forward.
+
+    If *append* is |True|, *pkg_file* is an existing zip package that is
+    updated in place. Members are written after those already present, and
+    an existing member stays in the central directory only if it is kept
+    with :meth:`keep_member` or :meth:`keep_blob`; the data of any other is
+    left in the file as dead space.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compression=None, append=False):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        if compression is not None:
+            if not is_integer(compression) or not 0 <= compression <= 9:
+                raise ValueError(
+                    'compression must be an int from 0 to 9, got %r' %
+                    (compression,)
+                )
+        self._compression = compression
+        self._prior_members = {}
+        if append:
+            zipf = ZipFile(pkg_file, 'a', compression=ZIP_DEFLATED)
+            self._prior_members = dict(zipf.NameToInfo)
+            zipf.filelist = []
+            zipf.NameToInfo = {}
+        else:
+            zipf = ZipFile(
+                self._sink_for(pkg_file), 'w', compression=ZIP_DEFLATED
+            )
+        self._zipf = zipf
 
     def close(self):
         """
@@ -148,9 +365,212 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def compress(self, pack_uri, blob, content_type=None):
+        """
+        Return a `(zipinfo, raw_bytes)` 2-tuple for a member containing
+        *blob*, compressed as :meth:`write` would compress it. *raw_bytes*
+        can be written with :meth:`write_raw` as a single chunk. Touches no
+        state of the archive, so it can be called from multiple threads at
+        once.
+        """
+        compression = self._compression
+        zipinfo = ZipInfo(pack_uri.membername, time.localtime()[:6])
+        zipinfo.external_attr = 0o600 << 16
+        zipinfo.file_size = len(blob)
+        zipinfo.CRC = zlib.crc32(blob) & 0xffffffff
+        if compression == 0 or (
+                compression is not None and
+                content_type in precompressed_content_types):
+            zipinfo.compress_type = ZIP_STORED
+            raw_bytes = blob
+        else:
+            if compression is None:
+                compression = zlib.Z_DEFAULT_COMPRESSION
+            compressor = zlib.compressobj(
+                compression, zlib.DEFLATED, -zlib.MAX_WBITS
+            )
+            zipinfo.compress_type = ZIP_DEFLATED
+            raw_bytes = compressor.compress(blob) + compressor.flush()
+        zipinfo.compress_size = len(raw_bytes)
+        return zipinfo, raw_bytes
+
+    def keep_blob(self, pack_uri, blob):
+        """
+        Keep the member corresponding to *pack_uri* already present in the
+        package being appended to and return |True| if its contents are
+        *blob*. Return |False| otherwise. Reads from the package, so must be
+        called before any member is written.
+        """
+        zipinfo = self._prior_members.get(pack_uri.membername)
+        if zipinfo is None or zipinfo.file_size != len(blob):
+            return False
+        if zipinfo.CRC != zlib.crc32(blob) & 0xffffffff:
+            return False
+        if self._zipf.read(zipinfo) != blob:
+            return False
+        self._keep(zipinfo)
+        return True
+
+    def keep_member(self, pack_uri, zipinfo):
+        """
+        Keep the member corresponding to *pack_uri* already present in the
+        package being appended to and return |True| if it is the member
+        described by *zipinfo*, as read from this same file when it was
+        opened. Return |False| otherwise.
+        """
+        prior_zipinfo = self._prior_members.get(pack_uri.membername)
+        if prior_zipinfo is None:
+            return False
+        if (prior_zipinfo.header_offset != zipinfo.header_offset or
+                prior_zipinfo.CRC != zipinfo.CRC or
+                prior_zipinfo.compress_size != zipinfo.compress_size):
+            return False
+        self._keep(prior_zipinfo)
+        return True
+
+    def write(self, pack_uri, blob, content_type=None):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. *content_type* is used to recognize data that is already
+        compressed when a compression level has been specified.
+        """
+        if self._compression is None:
+            self._zipf.writestr(pack_uri.membername, blob)
+            return
+        # the standard library zip writer doesn't accept a compression
+        # level on all supported Python versions, so compress it here
+        zipinfo, raw_bytes = self.compress(pack_uri, blob, content_type)
+        self.write_raw(pack_uri, zipinfo, (raw_bytes,))
+
+    def write_stream(self, pack_uri, chunks, content_type=None, size=None):
+        """
+        Write the bytes chunks generated by *chunks* to this zip package as
+        the member corresponding to *pack_uri*, compressing them as they
+        come, so no more than a chunk is held in memory. *size* is the total
+        size in bytes, if known, which must be given for a member of more
+        than 2 GiB. Python before 3.6 can't write a zip member a piece at
+        a time, so there the chunks are joined and written in one go.
+        """
+        if sys.version_info < (3, 6):
+            return self.write(pack_uri, b''.join(chunks), content_type)
+        zipinfo = ZipInfo(pack_uri.membername, time.localtime()[:6])
+        zipinfo.external_attr = 0o600 << 16
+        compression = self._compression
+        if compression == 0 or (
+                compression is not None and
+                content_type in precompressed_content_types):
+            zipinfo.compress_type = ZIP_STORED
+        else:
+            zipinfo.compress_type = ZIP_DEFLATED
+            # honored from Python 3.7, which added compression levels
+            zipinfo._compresslevel = compression
+        if size is not None:
+            zipinfo.file_size = size
+        with self._zipf.open(zipinfo, 'w') as member:
+            for chunk in chunks:
+                member.write(chunk)
+
+    def write_raw(self, pack_uri, zipinfo, raw_chunks):
+        """
+        Write the bytes chunks generated by *raw_chunks*, the
+        already-compressed data of a zip member described by *zipinfo*, to
+        this zip package unchanged, with the membername corresponding to
+        *pack_uri*. This allows a member to be copied from another zip
+        archive without being decompressed and compressed again, and
+        without holding more than a chunk of it in memory.
+        """
+        zipf = self._zipf
+        zipinfo = copy.copy(zipinfo)
+        zipinfo.filename = pack_uri.membername
+        # sizes and CRC are known, so no data descriptor follows the data
+        zipinfo.flag_bits &= ~0x08
+        # a member read since the last write moved the file position
+        if getattr(zipf, '_seekable', False):
+            zipf.fp.seek(zipf.start_dir)
+        zipinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zipinfo.FileHeader())
+        for chunk in raw_chunks:
+            zipf.fp.write(chunk)
+        zipf.filelist.append(zipinfo)
+        zipf.NameToInfo[zipinfo.filename] = zipinfo
+        if hasattr(zipf, 'start_dir'):
+            zipf.start_dir = zipf.fp.tell()
+        zipf._didModify = True
+
+    def _keep(self, zipinfo):
+        """
+        Keep the existing member described by *zipinfo* in the central
+        directory of the package being appended to.
+        """
+        zipf = self._zipf
+        zipf.filelist.append(zipinfo)
+        zipf.NameToInfo[zipinfo.filename] = zipinfo
+
+    @staticmethod
+    def _sink_for(pkg_file):
+        """
+        Return *pkg_file*, wrapped in a |_ForwardOnlyStream| when it is
+        a stream that cannot seek, such as a pipe, a socket file or an HTTP
+        response body. A stream without a `seekable()` method is tried
+        instead, as an older file-like object may support seeking without
+        having one.
+        """
+        if is_string(pkg_file):
+            return pkg_file
+        try:
+            seekable = pkg_file.seekable()
+        except AttributeError:
+            seekable = _ZipPkgWriter._can_seek(pkg_file)
+        except ValueError:
+            seekable = False
+        if seekable:
+            return pkg_file
+        return _ForwardOnlyStream(pkg_file)
+
+    @staticmethod
+    def _can_seek(stream):
+        """
+        Return |True| if *stream* can report its position and seek, tried
+        by seeking to where it already is, so it is left unchanged.
+        """
+        try:
+            position = stream.tell()
+            stream.seek(0, 1)
+        except (AttributeError, EnvironmentError, ValueError):
+            return False
+        return stream.tell() == position
+
+
+class _ForwardOnlyStream(object):
+    """
+    Write-only wrapper for a stream that cannot seek. It keeps track of the
+    write position itself and provides no `seek()` method, so |ZipFile|
+    writes each member in a single forward pass, using a data descriptor
+    where it would otherwise go back to update the local file header.
+    """
+    def __init__(self, stream):
+        super(_ForwardOnlyStream, self).__init__()
+        self._stream = stream
+        self._position = 0
+
+    def flush(self):
+        """
+        Flush the wrapped stream, if it supports flushing.
+        """
+        flush = getattr(self._stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        """
+        Return the count of bytes written through this stream.
+        """
+        return self._position
+
+    def write(self, data):
+        """
+        Write *data* to the wrapped stream and return its length.
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        self._stream.write(data)
+        self._position += len(data)
+        return len(data)
@@ -7,6 +7,10 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+import zlib
+
+from zipfile import BadZipfile, ZIP_DEFLATED, ZIP_STORED
+
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -19,32 +23,58 @@ class PackageReader(object):
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, lazy=False):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._lazy = lazy
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False, use_mmap=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        If *lazy* is |True|, only the relationship items and content types
+        are read; the physical package is left open and the blob of each
+        part is read from it the first time it is requested. *use_mmap* is
+        passed to |PhysPkgReader| to select a memory-mapped zip reader.
         """
-        phys_reader = PhysPkgReader(pkg_file)
+        phys_reader = PhysPkgReader(pkg_file, use_mmap)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, lazy
         )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+        if not lazy:
+            phys_reader.close()
+        return PackageReader(content_types, pkg_srels, sparts, lazy)
+
+    @property
+    def is_lazy(self):
+        """
+        |True| if part blobs in this package are read on first access rather
+        than when the package is opened.
+        """
+        return self._lazy
+
+    def iter_lazy_sparts(self):
+        """
+        Generate a 3-tuple `(partname, content_type, spart)` for each of the
+        serialized parts in the package whose blob is read only when asked
+        for, without reading it. *spart* is the |_SerializedPart| object,
+        which reads its blob on each access of its :attr:`blob` property.
+        """
+        for spart in self._sparts:
+            if spart.is_lazy:
+                yield (spart.partname, spart.content_type, spart)
 
     def iter_sparts(self):
         """
         Generate a 3-tuple `(partname, content_type, blob)` for each of the
-        serialized parts in the package.
+        serialized parts in the package whose blob has already been read.
         """
         for spart in self._sparts:
-            yield (spart.partname, spart.content_type, spart.blob)
+            if not spart.is_lazy:
+                yield (spart.partname, spart.content_type, spart.blob)
 
     def iter_srels(self):
         """
@@ -58,20 +88,67 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(
+            phys_reader, pkg_srels, content_types, lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. If *lazy* is |True|, part blobs are not
+        read; each serialized part reads its blob from *phys_reader* on
+        demand instead. Otherwise an XML part is read still compressed, as
+        described for :meth:`_raw_xml_member`, when it can be.
         """
         sparts = []
         part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
-        for partname, blob, srels in part_walker:
+        for partname, srels in part_walker:
             content_type = content_types[partname]
-            spart = _SerializedPart(partname, content_type, blob, srels)
+            if lazy:
+                spart = _SerializedPart(
+                    partname, content_type, None, srels, phys_reader
+                )
+            else:
+                raw_member = PackageReader._raw_xml_member(
+                    phys_reader, partname, content_type
+                )
+                if raw_member is not None:
+                    spart = _SerializedPart(
+                        partname, content_type, None, srels,
+                        raw_member=raw_member
+                    )
+                else:
+                    blob = phys_reader.blob_for(partname)
+                    spart = _SerializedPart(
+                        partname, content_type, blob, srels
+                    )
             sparts.append(spart)
         return tuple(sparts)
 
+    @staticmethod
+    def _raw_xml_member(phys_reader, partname, content_type):
+        """
+        Return a `(zipinfo, raw_bytes)` 2-tuple holding the zip member for
+        *partname* in *phys_reader* exactly as stored, still compressed, or
+        |None| if it is not an XML part or not a stored or deflated zip
+        member. Kept this way, an XML part takes much less memory than its
+        XML would, is parsed only if it is used, and is copied unchanged
+        when saved if it is not changed.
+        """
+        if not content_type.endswith('xml'):
+            return None
+        raw_member = phys_reader.raw_member_for(partname)
+        if raw_member is None:
+            return None
+        zipinfo, raw_chunks = raw_member
+        if zipinfo.flag_bits & 0x01:  # encrypted
+            return None
+        if zipinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return None
+        raw_bytes = b''.join(
+            chunk if isinstance(chunk, bytes) else chunk.tobytes()
+            for chunk in raw_chunks
+        )
+        return zipinfo, raw_bytes
+
     @staticmethod
     def _srels_for(phys_reader, source_uri):
         """
@@ -85,8 +162,9 @@ class PackageReader(object):
     @staticmethod
     def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
         """
-        Generate a 3-tuple `(partname, blob, srels)` for each of the parts in
+        Generate a 2-tuple `(partname, srels)` for each of the parts in
         *phys_reader* by walking the relationship graph rooted at srels.
+        Only relationship items are read; no part blob is loaded.
         """
         if visited_partnames is None:
             visited_partnames = []
@@ -98,11 +176,10 @@ class PackageReader(object):
                 continue
             visited_partnames.append(partname)
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, part_srels)
-            for partname, blob, srels in PackageReader._walk_phys_parts(
+            yield (partname, part_srels)
+            for partname, srels in PackageReader._walk_phys_parts(
                     phys_reader, part_srels, visited_partnames):
-                yield (partname, blob, srels)
+                yield (partname, srels)
 
 
 class _ContentTypeMap(object):
@@ -162,14 +239,23 @@ class _ContentTypeMap(object):
 class _SerializedPart(object):
     """
     Value object for an OPC package part. Provides access to the partname,
-    content type, blob, and serialized relationships for the part.
+    content type, blob, and serialized relationships for the part. When
+    constructed with *phys_reader* rather than a blob, the blob is read from
+    the physical package each time it is requested, so the physical package
+    must remain open for the lifetime of this object. When constructed with
+    *raw_member*, a `(zipinfo, raw_bytes)` 2-tuple holding the zip member
+    of the part still compressed, the blob is decompressed from it each
+    time it is requested.
     """
-    def __init__(self, partname, content_type, blob, srels):
+    def __init__(self, partname, content_type, blob, srels,
+                 phys_reader=None, raw_member=None):
         super(_SerializedPart, self).__init__()
         self._partname = partname
         self._content_type = content_type
         self._blob = blob
         self._srels = srels
+        self._phys_reader = phys_reader
+        self._raw_member = raw_member
 
     @property
     def partname(self):
@@ -181,8 +267,53 @@ class _SerializedPart(object):
 
     @property
     def blob(self):
+        """
+        The binary contents of this part. Read from the physical package on
+        each access when this part was loaded lazily; the blob is not cached
+        here so a caller that only parses it doesn't keep it in memory.
+        """
+        if self._raw_member is not None:
+            return _decompressed(*self._raw_member)
+        if self._blob is None and self._phys_reader is not None:
+            return self._phys_reader.blob_for(self._partname)
         return self._blob
 
+    @property
+    def is_lazy(self):
+        """
+        |True| if the blob of this part is read only when asked for, from
+        its physical package or its still-compressed zip member.
+        """
+        return self._phys_reader is not None or self._raw_member is not None
+
+    @property
+    def source_member(self):
+        """
+        The `(zipinfo, raw_chunks)` 2-tuple for the zip member this part was
+        loaded from, or |None| if this part was not loaded lazily or its
+        physical package is not a zip archive.
+        """
+        if self._raw_member is not None:
+            zipinfo, raw_bytes = self._raw_member
+            return zipinfo, (raw_bytes,)
+        if self._phys_reader is None:
+            return None
+        return self._phys_reader.raw_member_for(self._partname)
+
+    @property
+    def source_zipinfo(self):
+        """
+        The |ZipInfo| object describing the zip member this part was loaded
+        from, or |None| if this part was not loaded lazily or its physical
+        package is not a zip archive. Unlike :attr:`source_member`, reads
+        nothing from the physical package.
+        """
+        if self._raw_member is not None:
+            return self._raw_member[0]
+        if self._phys_reader is None:
+            return None
+        return self._phys_reader.zipinfo_for(self._partname)
+
     @property
     def srels(self):
         return self._srels
@@ -283,3 +414,18 @@ class _SerializedRelationshipCollection(object):
             for rel_elm in rels_elm.relationship_lst:
                 srels._srels.append(_SerializedRelationship(baseURI, rel_elm))
         return srels
+
+
+def _decompressed(zipinfo, raw_bytes):
+    """
+    Return the contents of the zip member described by *zipinfo*, stored or
+    deflated, from *raw_bytes*, its data as stored in the archive. Raises
+    |BadZipfile| if the contents don't match the CRC in *zipinfo*.
+    """
+    if zipinfo.compress_type == ZIP_STORED:
+        blob = raw_bytes
+    else:
+        blob = zlib.decompress(raw_bytes, -zlib.MAX_WBITS, zipinfo.file_size)
+    if zlib.crc32(blob) & 0xffffffff != zipinfo.CRC:
+        raise BadZipfile("Bad CRC-32 for file '%s'" % zipinfo.filename)
+    return blob
@@ -7,10 +7,17 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+import os
+import shutil
+import tempfile
+
+from multiprocessing.pool import ThreadPool
+
+from ..compat import is_integer
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
-from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
-from .phys_pkg import PhysPkgWriter
+from .packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from .phys_pkg import PhysPkgReader, PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
 
@@ -18,23 +25,94 @@ from .spec import default_content_types
 class PackageWriter(object):
     """
     Writes a zip-format OPC package to *pkg_file*, where *pkg_file* can be
-    either a path to a zip file (a string) or a file-like object. Its single
-    API method, :meth:`write`, is static, so this class is not intended to
-    be instantiated.
+    either a path to a zip file (a string) or a file-like object. Its API
+    methods, :meth:`write`, :meth:`append` and :meth:`compact`, are static,
+    so this class is not intended to be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compression=None, workers=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. *compression* is the deflate level
+        passed to the physical package writer. If *workers* is not |None|,
+        parts are serialized and compressed by a pool of that many threads.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
+        phys_writer = PhysPkgWriter(pkg_file, compression)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        if workers is None:
+            PackageWriter._write_parts(phys_writer, parts)
+        else:
+            PackageWriter._write_parts_in_parallel(
+                phys_writer, parts, workers
+            )
         phys_writer.close()
 
+    @staticmethod
+    def append(pkg_file, pkg_rels, parts, compression=None):
+        """
+        Update the zip package at path *pkg_file* in place to contain
+        *pkg_rels* and *parts*, appending only what has changed. A part
+        lazily loaded from that same file and unchanged since is left where
+        it is, as is a rels item whose XML is unchanged. A fresh content
+        types stream is always written. Members superseded in the central
+        directory stay in the file until it is compacted.
+        """
+        phys_writer = PhysPkgWriter(pkg_file, compression, append=True)
+        # everything read from the package is kept before anything is
+        # written after it
+        rels_items = [(PACKAGE_URI.rels_uri, pkg_rels.xml)]
+        changed_parts = []
+        for part in parts:
+            zipinfo = part.source_zipinfo
+            if zipinfo is None or not phys_writer.keep_member(
+                    part.partname, zipinfo):
+                changed_parts.append(part)
+            if len(part._rels):
+                rels_items.append((part.partname.rels_uri, part._rels.xml))
+        changed_rels_items = [
+            (rels_uri, rels_xml) for rels_uri, rels_xml in rels_items
+            if not phys_writer.keep_blob(rels_uri, rels_xml)
+        ]
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        for rels_uri, rels_xml in changed_rels_items:
+            phys_writer.write(rels_uri, rels_xml)
+        for part in changed_parts:
+            PackageWriter._write_part_blob(phys_writer, part)
+        phys_writer.close()
+
+    @staticmethod
+    def compact(pkg_file):
+        """
+        Rewrite the zip package at path *pkg_file* to contain only the
+        members in its central directory, reclaiming the space left by
+        members superseded in an append save. Each member is copied still
+        compressed, a chunk at a time, to a temporary file beside
+        *pkg_file*, which then replaces it.
+        """
+        pkg_dir = os.path.dirname(os.path.abspath(pkg_file))
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=pkg_dir)
+        os.close(fd)
+        try:
+            phys_reader = PhysPkgReader(pkg_file)
+            try:
+                phys_writer = PhysPkgWriter(tmp_path)
+                for zipinfo, raw_chunks in phys_reader.iter_raw_members():
+                    phys_writer.write_raw(
+                        PackURI('/%s' % zipinfo.filename), zipinfo,
+                        raw_chunks
+                    )
+                phys_writer.close()
+            finally:
+                phys_reader.close()
+            shutil.copymode(pkg_file, tmp_path)
+            # Python 2 has no os.replace(), its os.rename() replaces on POSIX
+            getattr(os, 'replace', os.rename)(tmp_path, pkg_file)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """
@@ -50,13 +128,83 @@ class PackageWriter(object):
     def _write_parts(phys_writer, parts):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. A part
+        unchanged since it was lazily loaded from a zip package is copied
+        from that package still compressed.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            PackageWriter._write_part_blob(phys_writer, part)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
+    @staticmethod
+    def _write_part_blob(phys_writer, part):
+        """
+        Write the blob of *part* to the package, copying it still compressed
+        a chunk at a time when it is unchanged since it was lazily loaded
+        from a zip package, and streaming it a chunk at a time when it comes
+        from a blob source.
+        """
+        source_member = part.source_member
+        if source_member is not None:
+            zipinfo, raw_chunks = source_member
+            phys_writer.write_raw(part.partname, zipinfo, raw_chunks)
+            return
+        blob_stream = part.blob_stream
+        if blob_stream is not None:
+            phys_writer.write_stream(
+                part.partname, blob_stream.iter_chunks(), part.content_type,
+                blob_stream.size
+            )
+            return
+        phys_writer.write(part.partname, part.blob, part.content_type)
+
+    @staticmethod
+    def _write_parts_in_parallel(phys_writer, parts, workers):
+        """
+        Write each part in *parts* to the package like :meth:`_write_parts`
+        does, but with the blob of each part serialized and compressed in
+        a pool of *workers* threads. The compressed members are written in
+        the order of *parts*, so the package is the same whatever the number
+        of workers. Parts are handed to the pool a batch at a time, which
+        bounds the count of compressed members held in memory.
+        """
+        if not is_integer(workers) or workers < 1:
+            raise ValueError(
+                'workers must be a positive int, got %r' % (workers,)
+            )
+
+        def member_for(part):
+            source_member = part.source_member
+            if source_member is not None:
+                return source_member
+            # a streamed part is written a chunk at a time afterward
+            if part.blob_stream is not None:
+                return None
+            zipinfo, raw_bytes = phys_writer.compress(
+                part.partname, part.blob, part.content_type
+            )
+            return zipinfo, (raw_bytes,)
+
+        batch_size = workers * 4
+        pool = ThreadPool(workers)
+        try:
+            for start in range(0, len(parts), batch_size):
+                batch = parts[start:start+batch_size]
+                members = pool.map(member_for, batch)
+                for part, member in zip(batch, members):
+                    if member is None:
+                        PackageWriter._write_part_blob(phys_writer, part)
+                    else:
+                        phys_writer.write_raw(part.partname, *member)
+                    if len(part._rels):
+                        phys_writer.write(
+                            part.partname.rels_uri, part._rels.xml
+                        )
+        finally:
+            pool.close()
+            pool.join()
+
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
         """
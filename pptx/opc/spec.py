@@ -29,6 +29,18 @@ default_content_types = (
 )
 
 
+# content types of parts whose data is already compressed, such that
+# deflating them again costs time but saves little or no space
+precompressed_content_types = frozenset((
+    CT.GIF,
+    CT.JPEG,
+    CT.MS_PHOTO,
+    CT.OFC_PACKAGE,
+    CT.PNG,
+    CT.SML_SHEET,
+))
+
+
 image_content_types = {
     'bmp':  CT.BMP,
     'emf':  CT.X_EMF,
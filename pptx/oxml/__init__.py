@@ -21,6 +21,11 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# parser for XML that is only read; its elements are plain lxml elements
+readonly_parser = etree.XMLParser(
+    remove_blank_text=True, resolve_entities=False
+)
+
 
 def parse_from_template(template_name):
     """
@@ -45,6 +50,17 @@ def parse_xml(xml):
     return root_element
 
 
+def parse_xml_readonly(xml):
+    """
+    Return root lxml element obtained by parsing XML character string in
+    *xml*, like |parse_xml|, but made of plain lxml elements rather than
+    oxml element classes. Each element is faster to access, which suits
+    extracting content from XML that is only read, but has none of the
+    oxml element behaviors and its changes are not counted.
+    """
+    return etree.fromstring(xml, readonly_parser)
+
+
 def register_element_cls(nsptagname, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
@@ -56,6 +72,14 @@ def register_element_cls(nsptagname, cls):
     namespace[nsptag.local_part] = cls
 
 
+# elements without a registered custom element class get BaseOxmlElement, so
+# changes to them are counted like changes to any other element
+from .xmlchemy import BaseOxmlElement  # noqa
+element_class_lookup.set_fallback(
+    etree.ElementDefaultClassLookup(element=BaseOxmlElement)
+)
+
+
 from .action import CT_Hyperlink
 register_element_cls('a:hlinkClick', CT_Hyperlink)
 register_element_cls('a:hlinkHover', CT_Hyperlink)
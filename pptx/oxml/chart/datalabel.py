@@ -136,7 +136,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` child representing the label for the data point
         at index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath('c:dLbl[c:idx[@val=$idx]]', idx=idx)
         if matches:
             return matches[0]
         return None
@@ -146,7 +146,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` element representing the label of the point at
         index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath('c:dLbl[c:idx[@val=$idx]]', idx=idx)
         if matches:
             return matches[0]
         return self._insert_dLbl_in_sequence(idx)
@@ -130,7 +130,15 @@ def qn(namespace_prefixed_tag):
     Return a Clark-notation qualified tag name corresponding to
     *namespace_prefixed_tag*, a string like 'p:body'. 'qn' stands for
     *qualified name*. As an example, ``qn('p:cSld')`` returns
-    ``'{http://schemas.../main}cSld'``.
+    ``'{http://schemas.../main}cSld'``. The Clark name for each tag is
+    computed only once since |qn| is called on every child-element lookup.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _clark_names[namespace_prefixed_tag]
+    except KeyError:
+        nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
+        clark_name = _clark_names[namespace_prefixed_tag] = nsptag.clark_name
+        return clark_name
+
+
+_clark_names = {}
@@ -50,6 +50,18 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created <p:sldId> child elements, one for each
+        rId in *rIds*, in that order. Their ids are allocated in a single
+        pass, the first being the one :meth:`add_sldId` would use.
+        """
+        next_id = self._next_id
+        return [
+            self._add_sldId(id=next_id+idx, rId=rId)
+            for idx, rId in enumerate(rIds)
+        ]
+
     @property
     def _next_id(self):
         """
@@ -8,7 +8,9 @@ classes.
 from __future__ import absolute_import, print_function
 
 import re
+import threading
 
+from itertools import count
 from lxml import etree
 
 from . import oxml_parser
@@ -30,6 +32,39 @@ def OxmlElement(nsptag_str, nsmap=None):
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+def compiled_xpath(xpath_str, namespaces=_nsmap):
+    """
+    Return an ``etree.XPath`` object for *xpath_str*, using the namespace
+    prefixes in *namespaces*, by default the standard Open XML prefixes.
+    The compiled form is reused for later calls having the same expression
+    and namespace mapping, so a value that varies from call to call is best
+    passed as an XPath variable, like ``$idx``, rather than formatted into
+    *xpath_str*. Only the 256 most recently used compiled expressions are
+    kept, so one-off expressions don't accumulate.
+    """
+    nskey = None if namespaces is _nsmap else frozenset(namespaces.items())
+    key = (xpath_str, nskey)
+    entry = _compiled_xpaths.get(key)
+    if entry is None:
+        entry = [etree.XPath(xpath_str, namespaces=namespaces), 0]
+        with _compiled_xpaths_lock:
+            if len(_compiled_xpaths) >= _COMPILED_XPATHS_MAX:
+                del _compiled_xpaths[min(
+                    _compiled_xpaths, key=lambda k: _compiled_xpaths[k][1]
+                )]
+            _compiled_xpaths[key] = entry
+    entry[1] = next(_xpath_uses)
+    return entry[0]
+
+
+# each value is a [xpath, last_use] list, the least recently used being
+# evicted when full; hits take no lock
+_compiled_xpaths = {}
+_compiled_xpaths_lock = threading.Lock()
+_xpath_uses = count()
+_COMPILED_XPATHS_MAX = 256
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -147,7 +182,7 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ':' in self._attr_name:
             return qn(self._attr_name)
@@ -170,8 +205,10 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 return self._default
             return self._simple_type.from_xml(attr_str_value)
@@ -201,6 +238,7 @@ class OptionalAttribute(BaseAttribute):
             if value == self._default:
                 if self._clark_name in obj.attrib:
                     del obj.attrib[self._clark_name]
+                    obj._mark_changed()
                 return
             str_value = self._simple_type.to_xml(value)
             obj.set(self._clark_name, str_value)
@@ -222,8 +260,10 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
@@ -369,8 +409,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -387,8 +429,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -495,8 +539,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -701,8 +747,54 @@ class ZeroOrOneChoice(_BaseChildElement):
 
 class _OxmlElementBase(etree.ElementBase):
     """
-    Provides common behavior for oxml element classes
+    Provides common behavior for oxml element classes. Each of the lxml
+    methods that change an element is overridden, and assignment to its
+    ``text``, ``tail`` and ``tag`` properties hooked, to also count the
+    change on the root element of its tree, so an unchanged tree
+    can be recognized by its unchanged :attr:`generation`, and to keep the
+    |_TreeIds| of the tree up to date once it has one. Changes to the
+    children of an element and to the attributes elements are looked up by
+    are also counted separately, in :attr:`child_generation` and
+    :attr:`key_generation`, so a lookup index can outlast other changes.
+
+    A change made without calling one of these methods is not counted. That
+    is the case for lxml functions that change a tree in C, such as
+    ``etree.SubElement()``, ``etree.strip_elements()`` and XSLT, and for
+    changes made through the ``attrib`` mapping of an element; code making
+    such a change calls :meth:`_mark_changed` itself afterward.
     """
+
+    _child_generation = 0
+    _generation = 0
+    _key_generation = 0
+    _tree_ids = None
+
+    def addnext(self, element):
+        _mark_moved(element)
+        super(BaseOxmlElement, self).addnext(element)
+        self._mark_changed(added=(element,))
+
+    def addprevious(self, element):
+        _mark_moved(element)
+        super(BaseOxmlElement, self).addprevious(element)
+        self._mark_changed(added=(element,))
+
+    def append(self, element):
+        _mark_moved(element)
+        super(BaseOxmlElement, self).append(element)
+        self._mark_changed(added=(element,))
+
+    @property
+    def child_generation(self):
+        """
+        Count of the changes made to the sequence of children of this
+        element. Because lxml creates a new Python object for an element
+        each time it is accessed unless one is still referenced, the count
+        is only kept while a reference to this element is held, so it is
+        suited to an index held by an object that holds the element.
+        """
+        return self._child_generation
+
     @classmethod
     def child_tagnames_after(cls, tagname):
         """
@@ -711,12 +803,27 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return cls.child_tagnames.tagnames_after(tagname)
 
+    def clear(self, *args, **kwargs):
+        children, id_str = list(self), self.get('id')
+        rekeyed = any(self.get(key) is not None for key in _key_attr_names)
+        super(BaseOxmlElement, self).clear(*args, **kwargs)
+        self._mark_changed(
+            removed=children, removed_id=id_str, rekeyed=rekeyed
+        )
+
     def delete(self):
         """
         Remove this element from the XML tree.
         """
         self.getparent().remove(self)
 
+    def extend(self, elements):
+        elements = list(elements)
+        for element in elements:
+            _mark_moved(element)
+        super(BaseOxmlElement, self).extend(elements)
+        self._mark_changed(added=elements)
+
     def first_child_found_in(self, *tagnames):
         """
         Return the first child found with tag in *tagnames*, or None if
@@ -728,6 +835,32 @@ class _OxmlElementBase(etree.ElementBase):
                 return child
         return None
 
+    @property
+    def generation(self):
+        """
+        Count of the changes made to the XML tree containing this element,
+        as recorded on the root element of the tree. Unchanged from one
+        access to the next only if the tree has not been changed between
+        them. Like :attr:`child_generation`, the count is kept only while
+        a reference to the root element is held, as a part holds the root
+        element of its XML.
+        """
+        return self.getroottree().getroot()._generation
+
+    @property
+    def key_generation(self):
+        """
+        Count of the changes made to an ``id``, ``name`` or ``idx``
+        attribute, the attributes elements are looked up by, anywhere in the
+        XML tree containing this element, as recorded on its root element.
+        """
+        return self.getroottree().getroot()._key_generation
+
+    def insert(self, index, element):
+        _mark_moved(element)
+        super(BaseOxmlElement, self).insert(index, element)
+        self._mark_changed(added=(element,))
+
     def insert_element_before(self, elm, *tagnames):
         successor = self.first_child_found_in(*tagnames)
         if successor is not None:
@@ -736,6 +869,24 @@ class _OxmlElementBase(etree.ElementBase):
             self.append(elm)
         return elm
 
+    @property
+    def lowest_free_id(self):
+        """
+        The lowest positive integer not used as the ``id`` attribute of any
+        element in the XML tree containing this element. The ids in the tree
+        are read once, the first time this is asked for, into a |_TreeIds|
+        kept on the root element and updated by each later change, so
+        a free id is found without searching the tree again.
+        """
+        root = self.getroottree().getroot()
+        if root._tree_ids is None:
+            root._tree_ids = _TreeIds(root)
+        return root._tree_ids.lowest_free
+
+    def remove(self, element):
+        super(BaseOxmlElement, self).remove(element)
+        self._mark_changed(removed=(element,))
+
     def remove_all(self, tagname):
         """
         Remove all child elements having *tagname*.
@@ -753,6 +904,22 @@ class _OxmlElementBase(etree.ElementBase):
             if element is not None:
                 self.remove(element)
 
+    def replace(self, old_element, new_element):
+        _mark_moved(new_element)
+        super(BaseOxmlElement, self).replace(old_element, new_element)
+        self._mark_changed(added=(new_element,), removed=(old_element,))
+
+    def set(self, key, value):
+        if key not in _key_attr_names:
+            super(BaseOxmlElement, self).set(key, value)
+            self._mark_changed()
+            return
+        id_str = self.get('id')
+        super(BaseOxmlElement, self).set(key, value)
+        self._mark_changed(
+            removed_id=id_str, added_id=self.get('id'), rekeyed=True
+        )
+
     @property
     def xml(self):
         """
@@ -762,16 +929,175 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
-        """
-        return super(BaseOxmlElement, self).xpath(
-            xpath_str, namespaces=_nsmap
-        )
+        XML namespace mapping in centralized location. The expression is
+        compiled only the first time it is used; *variables* provides the
+        value of each XPath variable it refers to, e.g. ``idx=3`` for
+        ``$idx``.
+        """
+        return compiled_xpath(xpath_str)(self, **variables)
+
+    def __delitem__(self, index):
+        removed = _element_list(self[index])
+        super(BaseOxmlElement, self).__delitem__(index)
+        self._mark_changed(removed=removed)
+
+    def __setattr__(self, name, value):
+        # hooked here rather than by overriding the text, tail and tag
+        # properties, so reading them stays on the lxml descriptors
+        _ElementBase_setattr(self, name, value)
+        if name in _tracked_attr_names:
+            self._mark_changed()
+
+    def __setitem__(self, index, value):
+        removed = _element_list(self[index])
+        if isinstance(index, slice):
+            value = list(value)
+            for element in value:
+                _mark_moved(element)
+        else:
+            _mark_moved(value)
+        super(BaseOxmlElement, self).__setitem__(index, value)
+        self._mark_changed(added=_element_list(value), removed=removed)
+
+    def _mark_changed(self, added=(), removed=(), added_id=None,
+                      removed_id=None, rekeyed=False):
+        """
+        Count a change to the XML tree containing this element. *added* and
+        *removed* are the elements added to and removed from the tree by the
+        change, those removed having been children of this element, and
+        *added_id* and *removed_id* an ``id`` attribute value it set or
+        removed, used to update the |_TreeIds| of the tree if it has one.
+        *rekeyed* is |True| when the change set or removed an ``id``,
+        ``name`` or ``idx`` attribute.
+        """
+        if removed:
+            self._child_generation += 1
+        for element in added:
+            parent = element.getparent()
+            if isinstance(parent, BaseOxmlElement):
+                parent._child_generation += 1
+        root = self.getroottree().getroot()
+        if not isinstance(root, BaseOxmlElement):
+            return
+        root._generation += 1
+        if rekeyed:
+            root._key_generation += 1
+        tree_ids = root._tree_ids
+        if tree_ids is None:
+            return
+        for element in removed:
+            tree_ids.remove(_int_ids(element))
+        for element in added:
+            tree_ids.add(_int_ids(element))
+        tree_ids.remove(_int_ids_of(removed_id))
+        tree_ids.add(_int_ids_of(added_id))
 
 
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
 )
+
+
+_ElementBase_setattr = etree.ElementBase.__setattr__
+
+
+def _element_list(value):
+    """
+    Return a list of the elements in *value*, either an element or
+    a sequence of elements as returned by indexing an element.
+    """
+    if isinstance(value, etree._Element):
+        return [value]
+    return list(value)
+
+
+def _int_ids(element):
+    """
+    Return a list of the integer ``id`` attribute values of *element* and
+    its descendants.
+    """
+    return [
+        int(id_str) for id_str in _id_xpath(element) if id_str.isdigit()
+    ]
+
+
+def _int_ids_of(id_str):
+    """
+    Return a list containing the integer value of *id_str*, or an empty
+    list if it is |None| or not a positive integer.
+    """
+    if id_str is None or not id_str.isdigit():
+        return []
+    return [int(id_str)]
+
+
+def _mark_moved(element):
+    """
+    Count a change to the tree *element* is about to be moved out of, if it
+    has a parent there.
+    """
+    parent = element.getparent()
+    if isinstance(parent, BaseOxmlElement):
+        parent._mark_changed(removed=(element,))
+
+
+_id_xpath = etree.XPath('descendant-or-self::*/@id')
+
+_key_attr_names = ('id', 'idx', 'name')
+
+_tracked_attr_names = frozenset(('tag', 'tail', 'text'))
+
+
+class _TreeIds(object):
+    """
+    The integer ``id`` attribute values used in the XML tree rooted at
+    *root*, with the number of elements using each, kept so the lowest free
+    id can be found without searching the tree. Element ids are read only
+    once, when it is created; after that it is updated by
+    :meth:`BaseOxmlElement._mark_changed` for each element added to or
+    removed from the tree and each id set. A change made other than through
+    the oxml element methods is not seen.
+    """
+    def __init__(self, root):
+        super(_TreeIds, self).__init__()
+        self._counts = {}
+        # every id below this one is known to be in use
+        self._lowest_free = 1
+        self.add(_int_ids(root))
+
+    def add(self, ids):
+        """
+        Count a use of each id in *ids*.
+        """
+        counts = self._counts
+        for id_ in ids:
+            counts[id_] = counts.get(id_, 0) + 1
+
+    @property
+    def lowest_free(self):
+        """
+        The lowest positive integer id not in use.
+        """
+        id_ = self._lowest_free
+        while id_ in self._counts:
+            id_ += 1
+        self._lowest_free = id_
+        return id_
+
+    def remove(self, ids):
+        """
+        Remove a use of each id in *ids*, freeing the ones no longer used.
+        """
+        counts = self._counts
+        for id_ in ids:
+            count = counts.get(id_)
+            if count is None:
+                continue
+            if count > 1:
+                counts[id_] = count - 1
+                continue
+            del counts[id_]
+            self._lowest_free = min(self._lowest_free, id_)
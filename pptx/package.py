@@ -14,6 +14,7 @@ from .opc.package import OpcPackage
 from .opc.packuri import PackURI
 from .parts.coreprops import CorePropertiesPart
 from .parts.image import Image, ImagePart
+from .parts.slide import BaseSlidePart
 from .util import lazyproperty
 
 
@@ -26,6 +27,16 @@ class Package(OpcPackage):
     a `.pptx` file. If *file* is |None|, the default presentation template is
     loaded.
     """
+    #: |DownsamplePolicy| applied to an image added to this package when
+    #: none is specified when it is added, or |None| to add images as they
+    #: are, the default.
+    image_downsampling = None
+
+    #: True if the shape collections of this package return the same shape
+    #: object for a shape each time it's accessed, rather than a new one.
+    #: |False|, the default, unless turned on.
+    cache_shape_proxies = False
+
     @lazyproperty
     def core_properties(self):
         """
@@ -40,32 +51,37 @@ class Package(OpcPackage):
             self.relate_to(core_props, RT.CORE_PROPERTIES)
             return core_props
 
-    def get_or_add_image_part(self, image_file):
+    def compact_media(self, downsampling=None):
+        """
+        Reduce the image parts in this package to those needed, as described
+        for :meth:`_ImageParts.compact`, which *downsampling* is passed to.
+        """
+        self._image_parts.compact(downsampling)
+
+    def get_or_add_image_part(self, image_file, scaled_cx=None,
+                              scaled_cy=None, downsampling=None):
         """
         Return an |ImagePart| object containing the image in *image_file*. If
         the image part already exists in this package, it is reused,
-        otherwise a new one is created.
+        otherwise a new one is created. The image is downsampled for display
+        at *scaled_cx* by *scaled_cy* according to *downsampling*, or
+        :attr:`image_downsampling` when *downsampling* is |None|. It is added
+        as it is when *downsampling* is |False|.
         """
-        return self._image_parts.get_or_add_image_part(image_file)
+        if downsampling is None:
+            downsampling = self.image_downsampling
+        return self._image_parts.get_or_add_image_part(
+            image_file, scaled_cx, scaled_cy, downsampling or None
+        )
 
     def next_image_partname(self, ext):
         """
         Return a |PackURI| instance representing the next available image
         partname, by sequence number. *ext* is used as the extention on the
-        returned partname.
-        """
-        def first_available_image_idx():
-            image_idxs = sorted([
-                part.partname.idx for part in self.iter_parts()
-                if part.partname.startswith('/ppt/media/image')
-            ])
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs)+1
-
-        idx = first_available_image_idx()
+        returned partname. The number is unused by an image of any
+        extension.
+        """
+        idx = self._partnames.next_available_idx('/ppt/media/image')
         return PackURI('/ppt/media/image%d.%s' % (idx, ext))
 
     @property
@@ -75,6 +91,24 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    def _part_dropped(self, part):
+        """
+        Forget *part*, no longer in this package, in the index of image
+        parts when it is an image part.
+        """
+        super(Package, self)._part_dropped(part)
+        if isinstance(part, ImagePart):
+            self._image_parts.forget(part)
+
+    def _part_restored(self, part):
+        """
+        Index *part*, back in this package, with the image parts when it is
+        an image part.
+        """
+        super(Package, self)._part_restored(part)
+        if isinstance(part, ImagePart):
+            self._image_parts.remember(part)
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -86,11 +120,17 @@ class Package(OpcPackage):
 
 class _ImageParts(object):
     """
-    Provides access to the image parts in a package.
+    Provides access to the image parts in a package. The image parts are
+    indexed by the SHA1 hash of their image on the first lookup, and the
+    index is kept up to date as image parts are added to and dropped from
+    the package, so a lookup takes constant time until a relationship to
+    a part having relationships of its own, like a slide, is removed from
+    the package.
     """
     def __init__(self, package):
         super(_ImageParts, self).__init__()
         self._package = package
+        self._sha1_index = None
 
     def __iter__(self):
         """
@@ -108,27 +148,176 @@ class _ImageParts(object):
             image_parts.append(image_part)
             yield image_part
 
-    def get_or_add_image_part(self, image_file):
+    def compact(self, downsampling=None):
+        """
+        Reduce the image parts in the package to those needed. A relationship
+        from a slide to an image that nothing on the slide refers to, as is
+        left behind when a picture is deleted, is dropped. Each relationship
+        to an image part containing the same image as another is made to
+        refer to the first such part, so only that one is saved. When
+        *downsampling* is a |DownsamplePolicy| object, each image is then
+        downsampled by it for the largest size a picture displays it at. An
+        image displayed other than by a picture of known size is not
+        downsampled.
+        """
+        for part, rel in self._image_rels():
+            if part.image_display_sizes(rel.rId) == []:
+                del part.rels[rel.rId]
+
+        image_parts_by_sha1 = {}
+        for part, rel in self._image_rels():
+            image_part = image_parts_by_sha1.setdefault(
+                rel.target_part.sha1, rel.target_part
+            )
+            if image_part is not rel.target_part:
+                part.rels.retarget(rel.rId, image_part)
+
+        if downsampling is not None:
+            self._downsample(downsampling)
+
+    def get_or_add_image_part(self, image_file, scaled_cx=None,
+                              scaled_cy=None, downsampling=None):
         """
         Return an |ImagePart| object containing the image in *image_file*,
         which is either a path to an image file or a file-like object
         containing an image. If an image part containing this same image
         already exists, that instance is returned, otherwise a new image part
-        is created.
+        is created. When *downsampling* is a |DownsamplePolicy| object, the
+        image part contains the image downsampled by it for display at
+        *scaled_cx* by *scaled_cy*. Such an image part is found again by the
+        SHA1 hash of the original image, so the same image downsampled the
+        same way is only downsampled once.
         """
         image = Image.from_file(image_file)
-        image_part = self._find_by_sha1(image.sha1)
+        key = image.sha1
+        if downsampling is not None:
+            key = downsampling.key(image, scaled_cx, scaled_cy) or key
+        image_part = self._find_by_sha1(key)
         if image_part is None:
-            image_part = ImagePart.new(self._package, image)
+            if key == image.sha1:
+                image_part = ImagePart.new(self._package, image)
+            else:
+                image_part = ImagePart.new(
+                    self._package,
+                    downsampling.apply(image, scaled_cx, scaled_cy)
+                )
+                image_part.downsampled_from = key
+            sha1_index = self._current_sha1_index
+            if sha1_index is not None:
+                sha1_index[key] = image_part
         return image_part
 
+    def forget(self, image_part):
+        """
+        Remove *image_part*, which has left the package, from the SHA1
+        index, leaving the index otherwise as it is.
+        """
+        sha1_index = self._current_sha1_index
+        if sha1_index is None:
+            return
+        for key in (image_part.sha1, image_part.downsampled_from):
+            if sha1_index.get(key) is image_part:
+                del sha1_index[key]
+
+    def remember(self, image_part):
+        """
+        Add *image_part*, which has come back into the package, to the SHA1
+        index, unless another image part is already indexed for its image.
+        """
+        sha1_index = self._current_sha1_index
+        if sha1_index is None:
+            return
+        sha1_index.setdefault(image_part.sha1, image_part)
+        if image_part.downsampled_from is not None:
+            sha1_index.setdefault(image_part.downsampled_from, image_part)
+
+    def _downsample(self, downsampling):
+        """
+        Replace each image part with one containing its image downsampled by
+        *downsampling* for the largest size a picture displays it at.
+        """
+        image_rels = self._image_rels()
+        display_sizes = {}
+        for part, rel in image_rels:
+            image_part = rel.target_part
+            sizes = part.image_display_sizes(rel.rId)
+            if sizes is None:
+                display_sizes[image_part] = None
+            elif display_sizes.get(image_part, ()) is not None:
+                cx, cy = display_sizes.get(image_part, (0, 0))
+                for size_cx, size_cy in sizes:
+                    cx, cy = max(cx, size_cx), max(cy, size_cy)
+                display_sizes[image_part] = (cx, cy)
+
+        for image_part in list(self):
+            display_size = display_sizes.get(image_part)
+            if display_size is None or 0 in display_size:
+                continue
+            image = image_part.image
+            downsampled_image = downsampling.apply(image, *display_size)
+            if downsampled_image is image:
+                continue
+            new_image_part = ImagePart.new(self._package, downsampled_image)
+            for part, rel in image_rels:
+                if rel.target_part is image_part:
+                    part.rels.retarget(rel.rId, new_image_part)
+
     def _find_by_sha1(self, sha1):
         """
         Return an |ImagePart| object belonging to this package or |None| if
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
-        for image_part in self:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        return self._image_parts_by_sha1.get(sha1)
+
+    @property
+    def _current_sha1_index(self):
+        """
+        The dict of :attr:`_image_parts_by_sha1` if it has been built and is
+        still current, |None| otherwise.
+        """
+        sha1_index = self._sha1_index
+        if sha1_index is None:
+            return None
+        if sha1_index[0] != self._package.rels_removals:
+            return None
+        return sha1_index[1]
+
+    @property
+    def _image_parts_by_sha1(self):
+        """
+        dict mapping the SHA1 hash of each image in the package to the first
+        image part containing it, along with the key of each image part
+        containing a downsampled image, as made by |DownsamplePolicy|. Built
+        again after the package counts a removal in its
+        :attr:`rels_removals`, since image parts may then have left it.
+        """
+        removals = self._package.rels_removals
+        sha1_index = self._sha1_index
+        if sha1_index is None or sha1_index[0] != removals:
+            image_parts_by_sha1 = {}
+            for image_part in self:
+                image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+                if image_part.downsampled_from is not None:
+                    image_parts_by_sha1.setdefault(
+                        image_part.downsampled_from, image_part
+                    )
+            self._sha1_index = sha1_index = (removals, image_parts_by_sha1)
+        return sha1_index[1]
+
+    def _image_rels(self):
+        """
+        Return a list of (part, rel) 2-tuples, one for each relationship in
+        the package from a slide, or other part |BaseSlidePart| is the base
+        class of, to an image part.
+        """
+        image_rels = []
+        for part in self._package.iter_parts():
+            if not isinstance(part, BaseSlidePart):
+                continue
+            for rel in list(part.rels.values()):
+                if rel.is_external or rel.reltype != RT.IMAGE:
+                    continue
+                if isinstance(rel.target_part, ImagePart):
+                    image_rels.append((part, rel))
+        return image_rels
@@ -6,13 +6,12 @@ ImagePart and related objects.
 
 import hashlib
 import os
+import threading
 
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
+from collections import OrderedDict
 
 from ..compat import BytesIO, is_string
+from ..imageheader import probe
 from ..opc.package import Part
 from ..opc.spec import image_content_types
 from ..util import lazyproperty
@@ -23,11 +22,16 @@ class ImagePart(Part):
     An image part, generally having a partname matching the regex
     ``ppt/media/image[1-9][0-9]*.*``.
     """
+    #: Key of the original image this part contains a downsampled copy of,
+    #: as made by :meth:`DownsamplePolicy.key`, or |None|.
+    downsampled_from = None
+
     def __init__(self, partname, content_type, blob, package, filename=None):
         super(ImagePart, self).__init__(
             partname, content_type, blob, package
         )
         self._filename = filename
+        self._image = None
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
@@ -40,9 +44,11 @@ class ImagePart(Part):
         |Image| object.
         """
         partname = package.next_image_partname(image.ext)
-        return cls(
+        image_part = cls(
             partname, image.content_type, image.blob, package, image.filename
         )
+        image_part._image = image
+        return image_part
 
     @property
     def desc(self):
@@ -82,19 +88,7 @@ class ImagePart(Part):
         other is |None|, the missing value is calculated such that the
         image's aspect ratio is preserved.
         """
-        image_cx, image_cy = self._native_size
-
-        if scaled_cx is None and scaled_cy is None:
-            scaled_cx = image_cx
-            scaled_cy = image_cy
-        elif scaled_cx is None:
-            scaling_factor = float(scaled_cy) / float(image_cy)
-            scaled_cx = int(round(image_cx * scaling_factor))
-        elif scaled_cy is None:
-            scaling_factor = float(scaled_cx) / float(image_cx)
-            scaled_cy = int(round(image_cy * scaling_factor))
-
-        return scaled_cx, scaled_cy
+        return _scale(self._native_size, scaled_cx, scaled_cy)
 
     @lazyproperty
     def sha1(self):
@@ -102,7 +96,7 @@ class ImagePart(Part):
         The SHA1 hash digest for the image binary of this image part, like:
         ``'1be010ea47803b00e140b852765cdf84f491da47'``.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return hashlib.sha1(self.blob).hexdigest()
 
     @property
     def _dpi(self):
@@ -110,8 +104,7 @@ class ImagePart(Part):
         A (horz_dpi, vert_dpi) 2-tuple (ints) representing the dots-per-inch
         property of this image.
         """
-        image = Image.from_blob(self.blob)
-        return image.dpi
+        return self._blob_image.dpi
 
     @property
     def _native_size(self):
@@ -120,14 +113,7 @@ class ImagePart(Part):
         image in EMU, calculated based on the image DPI value, if present,
         assuming 72 dpi as a default.
         """
-        EMU_PER_INCH = 914400
-        horz_dpi, vert_dpi = self._dpi
-        width_px, height_px = self._px_size
-
-        width = EMU_PER_INCH * width_px / horz_dpi
-        height = EMU_PER_INCH * height_px / vert_dpi
-
-        return width, height
+        return _native_size(self._px_size, self._dpi)
 
     @property
     def _px_size(self):
@@ -135,8 +121,18 @@ class ImagePart(Part):
         A (width, height) 2-tuple representing the dimensions of this image
         in pixels.
         """
-        image = Image.from_blob(self.blob)
-        return image.size
+        return self._blob_image.size
+
+    @property
+    def _blob_image(self):
+        """
+        |Image| object for the blob of this part, the one it was created
+        from when there is one, so its pixel size and dpi, once known, are
+        not worked out again.
+        """
+        if self._image is None:
+            self._image = Image.from_blob(self.blob)
+        return self._image
 
 
 class Image(object):
@@ -158,20 +154,36 @@ class Image(object):
     @classmethod
     def from_file(cls, image_file):
         """
-        Return a new |Image| object loaded from *image_file*, which can be
-        either a path (string) or a file-like object.
+        Return an |Image| object loaded from *image_file*, which can be
+        either a path (string) or a file-like object, or is returned as it is
+        when it is already an |Image| object. When :data:`image_cache` is
+        enabled, an image already in it is returned from there, along with
+        the properties already worked out for it, rather than loaded again.
         """
+        if isinstance(image_file, Image):
+            return image_file
+        caching = image_cache.max_bytes > 0
         if is_string(image_file):
             # treat image_file as a path
+            key = image_cache.key_for_path(image_file) if caching else None
+            image = image_cache.get(key)
+            if image is not None:
+                return image
             with open(image_file, 'rb') as f:
                 blob = f.read()
             filename = os.path.basename(image_file)
         else:
             # assume image_file is a file-like object
             blob = image_file.read()
+            key = image_cache.key_for_blob(blob) if caching else None
+            image = image_cache.get(key)
+            if image is not None:
+                return image
             filename = None
 
-        return cls.from_blob(blob, filename)
+        image = cls.from_blob(blob, filename)
+        image_cache.put(key, image)
+        return image
 
     @property
     def blob(self):
@@ -273,9 +285,18 @@ class Image(object):
     @lazyproperty
     def _pil_props(self):
         """
-        A tuple containing useful image properties extracted from this image
-        using Pillow (Python Imaging Library, or 'PIL').
-        """
+        A tuple containing useful image properties extracted from this image.
+        They are read from the image header when its format is recognized,
+        without decoding the image. Otherwise they are extracted using Pillow
+        (Python Imaging Library, or 'PIL'), which is imported only then.
+        """
+        props = probe(self._blob)
+        if props is not None:
+            return props
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
         stream = BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)
         format = pil_image.format
@@ -283,3 +304,245 @@ class Image(object):
         dpi = pil_image.info.get('dpi')
         stream.close()
         return (format, (width_px, height_px), dpi)
+
+
+class DownsamplePolicy(object):
+    """
+    Policy for reducing the size of a raster image as it is added to
+    a presentation. An image is downsampled to the number of pixels needed
+    to show it at the size it is displayed at *dpi* dots per inch, when it
+    has more than that. When *jpeg_quality* is an integer from 1 to 95,
+    a downsampled image without transparency is also re-encoded as a JPEG
+    at that quality. An image that doesn't need downsampling is left as it
+    is. Downsampling uses Pillow, which is imported only when an image is
+    downsampled.
+    """
+    def __init__(self, dpi=150, jpeg_quality=None):
+        super(DownsamplePolicy, self).__init__()
+        self._dpi = dpi
+        self._jpeg_quality = jpeg_quality
+
+    @property
+    def dpi(self):
+        """
+        Resolution in dots per inch an image is downsampled to, at the size
+        it is displayed.
+        """
+        return self._dpi
+
+    @property
+    def jpeg_quality(self):
+        """
+        JPEG quality a downsampled image is re-encoded at, or |None| if a
+        downsampled image keeps its format.
+        """
+        return self._jpeg_quality
+
+    def apply(self, image, scaled_cx=None, scaled_cy=None):
+        """
+        Return an |Image| object containing *image* downsampled for display
+        at *scaled_cx* by *scaled_cy* EMU, either of which can be |None| to
+        use the native size of *image* in that direction, as for
+        :meth:`ImagePart.scale`. *image* itself is returned if it doesn't
+        need downsampling.
+        """
+        px_size = self.px_size(image, scaled_cx, scaled_cy)
+        if px_size == image.size:
+            return image
+        return self._downsample(image, px_size, scaled_cx, scaled_cy)
+
+    def key(self, image, scaled_cx=None, scaled_cy=None):
+        """
+        Return a key identifying the image :meth:`apply` produces from
+        *image* for display at *scaled_cx* by *scaled_cy*, made from the
+        SHA1 hash of *image*, so the same image downsampled the same way
+        can be found without downsampling it again. Returns |None| when
+        *image* doesn't need downsampling.
+        """
+        px_size = self.px_size(image, scaled_cx, scaled_cy)
+        if px_size == image.size:
+            return None
+        return (image.sha1, px_size, self._jpeg_quality)
+
+    def px_size(self, image, scaled_cx=None, scaled_cy=None):
+        """
+        Return the (width, height) 2-tuple of the pixel size *image* is
+        downsampled to for display at *scaled_cx* by *scaled_cy*. It is
+        never larger than the pixel size of *image*, and is that size for
+        an image in a vector format such as WMF, which isn't downsampled.
+        """
+        width_px, height_px = image.size
+        if image.ext not in ('bmp', 'gif', 'jpg', 'png', 'tiff'):
+            return (width_px, height_px)
+        EMU_PER_INCH = 914400
+        cx, cy = _scale(
+            _native_size(image.size, image.dpi), scaled_cx, scaled_cy
+        )
+        return (
+            max(1, min(width_px, int(round(cx * self._dpi / EMU_PER_INCH)))),
+            max(1, min(height_px, int(round(cy * self._dpi / EMU_PER_INCH))))
+        )
+
+    def _downsample(self, image, px_size, scaled_cx, scaled_cy):
+        """
+        Return an |Image| object containing *image* resampled to *px_size*,
+        with a resolution that gives it the same native size as *image*
+        when *scaled_cx* and *scaled_cy* are |None|. The resolution is
+        rounded to a whole number of dots per inch, as older versions of
+        Pillow can only write an integer resolution.
+        """
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
+
+        pil_image = PIL_Image.open(BytesIO(image.blob))
+        has_alpha = (
+            pil_image.mode in ('RGBA', 'LA', 'PA') or
+            'transparency' in pil_image.info
+        )
+        if image.ext == 'jpg' or (self._jpeg_quality and not has_alpha):
+            format, ext, mode = 'JPEG', 'jpg', 'RGB'
+        else:
+            format, ext, mode = 'PNG', 'png', 'RGBA' if has_alpha else 'RGB'
+        if pil_image.mode not in (mode, 'L'):
+            pil_image = pil_image.convert(mode)
+
+        resample = getattr(PIL_Image, 'LANCZOS', None)
+        if resample is None:
+            resample = PIL_Image.ANTIALIAS
+        pil_image = pil_image.resize(px_size, resample)
+
+        EMU_PER_INCH = 914400
+        cx, cy = _scale(
+            _native_size(image.size, image.dpi), scaled_cx, scaled_cy
+        )
+        options = {'dpi': (
+            max(1, int(round(px_size[0] * EMU_PER_INCH / float(cx)))),
+            max(1, int(round(px_size[1] * EMU_PER_INCH / float(cy))))
+        )}
+        if format == 'JPEG':
+            options['quality'] = self._jpeg_quality or 95
+        stream = BytesIO()
+        pil_image.save(stream, format, **options)
+
+        filename = image.filename
+        if filename is not None and ext != image.ext:
+            filename = '%s.%s' % (os.path.splitext(filename)[0], ext)
+        return Image(stream.getvalue(), filename)
+
+
+class _ImageCache(object):
+    """
+    Process-wide, size-bounded least-recently-used cache of |Image| objects,
+    so an image used in many presentations is read, hashed and inspected
+    only once, however many presentations are made in the process. An image
+    loaded from a path is keyed by that path along with the size and
+    modification time of the file, so a file that has changed is loaded
+    again. An image loaded from a stream is keyed by the SHA1 hash of its
+    contents. Images are evicted, least recently used first, when their
+    blobs together take more than *max_bytes*. A *max_bytes* of 0, the
+    default, disables the cache.
+    """
+    def __init__(self, max_bytes=0):
+        super(_ImageCache, self).__init__()
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """
+        Remove every image from this cache.
+        """
+        with self._lock:
+            self._images.clear()
+            self._nbytes = 0
+
+    def get(self, key):
+        """
+        Return the image cached under *key*, or |None| if there isn't one or
+        *key* is |None|.
+        """
+        if key is None:
+            return None
+        with self._lock:
+            image = self._images.pop(key, None)
+            if image is not None:
+                self._images[key] = image
+        return image
+
+    @staticmethod
+    def key_for_blob(blob):
+        """
+        Return the cache key for an image having *blob* as its contents.
+        """
+        return ('sha1', hashlib.sha1(blob).hexdigest())
+
+    @staticmethod
+    def key_for_path(path):
+        """
+        Return the cache key for the image file at *path*, which changes
+        whenever the file is replaced or written to.
+        """
+        st = os.stat(path)
+        mtime = getattr(st, 'st_mtime_ns', st.st_mtime)
+        return ('path', os.path.abspath(path), st.st_ino, st.st_size, mtime)
+
+    def put(self, key, image):
+        """
+        Add *image* to this cache under *key*, evicting the least recently
+        used images as needed to keep within :attr:`max_bytes`. An image
+        larger than that, or having a *key* of |None|, is not cached.
+        """
+        nbytes = len(image.blob)
+        if key is None or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            replaced = self._images.pop(key, None)
+            if replaced is not None:
+                self._nbytes -= len(replaced.blob)
+            self._images[key] = image
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                evicted = self._images.popitem(last=False)[1]
+                self._nbytes -= len(evicted.blob)
+
+
+# disabled until its max_bytes is set
+image_cache = _ImageCache()
+
+
+def _native_size(px_size, dpi):
+    """
+    Return the (width, height) 2-tuple of the native size in EMU of an image
+    of *px_size* pixels at a resolution of *dpi*, both 2-tuples.
+    """
+    EMU_PER_INCH = 914400
+    horz_dpi, vert_dpi = dpi
+    width_px, height_px = px_size
+
+    width = EMU_PER_INCH * width_px / horz_dpi
+    height = EMU_PER_INCH * height_px / vert_dpi
+
+    return width, height
+
+
+def _scale(native_size, scaled_cx, scaled_cy):
+    """
+    Return scaled image dimensions in EMU for an image of *native_size*, as
+    described for :meth:`ImagePart.scale`.
+    """
+    image_cx, image_cy = native_size
+
+    if scaled_cx is None and scaled_cy is None:
+        scaled_cx = image_cx
+        scaled_cy = image_cy
+    elif scaled_cx is None:
+        scaling_factor = float(scaled_cy) / float(image_cy)
+        scaled_cx = int(round(image_cx * scaling_factor))
+    elif scaled_cy is None:
+        scaling_factor = float(scaled_cx) / float(image_cx)
+        scaled_cy = int(round(image_cy * scaling_factor))
+
+    return scaled_cx, scaled_cy
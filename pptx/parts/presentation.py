@@ -6,6 +6,8 @@ Presentation part, the main part in a .pptx package.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
@@ -19,6 +21,9 @@ class PresentationPart(XmlPart):
     Top level class in object model, represents the contents of the /ppt
     directory of a .pptx file.
     """
+
+    _cached_slide_ids = None
+
     def add_slide(self, slide_layout):
         """
         Return an (rId, slide) pair of a newly created blank slide that
@@ -30,6 +35,40 @@ class PresentationPart(XmlPart):
         rId = self.relate_to(slide_part, RT.SLIDE)
         return rId, slide_part.slide
 
+    def add_slides(self, slide_layout, count):
+        """
+        Return a list of (rId, slide) pairs of *count* newly created slides
+        that inherit appearance from *slide_layout*, each having the
+        placeholders :meth:`SlideShapes.clone_layout_placeholders` would add.
+        The placeholders are cloned from the layout only once, for the first
+        slide, and each other slide gets a copy of its XML. The partnames
+        and rIds of the slides are allocated in a single pass.
+        """
+        if count < 1:
+            return []
+        first = len(self._element.get_or_add_sldIdLst()) + 1
+        partnames = [
+            PackURI('/ppt/slides/slide%d.xml' % n)
+            for n in range(first, first+count)
+        ]
+        slide_layout_part = slide_layout.part
+        slide_part = SlidePart.new(
+            partnames[0], self.package, slide_layout_part
+        )
+        slide_part.slide.shapes.clone_layout_placeholders(slide_layout)
+        sld = slide_part.slide.element
+        slide_parts = [slide_part] + [
+            SlidePart.new(
+                partname, self.package, slide_layout_part, deepcopy(sld)
+            )
+            for partname in partnames[1:]
+        ]
+        rels = self.rels.add_relationships(RT.SLIDE, slide_parts)
+        return [
+            (rel.rId, slide_part.slide)
+            for rel, slide_part in zip(rels, slide_parts)
+        ]
+
     @property
     def core_properties(self):
         """
@@ -43,10 +82,10 @@ class PresentationPart(XmlPart):
         Return the |Slide| object identified by *slide_id* (in this
         presentation), or |None| if not found.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_parts[sldId.rId].slide
-        return None
+        rId = self._slide_ids.rIds.get(slide_id)
+        if rId is None:
+            return None
+        return self.related_parts[rId].slide
 
     @lazyproperty
     def notes_master(self):
@@ -109,23 +148,33 @@ class PresentationPart(XmlPart):
                 '/ppt/slides/slide%d.xml' % (idx+1)
             )
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, workers=None,
+             append=False):
         """
         Save this presentation package to *path_or_stream*, which can be
         either a path to a filesystem location (a string) or a file-like
-        object.
+        object. *compression*, *workers* and *append* are as described for
+        :meth:`Presentation.save`.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, compression, workers, append)
 
     def slide_id(self, slide_part):
         """
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
-                return sldId.id
-        raise ValueError('matching slide_part not found')
+        return self._slide_ids.slide_ids[self.slide_index(slide_part)]
+
+    def slide_index(self, slide_part):
+        """
+        Return the zero-based position of *slide_part* in the slide sequence
+        of this presentation, raising |ValueError| if it is not one of its
+        slides.
+        """
+        try:
+            return self._slide_ids.positions[slide_part]
+        except KeyError:
+            raise ValueError('matching slide_part not found')
 
     @property
     def _next_slide_partname(self):
@@ -137,3 +186,47 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = '/ppt/slides/slide%d.xml' % (len(sldIdLst)+1)
         return PackURI(partname_str)
+
+    @property
+    def _slide_ids(self):
+        """
+        |_SlideIds| index of the slides of this presentation. It is built the
+        first time it's needed and again only after a slide is added, moved
+        or removed, a slide id is changed or a relationship of this part is
+        added, removed or retargeted, so finding a slide by id and the id
+        and position of a slide part don't search the slide list each time.
+        """
+        sldIdLst = self._element.sldIdLst
+        key = (
+            sldIdLst,
+            None if sldIdLst is None else sldIdLst.child_generation,
+            self._element.key_generation,
+            self.rels.generation,
+        )
+        slide_ids = self._cached_slide_ids
+        if slide_ids is None or slide_ids.key != key:
+            sldIds = () if sldIdLst is None else sldIdLst.sldId_lst
+            slide_ids = _SlideIds(key, sldIds, self.related_parts)
+            self._cached_slide_ids = slide_ids
+        return slide_ids
+
+
+class _SlideIds(object):
+    """
+    Index of the ``<p:sldId>`` elements *sldIds* of a presentation, mapping
+    each slide id to its rId and each slide part to its position, the part
+    of each rId being looked up in *related_parts*. *key* identifies the
+    state of the slide list it was built from. The first slide having an id
+    or part is the one indexed when more than one does.
+    """
+
+    __slots__ = ('key', 'positions', 'rIds', 'slide_ids')
+
+    def __init__(self, key, sldIds, related_parts):
+        super(_SlideIds, self).__init__()
+        self.key = key
+        self.slide_ids = [sldId.id for sldId in sldIds]
+        self.rIds, self.positions = {}, {}
+        for idx, sldId in reversed(list(enumerate(sldIds))):
+            self.rIds[sldId.id] = sldId.rId
+            self.positions[related_parts[sldId.rId]] = idx
@@ -31,18 +31,52 @@ class BaseSlidePart(XmlPart):
         """
         return self.related_parts[rId].image
 
-    def get_or_add_image_part(self, image_file):
+    def get_or_add_image_part(self, image_file, scaled_cx=None,
+                              scaled_cy=None, downsampling=None):
         """
         Return an ``(image_part, rId)`` 2-tuple corresponding to an
         |ImagePart| object containing the image in *image_file*, and related
         to this slide with the key *rId*. If either the image part or
         relationship already exists, they are reused, otherwise they are
-        newly created.
+        newly created. *scaled_cx*, *scaled_cy* and *downsampling* are as
+        for :meth:`Package.get_or_add_image_part`.
         """
-        image_part = self._package.get_or_add_image_part(image_file)
+        image_part = self._package.get_or_add_image_part(
+            image_file, scaled_cx, scaled_cy, downsampling
+        )
         rId = self.relate_to(image_part, RT.IMAGE)
         return image_part, rId
 
+    def image_display_sizes(self, rId):
+        """
+        Return a list of the (cx, cy) sizes in EMU at which the whole of the
+        image related to this slide by *rId* is displayed by the pictures on
+        it, accounting for cropping. The list is empty when nothing on this
+        slide refers to the image. |None| is returned when it is referred to
+        other than by a picture of known size not in a group, such as by
+        a background fill, so the size it is displayed at can't be told.
+        """
+        refs = [r for r in self._element.xpath('//@r:*') if r == rId]
+        pics = self._element.xpath(
+            '//p:pic[p:blipFill/a:blip/@r:embed=$rId]', rId=rId
+        )
+        if len(pics) != len(refs):
+            return None
+        sizes = []
+        for pic in pics:
+            if pic.cx is None or pic.cy is None:
+                return None
+            if pic.xpath('ancestor::p:grpSp'):
+                return None
+            shown_x = 1.0 - pic.srcRect_l - pic.srcRect_r
+            shown_y = 1.0 - pic.srcRect_t - pic.srcRect_b
+            if shown_x <= 0.0 or shown_y <= 0.0:
+                return None
+            sizes.append((
+                int(round(pic.cx / shown_x)), int(round(pic.cy / shown_y))
+            ))
+        return sizes
+
     @property
     def name(self):
         """
@@ -155,12 +189,14 @@ class SlidePart(BaseSlidePart):
     Slide part. Corresponds to package files ppt/slides/slide[1-9][0-9]*.xml.
     """
     @classmethod
-    def new(cls, partname, package, slide_layout_part):
+    def new(cls, partname, package, slide_layout_part, sld=None):
         """
         Return a newly-created blank slide part having *partname* and related
-        to *slide_layout_part*.
+        to *slide_layout_part*. When *sld* is not |None|, it is used as the
+        ``<p:sld>`` element of the new part rather than a blank one.
         """
-        sld = CT_Slide.new()
+        if sld is None:
+            sld = CT_Slide.new()
         slide_part = cls(partname, CT.PML_SLIDE, sld, package)
         slide_part.relate_to(slide_layout_part, RT.SLIDE_LAYOUT)
         return slide_part
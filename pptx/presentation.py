@@ -21,6 +21,18 @@ class Presentation(PartElementProxy):
 
     __slots__ = ('_slide_masters', '_slides')
 
+    def compact_media(self, downsampling=None):
+        """
+        Reduce the images in this presentation to those needed. Each image
+        relationship left behind by a deleted picture is dropped, and each
+        picture showing an image that is byte-for-byte the same as another
+        is made to share a single copy of it. When *downsampling* is
+        a |DownsamplePolicy| object, each image is also downsampled by it
+        for the largest size a picture shows it at. The images removed are
+        not written when the presentation is saved.
+        """
+        self.part.package.compact_media(downsampling)
+
     @property
     def core_properties(self):
         """
@@ -29,6 +41,45 @@ class Presentation(PartElementProxy):
         """
         return self.part.core_properties
 
+    @property
+    def cache_shape_proxies(self):
+        """
+        |True| if the shape collections of this presentation return the
+        same shape object each time a shape is accessed, for example on each
+        pass over ``slide.shapes``, rather than a new one. Code that reads
+        the shapes of a large presentation many times then creates far fewer
+        objects. |False|, the default, creates a new shape object for each
+        access, so no shape object is kept after it's been used.
+
+        The shape objects cached by a collection are all discarded together
+        when a shape element is added to or removed from its shape tree, or
+        the ``id``, ``name`` or ``idx`` attribute of an element in the tree
+        is changed, and when this setting changes. Other changes to a shape
+        keep its cached object, which reads the changed XML. A change made
+        to the XML with lxml functions, rather than through this package,
+        is not seen, and may leave a cached object for a shape element that
+        has been removed.
+        """
+        return self.part.package.cache_shape_proxies
+
+    @cache_shape_proxies.setter
+    def cache_shape_proxies(self, value):
+        self.part.package.cache_shape_proxies = bool(value)
+
+    @property
+    def image_downsampling(self):
+        """
+        |DownsamplePolicy| object applied to each image added to this
+        presentation, unless another is specified when it is added, or
+        |None|, the default, to add images as they are. Images already in
+        the presentation are not affected by assignment to this property.
+        """
+        return self.part.package.image_downsampling
+
+    @image_downsampling.setter
+    def image_downsampling(self, downsampling):
+        self.part.package.image_downsampling = downsampling
+
     @property
     def notes_master(self):
         """
@@ -38,12 +89,35 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def save(self, file, compression=None, workers=None, append=False):
         """
         Save this presentation to *file*, where *file* can be either a path
-        to a file (a string) or a file-like object.
-        """
-        self.part.save(file)
+        to a file (a string) or a file-like object. A file-like object need
+        not be seekable; the package is then written in a single forward
+        pass, for example straight to a pipe, socket or HTTP response body.
+
+        When *compression* is an integer from 0 to 9, it is the deflate level
+        used for each member of the package, and members whose content is
+        already compressed, such as JPEG and PNG images and embedded Excel
+        workbooks, are stored without compression. A level of 0 stores every
+        member. By default, every member is deflated at the default level.
+
+        When *workers* is a positive integer, parts are serialized and
+        compressed in a pool of that many threads, which can shorten the save
+        of a large deck on a multi-core machine. Members are written in the
+        same order either way.
+
+        When *append* is |True|, this presentation must have been opened
+        from a path with ``lazy=True`` or ``use_mmap=True``, since only then
+        does it keep reading from that file, and *file* must be that same
+        path; |ValueError| is raised otherwise. That file is updated in
+        place: only the parts and relationships changed since it was opened
+        are written, after the members already in the file, and the central
+        directory is rewritten to refer to them. This makes saving a small
+        change to a very large deck quick. The members superseded are left
+        in the file as dead space, which :func:`pptx.api.compact` reclaims.
+        """
+        self.part.save(file, compression, workers, append)
 
     @property
     def slide_height(self):
@@ -276,6 +276,9 @@ class Shape(BaseShape):
     that can appear in any of the slide-type parts (slide, slideLayout,
     slideMaster, notesPage, notesMaster, handoutMaster).
     """
+
+    __slots__ = ('_sp', '_adjustments', '_fill', '_line')
+
     def __init__(self, sp, parent):
         super(Shape, self).__init__(sp, parent)
         self._sp = sp
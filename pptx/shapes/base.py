@@ -16,6 +16,9 @@ class BaseShape(object):
     Base class for shape objects, including |Shape|, |Picture|, and
     |GraphicFrame|.
     """
+
+    __slots__ = ('_element', '_parent', '_click_action')
+
     def __init__(self, shape_elm, parent):
         super(BaseShape, self).__init__()
         self._element = shape_elm
@@ -196,6 +199,9 @@ class _PlaceholderFormat(ElementProxy):
     a placeholder shape, provides properties specific to placeholders, such
     as the placeholder type.
     """
+
+    __slots__ = ()
+
     @property
     def element(self):
         """
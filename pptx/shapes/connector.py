@@ -20,6 +20,9 @@ class Connector(BaseShape):
     that can be connected to other objects (but not to other connectors).
     A line can be straight, have elbows, or can be curved.
     """
+
+    __slots__ = ()
+
     def begin_connect(self, shape, cxn_pt_idx):
         """
         **EXPERIMENTAL** - *The current implementation only works properly
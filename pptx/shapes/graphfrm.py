@@ -17,6 +17,9 @@ class GraphicFrame(BaseShape):
     Container shape for table, chart, smart art, and media objects.
     Corresponds to a ``<p:graphicFrame>`` element in the shape tree.
     """
+
+    __slots__ = ()
+
     @property
     def chart(self):
         """
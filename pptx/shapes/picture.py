@@ -15,6 +15,9 @@ class Picture(BaseShape):
     A picture shape, one that places an image on a slide. Corresponds to the
     ``<p:pic>`` element.
     """
+
+    __slots__ = ('_pic', '_line')
+
     def __init__(self, pic, parent):
         super(Picture, self).__init__(pic, parent)
         self._pic = pic
@@ -16,6 +16,7 @@ from ..enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from .graphfrm import GraphicFrame
 from ..oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from ..oxml.shapes.picture import CT_Picture
+from ..parts.image import Image
 from .picture import Picture
 from ..util import Emu
 
@@ -29,6 +30,9 @@ class _InheritsDimensions(object):
     by all subclasses to provide lookup of the appropriate base placeholder
     to inherit from.
     """
+
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -129,6 +133,9 @@ class _BaseSlidePlaceholder(_InheritsDimensions, Shape):
     Base class for placeholders on slides. Provides common behaviors such as
     inherited dimensions.
     """
+
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -181,6 +188,9 @@ class BasePlaceholder(Shape):
     Base class for placeholder subclasses that differentiate the varying
     behaviors of placeholders on a master, layout, and slide.
     """
+
+    __slots__ = ()
+
     @property
     def idx(self):
         """
@@ -217,6 +227,9 @@ class LayoutPlaceholder(_InheritsDimensions, Shape):
     from the master placeholder having the same type, when a matching one
     exists.
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -247,12 +260,17 @@ class MasterPlaceholder(BasePlaceholder):
     Placeholder shape on a slide master.
     """
 
+    __slots__ = ()
+
 
 class NotesSlidePlaceholder(_InheritsDimensions, Shape):
     """
     Placeholder shape on a notes slide. Inherits shape properties from the
     placeholder on the notes master that has the same type (e.g. 'body').
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -271,11 +289,16 @@ class SlidePlaceholder(_BaseSlidePlaceholder):
     corresponding slide layout placeholder.
     """
 
+    __slots__ = ()
+
 
 class ChartPlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a chart.
     """
+
+    __slots__ = ()
+
     def insert_chart(self, chart_type, chart_data):
         """
         Return a |PlaceholderGraphicFrame| object containing a new chart of
@@ -310,7 +333,10 @@ class PicturePlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a picture.
     """
-    def insert_picture(self, image_file):
+
+    __slots__ = ()
+
+    def insert_picture(self, image_file, downsampling=None):
         """
         Return a |PlaceholderPicture| object depicting the image in
         *image_file*, which may be either a path (string) or a file-like
@@ -319,38 +345,74 @@ class PicturePlaceholder(_BaseSlidePlaceholder):
         methods of a |Picture| shape except that the value of its
         :attr:`~._BaseSlidePlaceholder.shape_type` property is
         `MSO_SHAPE_TYPE.PLACEHOLDER` instead of `MSO_SHAPE_TYPE.PICTURE`.
+
+        When *downsampling* is a |DownsamplePolicy| object, an image with
+        more pixels than needed to fill this placeholder is downsampled by it
+        before it is added. When *downsampling* is |None|,
+        :attr:`Presentation.image_downsampling` applies, and when it is
+        |False| the image is added as it is.
         """
-        pic = self._new_placeholder_pic(image_file)
+        pic = self._new_placeholder_pic(image_file, downsampling)
         self._replace_placeholder_with(pic)
         return PlaceholderPicture(pic, self._parent)
 
-    def _new_placeholder_pic(self, image_file):
+    def _new_placeholder_pic(self, image_file, downsampling=None):
         """
         Return a new `p:pic` element depicting the image in *image_file*,
         suitable for use as a placeholder. In particular this means not
         having an `a:xfrm` element, allowing its extents to be inherited from
-        its layout placeholder.
+        its layout placeholder. *downsampling* is as for
+        :meth:`insert_picture`.
         """
-        rId, desc, image_size = self._get_or_add_image(image_file)
+        rId, desc, image_size = self._get_or_add_image(
+            image_file, downsampling
+        )
         id_, name = self.id, self.name
         pic = CT_Picture.new_ph_pic(id_, name, desc, rId)
         pic.crop_to_fit(image_size, (self.width, self.height))
         return pic
 
-    def _get_or_add_image(self, image_file):
+    def _get_or_add_image(self, image_file, downsampling=None):
         """
         Return an (rId, description, image_size) 3-tuple identifying the
         related image part containing *image_file* and describing the image.
-        """
-        image_part, rId = self.part.get_or_add_image_part(image_file)
+        When the image is downsampled, by *downsampling* or otherwise by the
+        policy of the presentation, it is downsampled for the size it is
+        displayed at when cropped to fill this placeholder.
+        """
+        image = Image.from_file(image_file)
+        scaled_cx, scaled_cy = self._fill_extents(image.size)
+        image_part, rId = self.part.get_or_add_image_part(
+            image, scaled_cx, scaled_cy, downsampling
+        )
         desc, image_size = image_part.desc, image_part._px_size
         return rId, desc, image_size
 
+    def _fill_extents(self, image_size):
+        """
+        Return the (scaled_cx, scaled_cy) 2-tuple of the size in EMU an image
+        of *image_size* pixels is scaled to so it fills this placeholder, as
+        accepted by :meth:`SlidePart.get_or_add_image_part`. The dimension
+        that overflows the placeholder, and is cropped, is |None|, to be
+        worked out from the aspect ratio of the image. Both are |None| when
+        this placeholder has no size.
+        """
+        width, height = self.width, self.height
+        if not width or not height:
+            return None, None
+        width_px, height_px = image_size
+        if width_px * height < height_px * width:
+            return width, None
+        return None, height
+
 
 class PlaceholderGraphicFrame(GraphicFrame):
     """
     Placeholder shape populated with a table, chart, or smart art.
     """
+
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -364,6 +426,9 @@ class PlaceholderPicture(_InheritsDimensions, Picture):
     """
     Placeholder shape populated with a picture.
     """
+
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -377,6 +442,9 @@ class TablePlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a picture.
     """
+
+    __slots__ = ()
+
     def insert_table(self, rows, cols):
         """
         Return a |PlaceholderGraphicFrame| object containing a table of
@@ -23,6 +23,7 @@ from .placeholder import (
     PlaceholderPicture, SlidePlaceholder, TablePlaceholder
 )
 from ..shared import ParentedElementProxy
+from ..util import lazyproperty
 
 
 def BaseShapeFactory(shape_elm, parent):
@@ -44,27 +45,31 @@ class _BaseShapes(ParentedElementProxy):
     Base class for a shape collection appearing in a slide-type object,
     include Slide, SlideLayout, and SlideMaster, providing common methods.
     """
+
+    __slots__ = ('_spTree', '_cached_index')
+
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
+        self._cached_index = None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._index.shape_elms[idx]
         except IndexError:
             raise IndexError('shape index out of range')
-        return self._shape_factory(shape_elm)
+        return self._shape(shape_elm)
 
     def __iter__(self):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
-        for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+        if self._index.proxies is not None:
+            return (self._shape(e) for e in self._index.shape_elms)
+        return (self._shape_factory(e) for e in self._iter_member_elms())
 
     def __len__(self):
         """
@@ -72,8 +77,7 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._index.shape_elms)
 
     def clone_placeholder(self, placeholder):
         """
@@ -87,6 +91,28 @@ class _BaseShapes(ParentedElementProxy):
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
+    def get_by_id(self, shape_id, default=None):
+        """
+        Return the shape in this collection having *shape_id*, or *default*
+        if there is none. A shape in a group is not a member of the
+        collection, so it is not found.
+        """
+        shape_elm = self._index.by_id.get(shape_id)
+        if shape_elm is None:
+            return default
+        return self._shape(shape_elm)
+
+    def get_by_name(self, name, default=None):
+        """
+        Return the first shape in this collection named *name*, or
+        *default* if there is none. A shape in a group is not a member of
+        the collection, so it is not found.
+        """
+        shape_elm = self._index.by_name.get(name)
+        if shape_elm is None:
+            return default
+        return self._shape(shape_elm)
+
     def ph_basename(self, ph_type):
         """
         Return the base name for a placeholder of *ph_type* in this shape
@@ -112,6 +138,34 @@ class _BaseShapes(ParentedElementProxy):
             PP_PLACEHOLDER.TITLE:        'Title',
         }[ph_type]
 
+    @property
+    def _caches_proxies(self):
+        """
+        True if the package containing this collection caches shape proxies.
+        """
+        return self.part.package.cache_shape_proxies
+
+    @property
+    def _index(self):
+        """
+        |_ShapeIndex| of the shapes in this collection. It is built the
+        first time it's needed and again only after a child of the shape
+        tree is added or removed or an id, name or idx attribute is changed,
+        so indexing this collection and looking up a shape by id or name
+        don't search the shape tree each time. Shape proxies cached in it
+        are discarded with it.
+        """
+        spTree = self._spTree
+        caches_proxies = self._caches_proxies
+        key = (spTree.child_generation, spTree.key_generation, caches_proxies)
+        index = self._cached_index
+        if index is None or index.key != key:
+            index = _ShapeIndex(
+                key, self._iter_member_elms(), {} if caches_proxies else None
+            )
+            self._cached_index = index
+        return index
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -162,13 +216,26 @@ class _BaseShapes(ParentedElementProxy):
         Next available positive integer drawing object id in shape tree,
         starting from 1 and making use of any gaps in numbering. In practice,
         the minimum id is 2 because the spTree element is always assigned
-        id="1".
+        id="1". The ids in use are read from the XML only once and then kept
+        up to date as shapes are added and removed, so adding many shapes
+        doesn't search the shape tree for each one.
+        """
+        return self._spTree.lowest_free_id
+
+    def _shape(self, shape_elm):
+        """
+        Return the shape proxy object for *shape_elm*, a member of this
+        collection. When the presentation caches shape proxies, the same
+        object is returned for *shape_elm* until this collection's index is
+        rebuilt; otherwise a new one is returned each time.
         """
-        id_str_lst = self._spTree.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
+        proxies = self._index.proxies
+        if proxies is None:
+            return self._shape_factory(shape_elm)
+        shape = proxies.get(shape_elm)
+        if shape is None:
+            shape = proxies[shape_elm] = self._shape_factory(shape_elm)
+        return shape
 
     def _shape_factory(self, shape_elm):
         """
@@ -178,6 +245,52 @@ class _BaseShapes(ParentedElementProxy):
         return BaseShapeFactory(shape_elm, self)
 
 
+class _ShapeIndex(object):
+    """
+    The sequence of member shape elements *shape_elms* of a shape collection,
+    indexed by position, shape id and name. *key* identifies the state of
+    the shape tree it was built from. *proxies* is the dict in which the
+    shape proxy for each element is kept once it's been created, or |None|
+    when shape proxies are not cached.
+    """
+    def __init__(self, key, shape_elms, proxies=None):
+        super(_ShapeIndex, self).__init__()
+        self.key = key
+        self.shape_elms = list(shape_elms)
+        self.proxies = proxies
+
+    @lazyproperty
+    def by_id(self):
+        """
+        Dict mapping the shape id of each shape element to the element.
+        """
+        return self._index_by(lambda cNvPr: cNvPr.id)
+
+    @lazyproperty
+    def by_name(self):
+        """
+        Dict mapping the name of each shape element to the element, the
+        first one having it when more than one does.
+        """
+        return self._index_by(lambda cNvPr: cNvPr.name)
+
+    @lazyproperty
+    def positions(self):
+        """
+        Dict mapping each shape element to its position in the sequence.
+        """
+        return dict(
+            (shape_elm, idx) for idx, shape_elm in enumerate(self.shape_elms)
+        )
+
+    def _index_by(self, key_of):
+        index = {}
+        for shape_elm in reversed(self.shape_elms):
+            for cNvPr in shape_elm.xpath('./*[1]/p:cNvPr'):
+                index[key_of(cNvPr)] = shape_elm
+        return index
+
+
 class BasePlaceholders(_BaseShapes):
     """
     Base class for placeholder collections that differentiate behaviors for
@@ -185,6 +298,9 @@ class BasePlaceholders(_BaseShapes):
     constructed using |BaseShapeFactory|. Subclasses should override
     :method:`_shape_factory` to use custom placeholder classes.
     """
+
+    __slots__ = ()
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -198,6 +314,9 @@ class LayoutPlaceholders(BasePlaceholders):
     Sequence of |LayoutPlaceholder| instances representing the placeholder
     shapes on a slide layout.
     """
+
+    __slots__ = ()
+
     def get(self, idx, default=None):
         """
         Return the first placeholder shape with matching *idx* value, or
@@ -233,6 +352,9 @@ class LayoutShapes(_BaseShapes):
     sequence is the backmost in z-order and the last shape is topmost.
     Supports indexed access, len(), index(), and iteration.
     """
+
+    __slots__ = ()
+
     def _shape_factory(self, shape_elm):
         """
         Return an instance of the appropriate shape proxy class for
@@ -246,6 +368,9 @@ class MasterPlaceholders(BasePlaceholders):
     Sequence of _MasterPlaceholder instances representing the placeholder
     shapes on a slide master.
     """
+
+    __slots__ = ()
+
     def get(self, ph_type, default=None):
         """
         Return the first placeholder shape with type *ph_type* (e.g. 'body'),
@@ -271,6 +396,9 @@ class MasterShapes(_BaseShapes):
     sequence is the backmost in z-order and the last shape is topmost.
     Supports indexed access, len(), and iteration.
     """
+
+    __slots__ = ()
+
     def _shape_factory(self, shape_elm):
         """
         Return an instance of the appropriate shape proxy class for
@@ -294,6 +422,9 @@ class NotesSlidePlaceholders(MasterPlaceholders):
     """
     Sequence of placeholder shapes on a notes slide.
     """
+
+    __slots__ = ()
+
     def _shape_factory(self, placeholder_elm):
         """
         Return an instance of the appropriate placeholder proxy class for
@@ -319,6 +450,9 @@ class NotesSlideShapes(_BaseShapes):
     sequence is the backmost in z-order and the last shape is topmost.
     Supports indexed access, len(), index(), and iteration.
     """
+
+    __slots__ = ()
+
     def ph_basename(self, ph_type):
         """
         Return the base name for a placeholder of *ph_type* in this shape
@@ -371,7 +505,11 @@ class SlidePlaceholders(ParentedElementProxy):
     placeholders it contains.
     """
 
-    __slots__ = ()
+    __slots__ = ('_cached_index',)
+
+    def __init__(self, element, parent):
+        super(SlidePlaceholders, self).__init__(element, parent)
+        self._cached_index = None
 
     def __getitem__(self, idx):
         """
@@ -380,25 +518,69 @@ class SlidePlaceholders(ParentedElementProxy):
         |KeyError| if no placeholder with that idx value is in the
         collection.
         """
-        for e in self._element.iter_ph_elms():
-            if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
-        raise KeyError('no placeholder on this slide with idx == %d' % idx)
+        _, by_idx, _ = self._index
+        if idx not in by_idx:
+            raise KeyError(
+                'no placeholder on this slide with idx == %d' % idx
+            )
+        return self._placeholder(by_idx[idx])
 
     def __iter__(self):
         """
         Generate placeholder shapes in `idx` order.
         """
-        ph_elms = sorted(
-            [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
-        )
-        return (SlideShapeFactory(e, self) for e in ph_elms)
+        ph_elms, _, _ = self._index
+        return (self._placeholder(e) for e in ph_elms)
 
     def __len__(self):
         """
         Return count of placeholder shapes.
         """
-        return len(list(self._element.iter_ph_elms()))
+        ph_elms, _, _ = self._index
+        return len(ph_elms)
+
+    @property
+    def _caches_proxies(self):
+        """
+        True if the package containing this collection caches shape proxies.
+        """
+        return self.part.package.cache_shape_proxies
+
+    @property
+    def _index(self):
+        """
+        A `(ph_elms, by_idx, proxies)` 3-tuple of the placeholder elements
+        on this slide in `idx` order, a dict mapping each `idx` value to the
+        first placeholder element having it, and the dict caching the
+        placeholder proxy of each element, or |None| when proxies are not
+        cached. Like the index of a shape collection, it is rebuilt only
+        after the shape tree changes.
+        """
+        spTree = self._element
+        caches_proxies = self._caches_proxies
+        key = (spTree.child_generation, spTree.key_generation, caches_proxies)
+        if self._cached_index is None or self._cached_index[0] != key:
+            ph_elms = list(spTree.iter_ph_elms())
+            by_idx = {}
+            for e in reversed(ph_elms):
+                by_idx[e.ph_idx] = e
+            ph_elms.sort(key=lambda e: e.ph_idx)
+            proxies = {} if caches_proxies else None
+            self._cached_index = (key, ph_elms, by_idx, proxies)
+        return self._cached_index[1:]
+
+    def _placeholder(self, ph_elm):
+        """
+        Return the placeholder proxy object for *ph_elm*, the same one each
+        time while the index holding it is current when proxies are cached.
+        """
+        proxies = self._index[2]
+        if proxies is None:
+            return SlideShapeFactory(ph_elm, self)
+        placeholder = proxies.get(ph_elm)
+        if placeholder is None:
+            placeholder = proxies[ph_elm] = SlideShapeFactory(ph_elm, self)
+        return placeholder
 
 
 def SlideShapeFactory(shape_elm, parent):
@@ -417,6 +599,9 @@ class SlideShapes(_BaseShapes):
     is the backmost in z-order and the last shape is topmost. Supports indexed
     access, len(), index(), and iteration.
     """
+
+    __slots__ = ()
+
     def add_chart(self, chart_type, x, y, cx, cy, chart_data):
         """
         Add a new chart of *chart_type* to the slide, positioned at (*x*,
@@ -445,13 +630,24 @@ class SlideShapes(_BaseShapes):
         )
         return self._shape_factory(cxnSp)
 
-    def add_picture(self, image_file, left, top, width=None, height=None):
+    def add_picture(self, image_file, left, top, width=None, height=None,
+                    downsampling=None):
         """
         Add picture shape displaying image in *image_file*, where
         *image_file* can be either a path to a file (a string) or a file-like
-        object.
-        """
-        image_part, rId = self.part.get_or_add_image_part(image_file)
+        object. When :data:`pptx.parts.image.image_cache` is enabled, an
+        image already loaded in this process is taken from it rather than
+        loaded again.
+
+        When *downsampling* is a |DownsamplePolicy| object, an image with
+        more pixels than needed to display it at *width* by *height* is
+        downsampled by it before it is added. When *downsampling* is |None|,
+        :attr:`Presentation.image_downsampling` applies, and when it is
+        |False| the image is added as it is.
+        """
+        image_part, rId = self.part.get_or_add_image_part(
+            image_file, width, height, downsampling
+        )
         pic = self._add_pic_from_image_part(
             image_part, rId, left, top, width, height
         )
@@ -505,11 +701,10 @@ class SlideShapes(_BaseShapes):
         Return the index of *shape* in this sequence, raising |ValueError| if
         *shape* is not in the collection.
         """
-        shape_elm = shape.element
-        for idx, elm in enumerate(self._spTree.iter_shape_elms()):
-            if elm is shape_elm:
-                return idx
-        raise ValueError('shape not in collection')
+        try:
+            return self._index.positions[shape.element]
+        except KeyError:
+            raise ValueError('shape not in collection')
 
     @property
     def placeholders(self):
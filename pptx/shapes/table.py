@@ -18,6 +18,9 @@ class Table(object):
     A table shape. Not intended to be constructed directly, use
     :meth:`.Slide.shapes.add_table` to add a table to a slide.
     """
+
+    __slots__ = ('_tbl', '_graphic_frame', '_columns', '_rows')
+
     def __init__(self, tbl, graphic_frame):
         super(Table, self).__init__()
         self._tbl = tbl
@@ -153,6 +156,9 @@ class _Cell(Subshape):
     """
     Table cell
     """
+
+    __slots__ = ('_tc', '_fill')
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(parent)
         self._tc = tc
@@ -272,6 +278,9 @@ class _Column(Subshape):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -293,6 +302,9 @@ class _Row(Subshape):
     """
     Table row
     """
+
+    __slots__ = ('_tr',)
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = tr
@@ -322,6 +334,9 @@ class _CellCollection(Subshape):
     """
     "Horizontal" sequence of row cells
     """
+
+    __slots__ = ('_tr',)
+
     def __init__(self, tr, parent):
         super(_CellCollection, self).__init__(parent)
         self._tr = tr
@@ -346,6 +361,9 @@ class _ColumnCollection(Subshape):
     """
     Sequence of table columns.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_ColumnCollection, self).__init__(parent)
         self._tbl = tbl
@@ -376,6 +394,9 @@ class _RowCollection(Subshape):
     """
     Sequence of table rows.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_RowCollection, self).__init__(parent)
         self._tbl = tbl
@@ -25,6 +25,9 @@ class TextFrame(Subshape):
     frame. Corresponds to the ``<p:txBody>`` element that can appear as a
     child element of ``<p:sp>``. Not intended to be constructed directly.
     """
+
+    __slots__ = ('_element', '_txBody')
+
     def __init__(self, txBody, parent):
         super(TextFrame, self).__init__(parent)
         self._element = self._txBody = txBody
@@ -266,6 +269,9 @@ class Font(object):
     appears as ``<a:defRPr>`` and ``<a:endParaRPr>`` in paragraph and
     ``<a:defRPr>`` in list style elements.
     """
+
+    __slots__ = ('_element', '_rPr', '_color', '_fill')
+
     def __init__(self, rPr):
         super(Font, self).__init__()
         self._element = self._rPr = rPr
@@ -420,6 +426,9 @@ class _Hyperlink(Subshape):
     Text run hyperlink object. Corresponds to ``<a:hlinkClick>`` child
     element of the run's properties element (``<a:rPr>``).
     """
+
+    __slots__ = ('_rPr',)
+
     def __init__(self, rPr, parent):
         super(_Hyperlink, self).__init__(parent)
         self._rPr = rPr
@@ -460,6 +469,9 @@ class _Paragraph(Subshape):
     """
     Paragraph object. Not intended to be constructed directly.
     """
+
+    __slots__ = ('_element', '_p')
+
     def __init__(self, p, parent):
         super(_Paragraph, self).__init__(parent)
         self._element = self._p = p
@@ -633,6 +645,9 @@ class _Run(Subshape):
     """
     Text run object. Corresponds to ``<a:r>`` child element in a paragraph.
     """
+
+    __slots__ = ('_r', '_hyperlink')
+
     def __init__(self, r, parent):
         super(_Run, self).__init__(parent)
         self._r = r
@@ -163,7 +163,9 @@ def lazyproperty(f):
     """
     @lazyprop decorator. Decorated method will be called only on first access
     to calculate a cached property value. After that, the cached value is
-    returned.
+    returned. The value is cached in the instance attribute named like the
+    property with a leading underscore, so a class having `__slots__` must
+    include that name in them, like `'_foobar'` for property `foobar`.
     """
     cache_attr_name = '_%s' % f.__name__  # like '_foobar' for prop 'foobar'
     docstring = f.__doc__
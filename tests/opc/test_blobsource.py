@@ -0,0 +1,66 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.opc.blobsource module
+"""
+
+from __future__ import absolute_import
+
+import pytest
+
+from zipfile import ZipFile
+
+from pptx.opc.blobsource import (
+    FileBlobSource, IterBlobSource, ZipMemberBlobSource
+)
+
+from ..unitutil.file import absjoin, test_file_dir
+
+
+test_image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+zip_pkg_path = absjoin(test_file_dir, 'test.pptx')
+
+
+class DescribeFileBlobSource(object):
+
+    def it_reads_the_file_a_chunk_at_a_time(self):
+        blob_source = FileBlobSource(test_image_path, chunk_size=1000)
+        with open(test_image_path, 'rb') as f:
+            blob = f.read()
+        chunks = list(blob_source.iter_chunks())
+        assert [len(chunk) for chunk in chunks[:-1]] == [1000] * (
+            len(blob) // 1000
+        )
+        assert b''.join(chunks) == blob
+        assert blob_source.blob == blob
+        assert blob_source.size == len(blob)
+
+
+class DescribeZipMemberBlobSource(object):
+
+    def it_reads_the_zip_member_a_chunk_at_a_time(self):
+        membername = 'ppt/slides/slide1.xml'
+        blob_source = ZipMemberBlobSource(zip_pkg_path, membername, 100)
+        with ZipFile(zip_pkg_path) as zipf:
+            blob = zipf.read(membername)
+        chunks = list(blob_source.iter_chunks())
+        assert max(len(chunk) for chunk in chunks) == 100
+        assert b''.join(chunks) == blob
+        assert blob_source.blob == blob
+        assert blob_source.size == len(blob)
+
+
+class DescribeIterBlobSource(object):
+
+    def it_generates_the_chunks_it_was_given(self):
+        blob_source = IterBlobSource([b'foo', b'bar'], size=6)
+        assert list(blob_source.iter_chunks()) == [b'foo', b'bar']
+        assert blob_source.blob == b'foobar'
+        assert blob_source.size == 6
+
+    def it_can_read_an_iterator_only_once(self):
+        blob_source = IterBlobSource(iter([b'foo', b'bar']))
+        assert blob_source.size is None
+        assert blob_source.blob == b'foobar'
+        with pytest.raises(ValueError):
+            blob_source.blob
@@ -8,23 +8,32 @@ from __future__ import absolute_import
 
 import pytest
 
-from pptx.opc.oxml import CT_Relationships
+from zipfile import ZipFile
+
+from pptx.compat import BytesIO
+from pptx.opc.blobsource import IterBlobSource
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
-    OpcPackage, Part, PartFactory, _Relationship, RelationshipCollection,
-    Unmarshaller, XmlPart
+    OpcPackage, Part, PartFactory, _PartnameIndex, _Relationship,
+    RelationshipCollection, Unmarshaller, XmlPart
 )
 from pptx.opc.pkgreader import PackageReader
 from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.package import Package
 
 from ..unitutil.cxml import element
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call, class_mock, cls_attr_mock, function_mock, initializer_mock,
     instance_mock, loose_mock, method_mock, Mock, patch, PropertyMock
 )
 
 
+test_pptx_path = absjoin(test_file_dir, 'test.pptx')
+
+
 class DescribeOpcPackage(object):
 
     def it_can_open_a_pkg_file(self, PackageReader_, PartFactory_,
@@ -35,16 +44,166 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(
+            pkg_file, False, False
+        )
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
 
+    def it_can_open_a_pkg_file_lazily(self, PackageReader_, Unmarshaller_):
+        pkg_file = Mock(name='pkg_file')
+        pkg = OpcPackage.open(pkg_file, lazy=True)
+        PackageReader_.from_file.assert_called_once_with(
+            pkg_file, True, False
+        )
+        assert pkg._source_pkg_file is pkg_file
+
+    def it_can_open_a_pkg_file_memory_mapped(self):
+        pkg = OpcPackage.open(test_pptx_path, use_mmap=True)
+        assert pkg._source_pkg_file == test_pptx_path
+        stream = BytesIO()
+        pkg.save(stream)
+        with pytest.raises(ValueError):
+            pkg.save(test_pptx_path)
+        assert ZipFile(stream).testzip() is None
+
+    def it_reads_lazily_loaded_parts_only_on_access(self):
+        pkg = OpcPackage.open(test_pptx_path, lazy=True)
+        prs_part = pkg.main_document_part
+        parsed = [
+            part for part in pkg.iter_parts()
+            if isinstance(part, XmlPart) and part._elm is not None
+        ]
+        assert parsed == []
+        prs_part._element
+        assert prs_part._elm is not None
+        assert prs_part.blob == ZipFile(test_pptx_path).read(
+            'ppt/presentation.xml'
+        )
+
+    def it_copies_untouched_parts_when_saving_a_lazy_package(self):
+        pkg = OpcPackage.open(test_pptx_path, lazy=True)
+        pkg.main_document_part._element
+        stream = BytesIO()
+        pkg.save(stream)
+
+        source = ZipFile(test_pptx_path)
+        saved = ZipFile(stream)
+        assert saved.testzip() is None
+        for zipinfo in saved.infolist():
+            name = zipinfo.filename
+            if name in ('[Content_Types].xml', 'ppt/presentation.xml'):
+                continue
+            if name.endswith('.rels'):
+                continue
+            source_info = source.getinfo(name)
+            assert zipinfo.CRC == source_info.CRC
+            assert zipinfo.compress_size == source_info.compress_size
+            assert saved.read(name) == source.read(name)
+        prs_part = pkg.main_document_part
+        assert saved.read('ppt/presentation.xml') == prs_part.blob
+
+    def it_copies_untouched_xml_parts_when_saving_an_eager_package(self):
+        pkg = OpcPackage.open(test_pptx_path)
+        prs_part = pkg.main_document_part
+        prs_part._element.append(prs_part._element[0])
+        stream = BytesIO()
+        pkg.save(stream)
+
+        source = ZipFile(test_pptx_path)
+        saved = ZipFile(stream)
+        assert saved.testzip() is None
+        xml_parts = [
+            part for part in pkg.iter_parts()
+            if isinstance(part, XmlPart) and part is not prs_part
+        ]
+        assert xml_parts
+        for part in xml_parts:
+            name = part.partname.membername
+            assert part._elm is None
+            assert saved.getinfo(name).compress_size == (
+                source.getinfo(name).compress_size
+            )
+            assert saved.read(name) == source.read(name)
+        assert saved.read('ppt/presentation.xml') == prs_part.blob
+        assert prs_part.blob != source.read('ppt/presentation.xml')
+
+    def it_can_save_parts_using_a_pool_of_threads(self):
+        pkg = OpcPackage.open(test_pptx_path)
+        stream, parallel_stream = BytesIO(), BytesIO()
+        pkg.save(stream)
+        pkg.save(parallel_stream, workers=3)
+
+        zipf, parallel_zipf = ZipFile(stream), ZipFile(parallel_stream)
+        assert parallel_zipf.testzip() is None
+        assert parallel_zipf.namelist() == zipf.namelist()
+        for name in zipf.namelist():
+            assert parallel_zipf.read(name) == zipf.read(name)
+
+    def it_can_save_in_place_by_appending_what_changed(self, tmp_pptx):
+        source = ZipFile(tmp_pptx)
+        source_infos = dict(
+            (zipinfo.filename, zipinfo) for zipinfo in source.infolist()
+        )
+        source.close()
+        pkg = OpcPackage.open(tmp_pptx, lazy=True)
+        prs_part = pkg.main_document_part
+        prs_part._element.set('firstSlideNum', '5')
+        pkg.save(tmp_pptx, append=True)
+
+        saved = ZipFile(tmp_pptx)
+        assert saved.testzip() is None
+        assert sorted(saved.namelist()) == sorted(source_infos)
+        for zipinfo in saved.infolist():
+            name = zipinfo.filename
+            moved = zipinfo.header_offset != source_infos[name].header_offset
+            assert moved is (
+                name in ('[Content_Types].xml', 'ppt/presentation.xml')
+            )
+        assert saved.read('ppt/presentation.xml') == prs_part.blob
+
+    def it_can_compact_a_pkg_file_after_appending(self, tmp_pptx):
+        pkg = OpcPackage.open(tmp_pptx, lazy=True)
+        pkg.main_document_part._element.set('firstSlideNum', '5')
+        pkg.save(tmp_pptx, append=True)
+        with open(tmp_pptx, 'rb') as f:
+            appended_size = len(f.read())
+        appended = ZipFile(tmp_pptx)
+        blobs = dict(
+            (name, appended.read(name)) for name in appended.namelist()
+        )
+        appended.close()
+
+        OpcPackage.compact(tmp_pptx)
+
+        with open(tmp_pptx, 'rb') as f:
+            assert len(f.read()) < appended_size
+        compacted = ZipFile(tmp_pptx)
+        assert compacted.testzip() is None
+        for name in compacted.namelist():
+            assert compacted.read(name) == blobs.pop(name)
+        assert blobs == {}
+
+    def it_only_appends_to_its_own_source_pkg_file(self, tmp_pptx):
+        with pytest.raises(ValueError):
+            OpcPackage.open(tmp_pptx).save(tmp_pptx, append=True)
+        pkg = OpcPackage.open(test_pptx_path, lazy=True)
+        with pytest.raises(ValueError):
+            pkg.save(tmp_pptx, append=True)
+
+    def it_refuses_to_save_over_its_source_pkg_file(self, pkg):
+        pkg._source_pkg_file = test_pptx_path
+        with pytest.raises(ValueError):
+            pkg.save(test_pptx_path)
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, RelationshipCollection_):
         pkg = OpcPackage()
         rels = pkg.rels
-        RelationshipCollection_.assert_called_once_with(PACKAGE_URI.baseURI)
+        RelationshipCollection_.assert_called_once_with(
+            PACKAGE_URI.baseURI, pkg
+        )
         assert rels == RelationshipCollection_.return_value
 
     def it_can_add_a_relationship_to_a_part(self, pkg_with_rels_, rel_attrs_):
@@ -82,6 +241,84 @@ class DescribeOpcPackage(object):
         rels = list(package.iter_rels())
         assert rels == expected_rels
 
+    def it_caches_its_parts_until_a_relationship_changes(self):
+        pkg = OpcPackage()
+        part_1 = Part(PackURI('/foo/part1.xml'), None, package=pkg)
+        part_2 = Part(PackURI('/foo/part2.xml'), None, package=pkg)
+        pkg.relate_to(part_1, RT.SLIDE)
+        assert list(pkg.iter_parts()) == [part_1]
+        cached_parts = pkg._parts_cache[1]
+        assert list(pkg.iter_parts()) == [part_1]
+        assert pkg._parts_cache[1] is cached_parts
+
+        rId = part_1.relate_to(part_2, RT.IMAGE)
+        assert list(pkg.iter_parts()) == [part_1, part_2]
+        del part_1.rels[rId]
+        assert list(pkg.iter_parts()) == [part_1]
+
+    def it_caches_its_relationships_until_one_changes(self):
+        pkg = OpcPackage()
+        part_1 = Part(PackURI('/foo/part1.xml'), None, package=pkg)
+        part_2 = Part(PackURI('/foo/part2.xml'), None, package=pkg)
+        pkg.relate_to(part_1, RT.SLIDE)
+        part_1.relate_to(part_2, RT.IMAGE)
+        rels = list(pkg.iter_rels())
+        assert [rel.target_part for rel in rels] == [part_1, part_2]
+        assert list(pkg.iter_rels()) == rels
+
+        part_2.relate_to(part_1, RT.SLIDE)
+        rels = list(pkg.iter_rels())
+        assert [rel.target_part for rel in rels] == [part_1, part_2, part_1]
+
+    def it_counts_only_the_changes_to_its_own_relationships(self):
+        pkg, other_pkg = OpcPackage(), OpcPackage()
+        part = Part(PackURI('/foo/part1.xml'), None, package=pkg)
+        other_part = Part(PackURI('/foo/part1.xml'), None, package=other_pkg)
+        pkg.relate_to(part, RT.SLIDE)
+        generation = pkg.rels_generation
+        rels = list(pkg.iter_rels())
+
+        other_pkg.relate_to(other_part, RT.SLIDE)
+        other_pkg.rels.clear()
+
+        assert pkg.rels_generation == generation
+        assert pkg._rels_cache[1] == rels
+        part.relate_to(other_part, RT.IMAGE)
+        assert pkg.rels_generation == generation + 1
+
+    def it_counts_the_removals_that_may_drop_more_than_the_target(self):
+        pkg = OpcPackage()
+        part = Part(PackURI('/foo/part1.xml'), None, package=pkg)
+        leaf = Part(PackURI('/foo/leaf1.xml'), None, package=pkg)
+        rId = pkg.relate_to(part, RT.SLIDE)
+        leaf_rId = part.relate_to(leaf, RT.IMAGE)
+        pkg.relate_to(leaf, RT.IMAGE)
+        part.relate_to('http://foo/bar', RT.HYPERLINK, is_external=True)
+
+        part.rels.clear()
+        assert pkg.rels_removals == 0
+        part.relate_to(leaf, RT.IMAGE)
+        del pkg.rels[rId]
+        assert pkg.rels_removals == 1
+        assert leaf_rId in part.rels
+
+    def it_tells_when_a_part_leaves_and_comes_back(
+            self, _part_dropped_, _part_restored_):
+        pkg = OpcPackage()
+        part = Part(PackURI('/foo/part1.xml'), None, package=pkg)
+        leaf = Part(PackURI('/foo/leaf1.xml'), None, package=pkg)
+        pkg.relate_to(part, RT.SLIDE)
+        rId = part.relate_to(leaf, RT.IMAGE)
+        pkg_rId = pkg.relate_to(leaf, RT.IMAGE)
+
+        del part.rels[rId]
+        assert _part_dropped_.call_count == 0
+        del pkg.rels[pkg_rId]
+        _part_dropped_.assert_called_once_with(pkg, leaf)
+        part.relate_to(leaf, RT.IMAGE)
+        _part_restored_.assert_called_once_with(pkg, leaf)
+        assert _part_dropped_.call_count == 1
+
     def it_can_find_a_part_related_by_reltype(self, related_part_fixture_):
         pkg, reltype, related_part_ = related_part_fixture_
         related_part = pkg.part_related_by(reltype)
@@ -95,6 +332,72 @@ class DescribeOpcPackage(object):
         assert isinstance(partname, PackURI)
         assert partname == expected_partname
 
+    def it_keeps_its_partname_index_current(self):
+        pkg, tmpl = OpcPackage(), '/foo/bar/baz%d.xml'
+        part = Part(PackURI('/foo/bar/baz1.xml'), None, package=pkg)
+        pkg.relate_to(part, RT.SLIDE)
+        assert pkg.next_partname(tmpl) == '/foo/bar/baz2.xml'
+        Part(PackURI('/foo/bar/baz2.xml'), None, package=pkg)
+        assert pkg.next_partname(tmpl) == '/foo/bar/baz3.xml'
+        part.partname = PackURI('/foo/bar/baz9.xml')
+        assert pkg.next_partname(tmpl) == '/foo/bar/baz1.xml'
+
+    def it_rebuilds_its_partname_index_after_a_part_is_dropped(self):
+        pkg, tmpl = OpcPackage(), '/foo/bar/baz%d.xml'
+        part = Part(PackURI('/foo/bar/baz1.xml'), None, package=pkg)
+        part._element = element('p:sp')
+        rId = pkg.relate_to(part, RT.SLIDE)
+        child = Part(PackURI('/foo/bar/baz2.xml'), None, package=pkg)
+        child_rId = part.relate_to(child, RT.SLIDE)
+        assert pkg.next_partname(tmpl) == '/foo/bar/baz3.xml'
+        part.drop_rel(child_rId)
+        assert pkg.next_partname(tmpl) == '/foo/bar/baz2.xml'
+        assert rId in pkg.rels
+
+    def it_updates_its_partname_index_in_place_for_a_dropped_leaf(self):
+        pkg, other_pkg = OpcPackage(), OpcPackage()
+        tmpl = '/ppt/media/media%d.mp4'
+        slide = Part(PackURI('/ppt/slides/slide1.xml'), None, package=pkg)
+        pkg.relate_to(slide, RT.SLIDE)
+        media = Part(PackURI('/ppt/media/media1.mp4'), None, package=pkg)
+        rId = slide.relate_to(media, RT.VIDEO)
+        other_slide = Part(
+            PackURI('/ppt/slides/slide1.xml'), None, package=other_pkg
+        )
+        other_rId = other_pkg.relate_to(other_slide, RT.SLIDE)
+        assert pkg.next_partname(tmpl) == '/ppt/media/media2.mp4'
+        index = pkg._partname_index
+
+        del other_pkg.rels[other_rId]
+        del slide.rels[rId]
+
+        assert pkg.next_partname(tmpl) == '/ppt/media/media1.mp4'
+        assert pkg._partname_index is index
+        slide.relate_to(media, RT.VIDEO)
+        assert pkg.next_partname(tmpl) == '/ppt/media/media2.mp4'
+        assert pkg._partname_index is index
+
+    def it_restores_a_dropped_leaf_related_again_from_a_new_part(self):
+        pkg, tmpl = OpcPackage(), '/ppt/media/media%d.mp4'
+        slide = Part(PackURI('/ppt/slides/slide1.xml'), None, package=pkg)
+        pkg.relate_to(slide, RT.SLIDE)
+        media = Part(PackURI('/ppt/media/media1.mp4'), None, package=pkg)
+        rId = slide.relate_to(media, RT.VIDEO)
+        del slide.rels[rId]
+        assert pkg.next_partname(tmpl) == '/ppt/media/media1.mp4'
+        layout = Part(
+            PackURI('/ppt/slideLayouts/slideLayout1.xml'), None, package=pkg
+        )
+        new_slide = Part(
+            PackURI('/ppt/slides/slide2.xml'), None, package=pkg
+        )
+        new_slide.relate_to(layout, RT.SLIDE_LAYOUT)
+
+        pkg.relate_to(new_slide, RT.SLIDE)
+        new_slide.relate_to(media, RT.VIDEO)
+
+        assert pkg.next_partname(tmpl) == '/ppt/media/media2.mp4'
+
     def it_can_save_to_a_pkg_file(
             self, pkg_file_, PackageWriter_, parts, parts_):
         pkg = OpcPackage()
@@ -102,7 +405,7 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None
         )
 
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
@@ -110,6 +413,13 @@ class DescribeOpcPackage(object):
 
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def tmp_pptx(self, tmpdir):
+        # saved once by python-pptx so its rels items serialize the same
+        path = str(tmpdir.join('append.pptx'))
+        OpcPackage.open(test_pptx_path).save(path)
+        return path
+
     @pytest.fixture
     def iter_parts_fixture(self, request, rels_fixture):
         package, parts, rels = rels_fixture
@@ -246,6 +556,18 @@ class DescribeOpcPackage(object):
         pkg._rels = rels_
         return pkg
 
+    @pytest.fixture
+    def _part_dropped_(self, request):
+        return method_mock(
+            request, OpcPackage, '_part_dropped', autospec=True
+        )
+
+    @pytest.fixture
+    def _part_restored_(self, request):
+        return method_mock(
+            request, OpcPackage, '_part_restored', autospec=True
+        )
+
     @pytest.fixture
     def RelationshipCollection_(self, request):
         return class_mock(request, 'pptx.opc.package.RelationshipCollection')
@@ -323,6 +645,50 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_can_be_loaded_lazily(self, package_):
+        blob_source = Mock(name='blob_source', blob=b'blob')
+        part = Part.load_lazy(None, 'content/type', blob_source, package_)
+        assert part.content_type == 'content/type'
+        assert part.package is package_
+        assert part._blob is None
+        assert part.blob == b'blob'
+        assert part._blob == b'blob'
+
+    def it_drops_its_blob_source_when_its_blob_is_changed(self):
+        part = Part.load_lazy(None, None, Mock(name='blob_source'), None)
+        part.blob = b'foobar'
+        assert part._blob_source is None
+        assert part.blob == b'foobar'
+        assert part.source_member is None
+
+    def it_provides_its_source_member_while_unchanged(self):
+        blob_source = Mock(name='blob_source', blob=b'blob')
+        part = Part.load_lazy(None, None, blob_source, None)
+        part.blob
+        assert part.source_member is blob_source.source_member
+
+    def it_provides_its_source_zipinfo_while_unchanged(self):
+        blob_source = Mock(name='blob_source', blob=b'blob')
+        part = Part.load_lazy(None, None, blob_source, None)
+        assert part.source_zipinfo is blob_source.source_zipinfo
+        part.blob = b'foobar'
+        assert part.source_zipinfo is None
+
+    def it_can_stream_its_blob_from_a_blob_source(self):
+        blob_source = IterBlobSource([b'foo', b'bar'])
+        part = Part(None, None, blob_source, None)
+        assert part.blob_stream is blob_source
+        assert part.blob == b'foobar'
+        assert part._blob is None
+        assert part.source_member is None
+
+    def it_can_change_its_blob_to_a_blob_source(self):
+        part, blob_source = Part(None, None, b'xyz'), IterBlobSource([b'a'])
+        part.blob = blob_source
+        assert part.blob_stream is blob_source
+        part.blob = b'foobar'
+        assert part.blob_stream is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -388,12 +754,60 @@ class DescribePart(object):
         return instance_mock(request, PackURI)
 
 
+class Describe_PartnameIndex(object):
+
+    def it_finds_the_lowest_unused_number_for_a_prefix(self, next_fixture):
+        partnames, prefix, expected_idx = next_fixture
+        index = _PartnameIndex(partnames)
+        assert index.next_available_idx(prefix) == expected_idx
+
+    def it_can_add_and_remove_a_partname(self):
+        index = _PartnameIndex(
+            ['/ppt/media/image1.png', '/ppt/media/image1.jpeg']
+        )
+        index.add(PackURI('/ppt/media/image2.gif'))
+        assert index.next_available_idx('/ppt/media/image') == 3
+        index.remove('/ppt/media/image1.png')
+        assert index.next_available_idx('/ppt/media/image') == 3
+        index.remove('/ppt/media/image1.jpeg')
+        assert index.next_available_idx('/ppt/media/image') == 1
+        index.remove('/ppt/presentation.xml')
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ((), '/ppt/slides/slide', 1),
+        (('/ppt/slides/slide1.xml',), '/ppt/slides/slide', 2),
+        (('/ppt/slides/slide2.xml',), '/ppt/slides/slide', 1),
+        (('/ppt/slides/slide1.xml', '/ppt/slides/slide10.xml'),
+         '/ppt/slides/slide', 2),
+        (('/ppt/media/image1.png', '/ppt/media/image2.jpeg'),
+         '/ppt/media/image', 3),
+        (('/ppt/slides/slide1.xml', '/ppt/presentation.xml'),
+         '/ppt/slideLayouts/slideLayout', 1),
+        (('/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx',),
+         '/ppt/embeddings/Microsoft_Excel_Sheet', 2),
+        (('/ppt/media/media1.mp4', '/ppt/media/media2.mp4'),
+         '/ppt/media/media', 3),
+        (('/ppt/media/media1.mp4',), '/ppt/media/media1.mp', 1),
+        (('/ppt/media/media1.mp3', '/ppt/media/media3.mp3'),
+         '/ppt/media/media', 2),
+        (('/ppt/media/image1.jp2', '/ppt/media/image2.png'),
+         '/ppt/media/image', 3),
+        (('/ppt/media/image1.jp2',), '/ppt/media/image1.jp', 1),
+        (('/ppt/slides/slide1',), '/ppt/slides/slide', 1),
+    ])
+    def next_fixture(self, request):
+        partnames, prefix, expected_idx = request.param
+        return [PackURI(p) for p in partnames], prefix, expected_idx
+
+
 class DescribePartRelationshipManagementInterface(object):
 
     def it_provides_access_to_its_relationships(self, rels_fixture):
-        part, Relationships_, partname_, rels_ = rels_fixture
+        part, Relationships_, partname_, package_, rels_ = rels_fixture
         rels = part.rels
-        Relationships_.assert_called_once_with(partname_.baseURI)
+        Relationships_.assert_called_once_with(partname_.baseURI, package_)
         assert rels is rels_
 
     def it_can_load_a_relationship(self, load_rel_fixture):
@@ -484,9 +898,10 @@ class DescribePartRelationshipManagementInterface(object):
         return part, related_parts_
 
     @pytest.fixture
-    def rels_fixture(self, Relationships_, partname_, rels_):
-        part = Part(partname_, None)
-        return part, Relationships_, partname_, rels_
+    def rels_fixture(self, request, Relationships_, partname_, rels_):
+        package_ = instance_mock(request, OpcPackage)
+        part = Part(partname_, None, package=package_)
+        return part, Relationships_, partname_, package_, rels_
 
     @pytest.fixture
     def target_ref_fixture(self, request, part, rId_, rel_, url_):
@@ -570,6 +985,52 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_parses_a_lazily_loaded_element_on_first_access(
+            self, element_, parse_xml_):
+        blob_source = Mock(name='blob_source', blob=b'<foo/>')
+        xml_part = XmlPart.load_lazy(None, None, blob_source, None)
+        assert parse_xml_.call_count == 0
+        element = xml_part._element
+        parse_xml_.assert_called_once_with(b'<foo/>')
+        assert element is element_
+        assert xml_part._element is element_
+        assert parse_xml_.call_count == 1
+
+    def it_uses_the_source_blob_when_its_xml_is_not_yet_parsed(
+            self, serialize_part_xml_):
+        blob_source = Mock(name='blob_source', blob=b'<foo/>')
+        xml_part = XmlPart.load_lazy(None, None, blob_source, None)
+        blob = xml_part.blob
+        assert blob == b'<foo/>'
+        assert serialize_part_xml_.call_count == 0
+
+    def it_has_no_source_member_once_its_xml_is_changed(
+            self, element_, parse_xml_):
+        element_.generation = 0
+        blob_source = Mock(name='blob_source', blob=b'<foo/>')
+        xml_part = XmlPart.load_lazy(None, None, blob_source, None)
+        assert xml_part.source_member is blob_source.source_member
+        xml_part._element
+        assert xml_part.source_member is blob_source.source_member
+        element_.generation = 1
+        assert xml_part.source_member is None
+
+    def it_reuses_the_blob_it_was_loaded_from_while_unchanged(self):
+        blob = b'<a:p xmlns:a="http://foo"><a:r/></a:p>'
+        blob_source = Mock(name='blob_source', blob=blob)
+        xml_part = XmlPart.load_lazy(None, None, blob_source, None)
+        xml_part._element
+        assert xml_part.blob is blob
+        xml_part._element.append(xml_part._element[0])
+        assert xml_part.blob == serialize_part_xml(xml_part._element)
+        assert xml_part.blob is not blob
+
+    def but_it_keeps_only_its_element_when_loaded_eagerly(self):
+        blob = b'<a:p xmlns:a="http://foo"><a:r/></a:p>'
+        xml_part = XmlPart.load(None, None, blob, None)
+        assert xml_part._blob is None
+        assert xml_part.blob == serialize_part_xml(xml_part._element)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -760,6 +1221,73 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_can_add_several_relationships(self):
+        rels = RelationshipCollection('/ppt')
+        targets = [Mock(name='part%d' % n) for n in range(3)]
+        rels.add_relationship(RT.SLIDE_MASTER, Mock(name='master'), 'rId2')
+
+        new_rels = rels.add_relationships(RT.SLIDE, targets)
+
+        assert [rel.rId for rel in new_rels] == ['rId1', 'rId3', 'rId4']
+        assert [rel.target_part for rel in new_rels] == targets
+        assert [rel.reltype for rel in new_rels] == [RT.SLIDE] * 3
+        assert [rels[rel.rId] for rel in new_rels] == new_rels
+
+    def it_advances_its_generation_on_each_change(self):
+        rels = RelationshipCollection('/ppt/slides')
+        target = Mock(name='part')
+        rels.add_relationship(RT.IMAGE, target, 'rId1')
+        rels.add_relationship(RT.IMAGE, target, 'rId2')
+        rels.add_relationship(RT.IMAGE, target, 'rId3')
+        assert rels.generation == 3
+        del rels['rId1']
+        rels.pop('rId2')
+        rels.pop('rId2', None)
+        assert rels.generation == 5
+        rels.clear()
+        rels.clear()
+        assert rels.generation == 6
+
+    def it_reports_each_change_to_its_package(self, request):
+        package_ = instance_mock(request, OpcPackage)
+        rels = RelationshipCollection('/ppt/slides', package_)
+        target, other_target = Mock(name='part'), Mock(name='other')
+        rel = rels.add_relationship(RT.IMAGE, target, 'rId1')
+        other_rel = rels.add_relationship(RT.IMAGE, target, 'rId2')
+        rels.retarget('rId1', other_target)
+        new_rel = rels['rId1']
+        del rels['rId1']
+        rels.clear()
+        assert package_._rels_changed.call_args_list == [
+            call(rel, None), call(other_rel, None), call(new_rel, rel),
+            call(None, new_rel), call(None, other_rel),
+        ]
+
+    def it_forgets_the_target_of_a_removed_relationship(self):
+        rels = RelationshipCollection('/ppt/slides')
+        target = Mock(name='part')
+        rels.add_relationship(RT.IMAGE, target, 'rId1')
+        rels.add_relationship(RT.IMAGE, target, 'rId2')
+        rels.add_relationship(RT.IMAGE, target, 'rId3')
+        del rels['rId1']
+        assert rels.pop('rId2').target_part is target
+        assert rels.related_parts == {'rId3': target}
+        rels.clear()
+        assert rels.related_parts == {}
+
+    def it_can_retarget_a_relationship(self):
+        rels = RelationshipCollection('/ppt/slides')
+        target, other_target = Mock(name='part'), Mock(name='other')
+        rels.add_relationship(RT.IMAGE, target, 'rId1')
+
+        rels.retarget('rId1', other_target)
+
+        rel = rels['rId1']
+        assert (rel.rId, rel.reltype) == ('rId1', RT.IMAGE)
+        assert rel.target_part is other_target
+        assert rels.related_parts == {'rId1': other_target}
+        assert rels.generation == 2
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
@@ -892,6 +1420,30 @@ class DescribeUnmarshaller(object):
         )
         assert parts == parts_dict_
 
+    def it_can_unmarshal_parts_lazily(
+            self, pkg_reader_, pkg_, part_factory_, parts_dict_, partnames_,
+            content_types_):
+        partname_, partname_2_ = partnames_
+        content_type_, content_type_2_ = content_types_
+        spart_, spart_2_ = Mock(name='spart_'), Mock(name='spart_2_')
+        pkg_reader_.iter_lazy_sparts.return_value = (
+            (partname_, content_type_, spart_),
+            (partname_2_, content_type_2_, spart_2_),
+        )
+        pkg_reader_.iter_sparts.return_value = ()
+        part_factory_.load_lazy.side_effect = list(parts_dict_.values())
+
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_
+        )
+
+        assert part_factory_.load_lazy.call_args_list == [
+            call(partname_, content_type_, spart_, pkg_),
+            call(partname_2_, content_type_2_, spart_2_, pkg_)
+        ]
+        assert part_factory_.call_count == 0
+        assert parts == parts_dict_
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = 'http://reltype'
@@ -976,7 +1528,8 @@ class DescribeUnmarshaller(object):
             (partname_, content_type_, blob_),
             (partname_2_, content_type_2_, blob_2_),
         )
-        pkg_reader_ = instance_mock(request, PackageReader)
+        pkg_reader_ = instance_mock(request, PackageReader, is_lazy=False)
+        pkg_reader_.iter_lazy_sparts.return_value = ()
         pkg_reader_.iter_sparts.return_value = spart_return_values
         return pkg_reader_
 
@@ -13,17 +13,20 @@ except ImportError:
 
 import hashlib
 import pytest
+import zlib
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from pptx.exceptions import PackageNotFoundError
+from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader, _MmapZipPkgReader, PhysPkgReader, PhysPkgWriter,
+    _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import class_mock, loose_mock, Mock, patch
 
 
 test_pptx_path = absjoin(test_file_dir, 'test.pptx')
@@ -56,6 +59,10 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == '64ffe86bb2bbaad53c3c1976042b907f8e10c5a3'
 
+    def it_has_no_raw_member_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        assert dir_reader.raw_member_for(pack_uri) is None
+
     def it_returns_none_when_part_has_no_rels_xml(self, dir_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = dir_reader.rels_xml_for(partname)
@@ -123,6 +130,29 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_retrieve_the_raw_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        zipinfo, raw_chunks = phys_reader.raw_member_for(pack_uri)
+        raw_bytes = b''.join(raw_chunks)
+        assert zipinfo.filename == 'ppt/presentation.xml'
+        assert zipinfo.compress_type == ZIP_DEFLATED
+        assert len(raw_bytes) == zipinfo.compress_size
+        blob = zlib.decompress(raw_bytes, -15)
+        assert blob == phys_reader.blob_for(pack_uri)
+
+    def it_reads_a_raw_member_a_chunk_at_a_time(self, phys_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        with patch('pptx.opc.phys_pkg.CHUNK_SIZE', 100):
+            zipinfo, raw_chunks = phys_reader.raw_member_for(pack_uri)
+            first_chunk = next(raw_chunks)
+            phys_reader.blob_for(PackURI('/ppt/slides/slide1.xml'))
+            chunks = [first_chunk] + list(raw_chunks)
+        assert [len(chunk) for chunk in chunks[:-1]] == [100] * (
+            len(chunks) - 1
+        )
+        blob = zlib.decompress(b''.join(chunks), -15)
+        assert blob == phys_reader.blob_for(pack_uri)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope='class')
@@ -136,6 +166,78 @@ class DescribeZipPkgReader(object):
         return loose_mock(request)
 
 
+class DescribeMmapZipPkgReader(object):
+
+    def it_is_used_by_PhysPkgReader_when_mmap_is_requested(self):
+        phys_reader = PhysPkgReader(zip_pkg_path, use_mmap=True)
+        assert isinstance(phys_reader, _MmapZipPkgReader)
+        phys_reader.close()
+
+    def but_not_when_pkg_is_a_stream(self):
+        with open(zip_pkg_path, 'rb') as stream:
+            phys_reader = PhysPkgReader(stream, use_mmap=True)
+            assert type(phys_reader) is _ZipPkgReader
+
+    def it_reads_each_member_like_the_zip_reader_does(self, phys_reader):
+        zipf = ZipFile(zip_pkg_path)
+        for name in zipf.namelist():
+            pack_uri = PackURI('/%s' % name)
+            assert bytes(phys_reader.blob_for(pack_uri)) == zipf.read(name)
+        zipf.close()
+
+    def it_provides_a_stored_member_without_copying_it(self, stored_pkg):
+        phys_reader = _MmapZipPkgReader(stored_pkg)
+        blob = phys_reader.blob_for(PackURI('/ppt/media/media1.mp4'))
+        assert isinstance(blob, memoryview)
+        assert blob.tobytes() == b'0123456789' * 100
+        with patch('pptx.opc.phys_pkg.CHUNK_SIZE', 300):
+            zipinfo, raw_chunks = phys_reader.raw_member_for(
+                PackURI('/ppt/media/media1.mp4')
+            )
+            raw_chunks = list(raw_chunks)
+        assert [len(chunk) for chunk in raw_chunks] == [300, 300, 300, 100]
+        assert all(isinstance(chunk, memoryview) for chunk in raw_chunks)
+        assert b''.join(raw_chunks) == blob
+        del blob, raw_chunks
+        phys_reader.close()
+
+    def it_can_be_closed_while_a_member_is_referenced(self, stored_pkg):
+        phys_reader = _MmapZipPkgReader(stored_pkg)
+        blob = phys_reader.blob_for(PackURI('/ppt/media/media1.mp4'))
+        phys_reader.close()
+        assert blob[:4].tobytes() == b'0123'
+
+    def it_can_retrieve_the_raw_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/ppt/presentation.xml')
+        zipinfo, raw_chunks = phys_reader.raw_member_for(pack_uri)
+        raw_bytes = b''.join(raw_chunks)
+        assert zipinfo.compress_size == len(raw_bytes)
+        blob = zlib.decompress(raw_bytes, -zlib.MAX_WBITS)
+        assert blob == phys_reader.blob_for(pack_uri)
+
+    def it_provides_content_types_and_rels_xml_as_bytes(self, phys_reader):
+        assert isinstance(phys_reader.content_types_xml, bytes)
+        assert isinstance(phys_reader.rels_xml_for(PACKAGE_URI), bytes)
+        partname = PackURI('/ppt/viewProps.xml')
+        assert phys_reader.rels_xml_for(partname) is None
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def phys_reader(self, request):
+        phys_reader = _MmapZipPkgReader(zip_pkg_path)
+        request.addfinalizer(phys_reader.close)
+        return phys_reader
+
+    @pytest.fixture
+    def stored_pkg(self, tmpdir):
+        path = str(tmpdir.join('stored.pptx'))
+        zipf = ZipFile(path, 'w')
+        zipf.writestr('ppt/media/media1.mp4', b'0123456789' * 100)
+        zipf.close()
+        return path
+
+
 class DescribeZipPkgWriter(object):
 
     def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_pptx_path):
@@ -174,8 +276,227 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_copy_a_raw_member_from_another_zip(self, pkg_file):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/ppt/slides/slide1.xml')
+        zipinfo, raw_chunks = phys_reader.raw_member_for(pack_uri)
+        expected_blob = phys_reader.blob_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/part/first.xml'), b'<first/>')
+        pkg_writer.write_raw(
+            PackURI('/ppt/slides/slide9.xml'), zipinfo, raw_chunks
+        )
+        pkg_writer.write(PackURI('/part/last.xml'), b'<last/>')
+        pkg_writer.close()
+        phys_reader.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [
+            'part/first.xml', 'ppt/slides/slide9.xml', 'part/last.xml'
+        ]
+        assert zipf.read('ppt/slides/slide9.xml') == expected_blob
+        assert zipf.read('part/last.xml') == b'<last/>'
+        zipf.close()
+
+    def it_deflates_every_member_by_default(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/ppt/media/image1.png'), b'png', CT.PNG)
+        pkg_writer.close()
+        zipinfo = ZipFile(pkg_file).getinfo('ppt/media/image1.png')
+        assert zipinfo.compress_type == ZIP_DEFLATED
+
+    def it_can_deflate_at_a_given_level(self, level_fixture):
+        pkg_file, level, blob = level_fixture
+        pkg_writer = PhysPkgWriter(pkg_file, level)
+        pkg_writer.write(PackURI('/part/name.xml'), blob, CT.XML)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file)
+        assert zipf.testzip() is None
+        zipinfo = zipf.getinfo('part/name.xml')
+        assert zipinfo.compress_type == ZIP_DEFLATED
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        expected_size = len(compressor.compress(blob) + compressor.flush())
+        assert zipinfo.compress_size == expected_size
+        assert zipf.read('part/name.xml') == blob
+
+    def it_stores_already_compressed_members_given_a_level(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, 6)
+        pkg_writer.write(PackURI('/ppt/media/image1.jpeg'), b'jpg', CT.JPEG)
+        pkg_writer.write(PackURI('/ppt/slides/slide1.xml'), b'<sld/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file)
+        zipinfo = zipf.getinfo('ppt/media/image1.jpeg')
+        assert zipinfo.compress_type == ZIP_STORED
+        assert zipf.read('ppt/media/image1.jpeg') == b'jpg'
+        zipinfo = zipf.getinfo('ppt/slides/slide1.xml')
+        assert zipinfo.compress_type == ZIP_DEFLATED
+
+    def it_can_compress_a_member_for_writing_later(self, pkg_file):
+        blob = b'<a:t>text</a:t>' * 100
+        pkg_writer = PhysPkgWriter(pkg_file, 9)
+        zipinfo, raw_bytes = pkg_writer.compress(
+            PackURI('/ppt/slides/slide1.xml'), blob, CT.PML_SLIDE
+        )
+        assert zipinfo.compress_type == ZIP_DEFLATED
+        assert zipinfo.file_size == len(blob)
+        assert zipinfo.compress_size == len(raw_bytes)
+        assert zlib.decompress(raw_bytes, -zlib.MAX_WBITS) == blob
+        zipinfo, raw_bytes = pkg_writer.compress(
+            PackURI('/ppt/media/image1.png'), b'png', CT.PNG
+        )
+        assert zipinfo.compress_type == ZIP_STORED
+        assert raw_bytes == b'png'
+
+    def it_can_write_a_member_a_chunk_at_a_time(self, stream_fixture):
+        pkg_file, compression, content_type, compress_type = stream_fixture
+        chunks = [('<a:t>chunk %d</a:t>' % idx).encode('utf-8')
+                  for idx in range(100)]
+        expected_blob = b''.join(chunks)
+
+        pkg_writer = PhysPkgWriter(pkg_file, compression)
+        pkg_writer.write(PackURI('/part/first.xml'), b'<first/>')
+        pkg_writer.write_stream(
+            PackURI('/ppt/media/media1.bin'), iter(chunks), content_type
+        )
+        pkg_writer.write(PackURI('/part/last.xml'), b'<last/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file)
+        assert zipf.testzip() is None
+        zipinfo = zipf.getinfo('ppt/media/media1.bin')
+        assert zipinfo.compress_type == compress_type
+        assert zipinfo.file_size == len(expected_blob)
+        assert zipf.read('ppt/media/media1.bin') == expected_blob
+        assert zipf.read('part/last.xml') == b'<last/>'
+
+    def it_stores_every_member_at_level_zero(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, 0)
+        pkg_writer.write(PackURI('/ppt/slides/slide1.xml'), b'<sld/>')
+        pkg_writer.close()
+        zipinfo = ZipFile(pkg_file).getinfo('ppt/slides/slide1.xml')
+        assert zipinfo.compress_type == ZIP_STORED
+
+    def it_can_write_to_a_stream_that_cannot_seek(self, sink_fixture):
+        sink = sink_fixture
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/ppt/slides/slide1.xml')
+        zipinfo, raw_chunks = phys_reader.raw_member_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(sink)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<foo/>')
+        pkg_writer.write_raw(pack_uri, zipinfo, raw_chunks)
+        pkg_writer.close()
+        phys_reader.close()
+
+        zipf = ZipFile(BytesIO(sink.getvalue()))
+        assert zipf.testzip() is None
+        assert zipf.read('part/name.xml') == b'<foo/>'
+
+    def it_seeks_in_a_stream_that_can_though_it_doesnt_say_so(self):
+        sink = _SeekOnlySink()
+
+        pkg_writer = PhysPkgWriter(sink)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<foo/>')
+        pkg_writer.close()
+
+        assert _ZipPkgWriter._sink_for(sink) is sink
+        zipf = ZipFile(BytesIO(sink.getvalue()))
+        assert zipf.read('part/name.xml') == b'<foo/>'
+        assert not zipf.getinfo('part/name.xml').flag_bits & 0x08
+
+    def it_can_append_to_a_package_in_place(self, append_fixture):
+        pkg_file, last_offset, kept_offset = append_fixture
+        pkg_writer = PhysPkgWriter(pkg_file, append=True)
+        slide_uri = PackURI('/ppt/slides/slide1.xml')
+        assert pkg_writer.keep_member(
+            slide_uri, _ZipPkgReader(zip_pkg_path).zipinfo_for(slide_uri)
+        )
+        assert pkg_writer.keep_blob(
+            PACKAGE_URI.rels_uri, ZipFile(zip_pkg_path).read('_rels/.rels')
+        )
+        assert not pkg_writer.keep_blob(
+            PackURI('/ppt/_rels/presentation.xml.rels'), b'<changed/>'
+        )
+        pkg_writer.write(PackURI('/ppt/presentation.xml'), b'<new/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file)
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [
+            'ppt/slides/slide1.xml', '_rels/.rels', 'ppt/presentation.xml'
+        ]
+        assert zipf.getinfo('ppt/slides/slide1.xml').header_offset == (
+            kept_offset
+        )
+        assert zipf.getinfo('ppt/presentation.xml').header_offset > (
+            last_offset
+        )
+        assert zipf.read('ppt/presentation.xml') == b'<new/>'
+
+    def it_keeps_only_the_same_member_when_appending(self, append_fixture):
+        pkg_file = append_fixture[0]
+        pkg_writer = PhysPkgWriter(pkg_file, append=True)
+        slide_uri = PackURI('/ppt/slides/slide1.xml')
+        zipinfo = _ZipPkgReader(zip_pkg_path).zipinfo_for(slide_uri)
+        other_uri = PackURI('/ppt/slideLayouts/slideLayout1.xml')
+        assert not pkg_writer.keep_member(other_uri, zipinfo)
+        assert not pkg_writer.keep_member(PackURI('/not/there.xml'), zipinfo)
+        assert not pkg_writer.keep_blob(PackURI('/not/there.xml'), b'foo')
+        pkg_writer.close()
+
+    def it_raises_on_an_invalid_compression_level(self, pkg_file):
+        for compression in (-1, 10, 'fast', 1.5):
+            with pytest.raises(ValueError):
+                PhysPkgWriter(pkg_file, compression)
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture(params=['no-tell', 'no-seek', 'not-seekable'])
+    def sink_fixture(self, request):
+        sink = _WriteOnlySink()
+        if request.param == 'no-tell':
+            def tell():
+                raise IOError('illegal seek')
+            sink.tell = tell
+        elif request.param == 'no-seek':
+            def seek(offset, whence=0):
+                raise ValueError('cannot seek')
+            sink.seek = seek
+        else:
+            sink.seekable = lambda: False
+        return sink
+
+    @pytest.fixture
+    def append_fixture(self, tmp_pptx_path):
+        with open(zip_pkg_path, 'rb') as src, open(tmp_pptx_path, 'wb') as f:
+            f.write(src.read())
+        zipf = ZipFile(tmp_pptx_path)
+        last_offset = max(zi.header_offset for zi in zipf.infolist())
+        zipinfo = zipf.getinfo('ppt/slides/slide1.xml')
+        return tmp_pptx_path, last_offset, zipinfo.header_offset
+
+    @pytest.fixture(params=[1, 9])
+    def level_fixture(self, request, pkg_file):
+        level = request.param
+        blob = b''.join(
+            b'<a:t>%d words of text</a:t>' % (i % 97) for i in range(2000)
+        )
+        return pkg_file, level, blob
+
+    @pytest.fixture(params=[
+        (None, CT.XML,  ZIP_DEFLATED),
+        (6,    CT.XML,  ZIP_DEFLATED),
+        (6,    CT.JPEG, ZIP_STORED),
+        (0,    CT.XML,  ZIP_STORED),
+    ])
+    def stream_fixture(self, request, pkg_file):
+        compression, content_type, compress_type = request.param
+        return pkg_file, compression, content_type, compress_type
+
     @pytest.fixture
     def pkg_file(self, request):
         pkg_file = BytesIO()
@@ -183,6 +504,48 @@ class DescribeZipPkgWriter(object):
         return pkg_file
 
 
+class _SeekOnlySink(object):
+    """
+    Stand-in for an older file-like object that can seek but has no
+    `seekable()` method.
+    """
+    def __init__(self):
+        self._stream = BytesIO()
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return self._stream.getvalue()
+
+    def seek(self, offset, whence=0):
+        return self._stream.seek(offset, whence)
+
+    def tell(self):
+        return self._stream.tell()
+
+    def write(self, data):
+        return self._stream.write(data)
+
+
+class _WriteOnlySink(object):
+    """
+    Stand-in for a stream that can only be written to in a forward pass,
+    like a pipe or an HTTP response body.
+    """
+    def __init__(self):
+        self._chunks = []
+
+    def getvalue(self):
+        return b''.join(self._chunks)
+
+    def tell(self):
+        return len(self.getvalue())
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+
+
 # fixtures -------------------------------------------------
 
 @pytest.fixture
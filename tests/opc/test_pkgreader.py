@@ -7,6 +7,9 @@ Test suite for opc.pkgreader module
 from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
+import zlib
+
+from zipfile import BadZipfile, ZIP_DEFLATED, ZipFile, ZipInfo
 
 from pptx.opc.constants import (
     CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
@@ -20,6 +23,7 @@ from pptx.opc.pkgreader import (
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call, class_mock, function_mock, initializer_mock, method_mock, Mock,
     patch
@@ -77,21 +81,45 @@ class DescribePackageReader(object):
         # exercise ---------------------
         pkg_reader = PackageReader.from_file(pkg_file)
         # verify -----------------------
-        PhysPkgReader_.assert_called_once_with(pkg_file)
+        PhysPkgReader_.assert_called_once_with(pkg_file, False)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
-                                                       content_types)
+                                                       content_types, False)
         phys_reader.close.assert_called_once_with()
-        init.assert_called_once_with(content_types, pkg_srels, sparts)
+        init.assert_called_once_with(content_types, pkg_srels, sparts, False)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_keeps_its_phys_reader_open_when_lazy(
+            self, init, PhysPkgReader_, from_xml, _srels_for,
+            _load_serialized_parts):
+        phys_reader = PhysPkgReader_.return_value
+        content_types = from_xml.return_value
+        pkg_srels = _srels_for.return_value
+        sparts = _load_serialized_parts.return_value
+
+        PackageReader.from_file(Mock(name='pkg_file'), lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
+                                                       content_types, True)
+        assert phys_reader.close.call_count == 0
+        init.assert_called_once_with(content_types, pkg_srels, sparts, True)
+
+    def it_can_iterate_over_its_serialized_parts_lazily(self):
+        spart = Mock(name='spart', partname='part/name.xml',
+                     content_type='app/vnd.type', is_lazy=True)
+        pkg_reader = PackageReader(None, None, [spart], lazy=True)
+        assert pkg_reader.is_lazy is True
+        assert list(pkg_reader.iter_lazy_sparts()) == [
+            ('part/name.xml', 'app/vnd.type', spart)
+        ]
+
     def it_can_iterate_over_the_serialized_parts(self):
         # mockery ----------------------
         partname, content_type, blob = ('part/name.xml', 'app/vnd.type',
                                         '<Part_1/>')
         spart = Mock(name='spart', partname=partname,
-                     content_type=content_type, blob=blob)
+                     content_type=content_type, blob=blob, is_lazy=False)
         pkg_reader = PackageReader(None, None, [spart])
         iter_count = 0
         # exercise ---------------------
@@ -128,10 +156,11 @@ class DescribePackageReader(object):
             ('/part/name1.xml', 'app/vnd.type_1', '<Part_1/>', 'srels_1'),
             ('/part/name2.xml', 'app/vnd.type_2', '<Part_2/>', 'srels_2'),
         )
-        iter_vals = [(t[0], t[2], t[3]) for t in test_data]
+        iter_vals = [(t[0], t[3]) for t in test_data]
         content_types = dict((t[0], t[1]) for t in test_data)
         # mockery ----------------------
         phys_reader = Mock(name='phys_reader')
+        phys_reader.blob_for.side_effect = [t[2] for t in test_data]
         pkg_srels = Mock(name='pkg_srels')
         _walk_phys_parts.return_value = iter_vals
         _SerializedPart_.side_effect = expected_sparts = (
@@ -148,6 +177,42 @@ class DescribePackageReader(object):
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
 
+    def it_can_load_serialized_parts_lazily(
+            self, _SerializedPart_, _walk_phys_parts):
+        phys_reader = Mock(name='phys_reader')
+        _walk_phys_parts.return_value = [('/part/name.xml', 'srels')]
+        content_types = {'/part/name.xml': 'app/vnd.type'}
+        _SerializedPart_.return_value = spart = Mock(name='spart')
+
+        retval = PackageReader._load_serialized_parts(
+            phys_reader, Mock(name='pkg_srels'), content_types, lazy=True
+        )
+
+        _SerializedPart_.assert_called_once_with(
+            '/part/name.xml', 'app/vnd.type', None, 'srels', phys_reader
+        )
+        assert phys_reader.blob_for.call_count == 0
+        assert retval == (spart,)
+
+    def it_keeps_each_xml_part_still_compressed_when_not_lazy(self):
+        pkg_path = absjoin(test_file_dir, 'test.pptx')
+        pkg_reader = PackageReader.from_file(pkg_path)
+        zipf = ZipFile(pkg_path)
+
+        lazy_sparts = list(pkg_reader.iter_lazy_sparts())
+        sparts = list(pkg_reader.iter_sparts())
+
+        assert lazy_sparts
+        for partname, content_type, spart in lazy_sparts:
+            assert content_type.endswith('xml')
+            assert spart.blob == zipf.read(partname.membername)
+            zipinfo, raw_chunks = spart.source_member
+            assert len(b''.join(raw_chunks)) == zipinfo.compress_size
+        assert sparts
+        for partname, content_type, blob in sparts:
+            assert not content_type.endswith('xml')
+            assert blob == zipf.read(partname.membername)
+
     def it_can_walk_phys_pkg_parts(self, _srels_for):
         # test data --------------------
         # +----------+       +--------+
@@ -161,9 +226,6 @@ class DescribePackageReader(object):
         partname_1, partname_2, partname_3 = (
             '/part/name1.xml', '/part/name2.xml', '/part/name3.xml'
         )
-        part_1_blob, part_2_blob, part_3_blob = (
-            '<Part_1/>', '<Part_2/>', '<Part_3/>'
-        )
         srels = [
             Mock(name='rId1', is_external=True),
             Mock(name='rId2', is_external=False, target_partname=partname_1),
@@ -178,19 +240,17 @@ class DescribePackageReader(object):
         # mockery ----------------------
         phys_reader = Mock(name='phys_reader')
         _srels_for.side_effect = [part_1_srels, part_2_srels, part_3_srels]
-        phys_reader.blob_for.side_effect = [
-            part_1_blob, part_2_blob, part_3_blob
-        ]
         # exercise ---------------------
         generated_tuples = [t for t in PackageReader._walk_phys_parts(
             phys_reader, pkg_srels)]
         # verify -----------------------
         expected_tuples = [
-            (partname_1, part_1_blob, part_1_srels),
-            (partname_2, part_2_blob, part_2_srels),
-            (partname_3, part_3_blob, part_3_srels),
+            (partname_1, part_1_srels),
+            (partname_2, part_2_srels),
+            (partname_3, part_3_srels),
         ]
         assert generated_tuples == expected_tuples
+        assert phys_reader.blob_for.call_count == 0
 
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationshipCollection_):
@@ -325,6 +385,49 @@ class Describe_SerializedPart(object):
         assert spart.blob == blob
         assert spart.srels == srels
 
+    def it_reads_its_blob_from_the_phys_reader_when_lazy(self):
+        phys_reader = Mock(name='phys_reader')
+        phys_reader.blob_for.return_value = b'<Part/>'
+        spart = _SerializedPart('/part/name.xml', None, None, None,
+                                phys_reader)
+        assert spart.blob == b'<Part/>'
+        phys_reader.blob_for.assert_called_once_with('/part/name.xml')
+
+    def it_decompresses_its_blob_from_its_raw_member(self):
+        zipinfo, raw_bytes = self._deflated_member(b'<Part/>')
+        spart = _SerializedPart(
+            '/part/name.xml', None, None, None,
+            raw_member=(zipinfo, raw_bytes)
+        )
+        assert spart.is_lazy is True
+        assert spart.blob == b'<Part/>'
+        assert spart.source_member == (zipinfo, (raw_bytes,))
+        assert spart.source_zipinfo is zipinfo
+
+    def but_it_raises_when_its_raw_member_is_corrupt(self):
+        zipinfo, raw_bytes = self._deflated_member(b'<Part/>')
+        zipinfo.CRC ^= 1
+        spart = _SerializedPart(
+            '/part/name.xml', None, None, None,
+            raw_member=(zipinfo, raw_bytes)
+        )
+        with pytest.raises(BadZipfile):
+            spart.blob
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _deflated_member(blob):
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        raw_bytes = compressor.compress(blob) + compressor.flush()
+        zipinfo = ZipInfo('part/name.xml')
+        zipinfo.compress_type = ZIP_DEFLATED
+        zipinfo.file_size = len(blob)
+        zipinfo.CRC = zlib.crc32(blob) & 0xffffffff
+        return zipinfo, raw_bytes
+
 
 class Describe_SerializedRelationship(object):
 
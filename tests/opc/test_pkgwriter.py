@@ -26,17 +26,31 @@ class DescribePackageWriter(object):
         parts = Mock(name='parts')
         phys_writer = PhysPkgWriter_.return_value
         # exercise ---------------------
-        PackageWriter.write(pkg_file, pkg_rels, parts)
+        PackageWriter.write(pkg_file, pkg_rels, parts, 6)
         # verify -----------------------
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
             call._write_parts(phys_writer, parts),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, 6)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_can_write_a_package_using_worker_threads(
+            self, PhysPkgWriter_, _write_methods):
+        pkg_file, pkg_rels = Mock(name='pkg_file'), Mock(name='pkg_rels')
+        parts = Mock(name='parts')
+        phys_writer = PhysPkgWriter_.return_value
+
+        PackageWriter.write(pkg_file, pkg_rels, parts, None, 4)
+
+        assert _write_methods.mock_calls == [
+            call._write_content_types_stream(phys_writer, parts),
+            call._write_pkg_rels(phys_writer, pkg_rels),
+            call._write_parts_in_parallel(phys_writer, parts, 4),
+        ]
+
     def it_can_write_a_content_types_stream(
             self, xml_for, serialize_part_xml_):
         # mockery ----------------------
@@ -66,18 +80,92 @@ class DescribePackageWriter(object):
         phys_writer = Mock(name='phys_writer')
         rels = MagicMock(name='rels')
         rels.__len__.return_value = 1
-        part1 = Mock(name='part1', _rels=rels)
-        part2 = Mock(name='part2', _rels=[])
+        part1 = Mock(
+            name='part1', _rels=rels, source_member=None, blob_stream=None
+        )
+        part2 = Mock(
+            name='part2', _rels=[], source_member=None, blob_stream=None
+        )
         # exercise ---------------------
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
         expected_calls = [
-            call(part1.partname, part1.blob),
+            call(part1.partname, part1.blob, part1.content_type),
             call(part1.partname.rels_uri, part1._rels.xml),
-            call(part2.partname, part2.blob),
+            call(part2.partname, part2.blob, part2.content_type),
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_copies_an_unchanged_part_without_recompressing_it(self):
+        phys_writer = Mock(name='phys_writer')
+        zipinfo, raw_bytes = Mock(name='zipinfo'), b'raw bytes'
+        part = Mock(
+            name='part', _rels=[], source_member=(zipinfo, raw_bytes)
+        )
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write_raw.assert_called_once_with(
+            part.partname, zipinfo, raw_bytes
+        )
+        assert phys_writer.write.call_count == 0
+
+    def it_streams_a_part_from_its_blob_source(self):
+        phys_writer = Mock(name='phys_writer')
+        blob_stream = Mock(name='blob_stream', size=42)
+        part = Mock(
+            name='part', _rels=[], source_member=None, blob_stream=blob_stream
+        )
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write_stream.assert_called_once_with(
+            part.partname, blob_stream.iter_chunks.return_value,
+            part.content_type, 42
+        )
+        assert phys_writer.write.call_count == 0
+
+    def it_can_write_parts_compressed_in_parallel(self):
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.compress.side_effect = lambda partname, blob, ct: (
+            'zipinfo-%s' % partname, b'raw'
+        )
+        rels = MagicMock(name='rels')
+        rels.__len__.return_value = 1
+        parts = [
+            Mock(name='part%d' % idx, partname=PackURI('/pn%d' % idx),
+                 _rels=[], source_member=None, blob_stream=None)
+            for idx in range(20)
+        ]
+        parts[3]._rels = rels
+        parts[7].source_member = ('source-zipinfo', b'source')
+        parts[9].blob_stream = Mock(name='blob_stream', size=None)
+
+        PackageWriter._write_parts_in_parallel(phys_writer, parts, 3)
+
+        expected_calls = [
+            call.write_raw('/pn%d' % idx, 'zipinfo-/pn%d' % idx, (b'raw',))
+            for idx in range(20)
+        ]
+        expected_calls.insert(4, call.write('/_rels/pn3.rels', rels.xml))
+        expected_calls[8] = call.write_raw(
+            '/pn7', 'source-zipinfo', b'source'
+        )
+        expected_calls[10] = call.write_stream(
+            '/pn9', parts[9].blob_stream.iter_chunks.return_value,
+            parts[9].content_type, None
+        )
+        writes = [
+            c for c in phys_writer.mock_calls
+            if c[0] in ('write', 'write_raw', 'write_stream')
+        ]
+        assert writes == expected_calls
+
+    def it_raises_on_an_invalid_worker_count(self):
+        for workers in (0, -1, 2.5, 'many'):
+            with pytest.raises(ValueError):
+                PackageWriter._write_parts_in_parallel(None, [], workers)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -99,14 +187,17 @@ class DescribePackageWriter(object):
         patch1 = patch.object(PackageWriter, '_write_content_types_stream')
         patch2 = patch.object(PackageWriter, '_write_pkg_rels')
         patch3 = patch.object(PackageWriter, '_write_parts')
+        patch4 = patch.object(PackageWriter, '_write_parts_in_parallel')
         root_mock.attach_mock(patch1.start(), '_write_content_types_stream')
         root_mock.attach_mock(patch2.start(), '_write_pkg_rels')
         root_mock.attach_mock(patch3.start(), '_write_parts')
+        root_mock.attach_mock(patch4.start(), '_write_parts_in_parallel')
 
         def fin():
             patch1.stop()
             patch2.stop()
             patch3.stop()
+            patch4.stop()
 
         request.addfinalizer(fin)
         return root_mock
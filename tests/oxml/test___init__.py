@@ -11,7 +11,7 @@ import pytest
 from lxml import etree
 
 from pptx.oxml import (
-    oxml_parser, parse_xml, register_element_cls
+    oxml_parser, parse_xml, parse_xml_readonly, register_element_cls
 )
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
@@ -52,6 +52,23 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeParseXmlReadonly(object):
+
+    def it_uses_the_readonly_parser_to_parse_xml(
+            self, mock_xml_bytes, fromstring, mock_readonly_parser):
+        element = parse_xml_readonly(mock_xml_bytes)
+        fromstring.assert_called_once_with(
+            mock_xml_bytes, mock_readonly_parser
+        )
+        assert element is fromstring.return_value
+
+    def it_parses_to_plain_elements(self, xml_bytes, stripped_xml_bytes):
+        foo = parse_xml_readonly(xml_bytes)
+        assert type(foo) is etree._Element
+        assert type(foo.find(qn('a:bar'))) is etree._Element
+        assert etree.tostring(foo) == stripped_xml_bytes
+
+
 class DescribeRegisterCustomElementClass(object):
 
     def it_determines_cust_elm_class_constructed_for_specified_tag(
@@ -59,7 +76,7 @@ class DescribeRegisterCustomElementClass(object):
         register_element_cls('a:foo', CustElmCls)
         foo = etree.fromstring(xml_bytes, oxml_parser)
         assert type(foo) is CustElmCls
-        assert type(foo.find(qn('a:bar'))) is etree._Element
+        assert type(foo.find(qn('a:bar'))) is BaseOxmlElement
 
 
 # ===========================================================================
@@ -85,6 +102,11 @@ def mock_oxml_parser(request):
     return var_mock(request, 'pptx.oxml.oxml_parser')
 
 
+@pytest.fixture
+def mock_readonly_parser(request):
+    return var_mock(request, 'pptx.oxml.readonly_parser')
+
+
 @pytest.fixture
 def mock_xml_bytes(request):
     return loose_mock(request, 'xml_bytes')
@@ -18,6 +18,15 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId('rId1')
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_several_sldId_elements(self):
+        sldIdLst = element('p:sldIdLst/p:sldId{r:id=rId4,id=300}')
+        sldIds = sldIdLst.add_sldIds(['rId1', 'rId2'])
+        assert sldIdLst.xml == xml(
+            'p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{r:id=rId1,id=301}'
+            ',p:sldId{r:id=rId2,id=302})'
+        )
+        assert sldIds == list(sldIdLst)[1:]
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
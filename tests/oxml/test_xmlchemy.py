@@ -8,18 +8,199 @@ provided by the metaclass-built test classes at the end of the file.
 
 from __future__ import absolute_import, print_function
 
+import gc
 import pytest
 
+from lxml import etree
+
 from pptx.exc import InvalidXmlError
 from pptx.oxml import register_element_cls
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OneOrMore, OptionalAttribute,
-    RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
+    OxmlElement, RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice,
+    compiled_xpath
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
+
+
+class DescribeBaseOxmlElement(object):
+
+    def it_counts_each_change_made_to_its_tree(self, change_fixture):
+        p, change = change_fixture
+        generation = p.generation
+        change(p)
+        assert p.generation > generation
+
+    def it_leaves_reading_its_text_to_lxml(self):
+        for name in ('tag', 'tail', 'text'):
+            assert getattr(BaseOxmlElement, name) is (
+                getattr(etree.ElementBase, name)
+            )
+
+    def it_does_not_count_a_read_as_a_change(self):
+        p = element('a:p/(a:pPr{lvl=2},a:r/a:t"foo")')
+        p.pPr.lvl, p.r_lst[0].t.text, p.xpath('.//a:t'), p.xml
+        assert p.generation == 0
+
+    def it_counts_a_move_as_a_change_to_both_trees(self):
+        p, p_2 = element('a:p/a:r'), element('a:p')
+        p_2.append(p.r_lst[0])
+        assert p.generation == 1
+        assert p_2.generation == 1
+
+    def it_evaluates_an_xpath_expression_with_variables(self):
+        p = element('a:p/(a:r/a:t"foo",a:r/a:t"bar")')
+        assert p.xpath('a:r/a:t/text()') == ['foo', 'bar']
+        assert p.xpath('a:r[$idx]/a:t/text()', idx=2) == ['bar']
+
+    def it_knows_the_lowest_free_id_in_its_tree(self):
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2}'
+            ',p:sp/p:nvSpPr/p:cNvPr{id=4},p:sp/p:nvSpPr/p:cNvPr{id=foo})'
+        )
+        assert spTree[1].lowest_free_id == 3
+
+    def it_keeps_the_ids_in_its_tree_up_to_date(self, ids_fixture):
+        spTree, change, expected_value = ids_fixture
+        spTree.lowest_free_id
+        change(spTree)
+        assert spTree.lowest_free_id == expected_value
+
+    def it_counts_the_changes_to_its_children(self):
+        p = element('a:p/(a:r/a:t,a:r)')
+        r = p.r_lst[0]
+        r.t.text = 'foo'
+        r.set('b', '1')
+        assert p.child_generation == 0
+        r.addnext(OxmlElement('a:br'))
+        p.remove(r)
+        element('a:p').append(p[0])
+        assert p.child_generation == 3
+
+    def it_counts_the_changes_to_the_keys_in_its_tree(self):
+        spTree = element('p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo}')
+        cNvPr = spTree.xpath('.//p:cNvPr')[0]
+        cNvPr.set('descr', 'foobar')
+        assert spTree.key_generation == 0
+        cNvPr.set('name', 'Bar')
+        cNvPr.set('id', '3')
+        cNvPr.clear()
+        assert spTree.key_generation == 3
+
+    def it_keeps_its_count_while_the_root_element_is_referenced(self):
+        p = element('a:p/a:r/a:t')
+        p.r_lst[0].t.text = 'foo'
+        gc.collect()
+        p.r_lst[0].t.text = 'bar'
+        assert p.generation == 2
+
+    def but_it_does_not_see_a_change_made_around_its_methods(
+            self, bypass_fixture):
+        p, change = bypass_fixture
+        change(p)
+        assert p.generation == 0
+        p._mark_changed()
+        assert p.generation == 1
+
+    def it_reports_the_generation_of_its_tree(self):
+        p = element('a:p/a:r/a:t')
+        t = p.r_lst[0].t
+        t.text = 'foo'
+        assert t.generation == p.generation == 1
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        lambda p: etree.SubElement(p, qn('a:br')),
+        lambda p: p.r_lst[0].attrib.__setitem__('b', '1'),
+        lambda p: p.pPr.attrib.pop('lvl'),
+        lambda p: etree.strip_elements(p, qn('a:r')),
+    ])
+    def bypass_fixture(self, request):
+        change = request.param
+        p = element('a:p/(a:pPr{lvl=2},a:r/a:t"foo")')
+        return p, change
+
+    @pytest.fixture(params=[
+        lambda p: p.r_lst[0].set('b', '1'),
+        lambda p: setattr(p.r_lst[0], 'tag', qn('a:fld')),
+        lambda p: setattr(p.r_lst[0].t, 'text', 'bar'),
+        lambda p: setattr(p.r_lst[0].t, 'tail', 'bar'),
+        lambda p: p.append(OxmlElement('a:br')),
+        lambda p: p.extend([OxmlElement('a:br')]),
+        lambda p: p.insert(0, OxmlElement('a:br')),
+        lambda p: p.r_lst[0].addnext(OxmlElement('a:br')),
+        lambda p: p.r_lst[0].addprevious(OxmlElement('a:br')),
+        lambda p: p.replace(p.r_lst[0], OxmlElement('a:br')),
+        lambda p: p.remove(p.r_lst[0]),
+        lambda p: p.r_lst[0].delete(),
+        lambda p: p.r_lst[0].clear(),
+        lambda p: p.__setitem__(0, OxmlElement('a:br')),
+        lambda p: p.__delitem__(0),
+        lambda p: p.add_r(),
+        lambda p: p.get_or_add_endParaRPr(),
+        lambda p: p._remove_pPr(),
+        lambda p: setattr(p.pPr, 'lvl', 0),
+        lambda p: setattr(p.pPr, 'lvl', 3),
+    ])
+    def change_fixture(self, request):
+        change = request.param
+        p = element('a:p/(a:pPr{lvl=2},a:r/a:t"foo")')
+        return p, change
+
+    @pytest.fixture(params=[
+        (lambda spTree: spTree.append(_sp(3)), 4),
+        (lambda spTree: spTree.extend([_sp(3), _sp(4)]), 5),
+        (lambda spTree: spTree.insert(1, _sp(3)), 4),
+        (lambda spTree: spTree[1].addnext(_sp(3)), 4),
+        (lambda spTree: spTree[1].addprevious(_sp(3)), 4),
+        (lambda spTree: spTree.remove(spTree[1]), 2),
+        (lambda spTree: spTree[1].delete(), 2),
+        (lambda spTree: spTree.__delitem__(1), 2),
+        (lambda spTree: spTree.__delitem__(slice(1, None)), 2),
+        (lambda spTree: spTree.__setitem__(1, _sp(5)), 2),
+        (lambda spTree: spTree.replace(spTree[1], _sp(5)), 2),
+        (lambda spTree: spTree[1].clear(), 2),
+        (lambda spTree: spTree[1][0][0].set('id', '7'), 2),
+        (lambda spTree: spTree[0][0].set('id', '3'), 1),
+        (lambda spTree: element('p:spTree').append(spTree[1]), 2),
+    ])
+    def ids_fixture(self, request):
+        change, expected_value = request.param
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2})'
+        )
+        return spTree, change, expected_value
+
+
+class DescribeCompiledXpath(object):
+
+    def it_compiles_each_expression_only_once(self):
+        xpath = compiled_xpath('./a:r/a:t')
+        assert compiled_xpath('./a:r/a:t') is xpath
+        assert compiled_xpath('./a:r') is not xpath
+
+    def it_compiles_an_expression_once_for_each_namespace_mapping(self):
+        xpath = compiled_xpath('./x:r', {'x': 'http://foo'})
+        assert compiled_xpath('./x:r', {'x': 'http://foo'}) is xpath
+        assert compiled_xpath('./x:r', {'x': 'http://bar'}) is not xpath
+
+    def it_keeps_only_the_most_recently_used_expressions(self):
+        xpath = compiled_xpath('./a:r/a:t[1]')
+        kept_xpath = compiled_xpath('./a:r/a:t[2]')
+        for idx in range(300):
+            compiled_xpath('./a:r[%d]' % idx)
+            compiled_xpath('./a:r/a:t[2]')
+        assert compiled_xpath('./a:r/a:t[2]') is kept_xpath
+        assert compiled_xpath('./a:r/a:t[1]') is not xpath
+
+    def it_uses_the_standard_namespace_prefixes_by_default(self):
+        p = element('a:p/(a:r,a:br)')
+        assert compiled_xpath('./a:r')(p) == [p.r_lst[0]]
 
 
 class DescribeCustomElementClass(object):
@@ -639,3 +820,7 @@ def an_oomChild():
 
 def an_oooChild():
     return CT_OooChildBuilder()
+
+
+def _sp(id_):
+    return element('p:sp/p:nvSpPr/p:cNvPr{id=%d}' % id_)
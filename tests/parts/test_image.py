@@ -10,12 +10,15 @@ import pytest
 
 from pptx.compat import BytesIO
 from pptx.package import Package
-from pptx.parts.image import Image, ImagePart
-from pptx.util import Px
+from pptx.parts.image import (
+    DownsamplePolicy, Image, _ImageCache, image_cache, ImagePart
+)
+from pptx.util import Inches, Px
 
 from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
-    class_mock, initializer_mock, instance_mock, method_mock, property_mock
+    class_mock, function_mock, initializer_mock, instance_mock, method_mock,
+    patch, property_mock
 )
 
 
@@ -54,6 +57,14 @@ class DescribeImagePart(object):
         image, expected_size = size_fixture
         assert image._px_size == expected_size
 
+    def it_reuses_the_image_it_was_created_from(self, package_):
+        package_.next_image_partname.return_value = '/ppt/media/image1.jpg'
+        image = Image.from_file(test_image_path)
+        image_part = ImagePart.new(package_, image)
+        assert image_part._blob_image is image
+        assert image_part._px_size == (204, 204)
+        assert image._size == (204, 204)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -110,6 +121,39 @@ class DescribeImagePart(object):
 
 class DescribeImage(object):
 
+    def it_loads_a_cached_image_only_once(
+            self, tmpdir, enabled_image_cache):
+        path = str(tmpdir.join('icon.jpeg'))
+        with open(test_image_path, 'rb') as src, open(path, 'wb') as f:
+            f.write(src.read())
+        image = Image.from_file(path)
+        assert Image.from_file(path) is image
+        with open(test_image_path, 'rb') as f:
+            assert Image.from_file(f) is not image
+        with open(test_image_path, 'rb') as f:
+            assert Image.from_file(f) is Image.from_file(BytesIO(image.blob))
+
+    def it_loads_a_cached_image_again_when_its_file_changes(
+            self, tmpdir, enabled_image_cache):
+        path = str(tmpdir.join('image.png'))
+        with open(test_image_path, 'rb') as src, open(path, 'wb') as f:
+            f.write(src.read())
+        image = Image.from_file(path)
+        with open(new_image_path, 'rb') as src, open(path, 'wb') as f:
+            f.write(src.read())
+        new_image = Image.from_file(path)
+        assert new_image is not image
+        assert new_image.ext == 'png'
+
+    def it_loads_an_image_again_when_the_cache_is_disabled(self):
+        assert image_cache.max_bytes == 0
+        image = Image.from_file(test_image_path)
+        assert Image.from_file(test_image_path) is not image
+
+    def it_returns_an_image_it_is_given_as_it_is(self):
+        image = Image(b'foobar', 'foo.png')
+        assert Image.from_file(image) is image
+
     def it_can_construct_from_a_path(self, from_path_fixture):
         image_file, blob, filename, image_ = from_path_fixture
         image = Image.from_file(image_file)
@@ -159,6 +203,13 @@ class DescribeImage(object):
         assert image.dpi == dpi
         assert image._pil_props == (format, size, None)
 
+    def it_uses_PIL_when_it_cant_read_the_image_header(self, pil_fixture,
+                                                        probe_):
+        image, size, format, dpi = pil_fixture
+        probe_.return_value = None
+        assert image._pil_props == (format, size, None)
+        probe_.assert_called_once_with(image._blob)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -212,7 +263,7 @@ class DescribeImage(object):
         return blob, filename
 
     @pytest.fixture
-    def from_path_fixture(self, from_blob_, image_):
+    def from_path_fixture(self, from_blob_, image_, empty_image_cache):
         image_file = test_image_path
         with open(test_image_path, 'rb') as f:
             blob = f.read()
@@ -221,7 +272,7 @@ class DescribeImage(object):
         return image_file, blob, filename, image_
 
     @pytest.fixture
-    def from_stream_fixture(self, from_blob_, image_):
+    def from_stream_fixture(self, from_blob_, image_, empty_image_cache):
         with open(test_image_path, 'rb') as f:
             blob = f.read()
             image_file = BytesIO(blob)
@@ -244,6 +295,17 @@ class DescribeImage(object):
     def _format_(self, request):
         return property_mock(request, Image, '_format')
 
+    @pytest.fixture
+    def empty_image_cache(self, request):
+        image_cache.clear()
+        request.addfinalizer(image_cache.clear)
+
+    @pytest.fixture
+    def enabled_image_cache(self, request, empty_image_cache):
+        _patch = patch.object(image_cache, 'max_bytes', 1024 * 1024)
+        request.addfinalizer(_patch.stop)
+        _patch.start()
+
     @pytest.fixture
     def from_blob_(self, request):
         return method_mock(request, Image, 'from_blob')
@@ -259,3 +321,138 @@ class DescribeImage(object):
     @pytest.fixture
     def _pil_props_(self, request):
         return property_mock(request, Image, '_pil_props')
+
+    @pytest.fixture
+    def probe_(self, request):
+        return function_mock(request, 'pptx.parts.image.probe')
+
+
+class DescribeDownsamplePolicy(object):
+
+    def it_knows_the_pixel_size_to_downsample_to(self, px_size_fixture):
+        downsampling, image_, cx, cy, expected_value = px_size_fixture
+        assert downsampling.px_size(image_, cx, cy) == expected_value
+
+    def it_leaves_an_image_that_doesnt_need_downsampling(self):
+        downsampling = DownsamplePolicy(dpi=300)
+        with open(test_image_path, 'rb') as f:
+            image = Image(f.read(), 'python-icon.jpeg')
+        assert downsampling.key(image, Inches(1)) is None
+        assert downsampling.apply(image, Inches(1)) is image
+
+    def it_knows_the_key_of_a_downsampled_image(self):
+        downsampling = DownsamplePolicy(dpi=100, jpeg_quality=80)
+        with open(test_image_path, 'rb') as f:
+            image = Image(f.read(), 'python-icon.jpeg')
+        assert downsampling.key(image, Inches(1)) == (
+            image.sha1, (100, 100), 80
+        )
+
+    def it_can_downsample_an_image(self, downsample_fixture):
+        downsampling, image, cx, expected_values = downsample_fixture
+        size, dpi, ext, filename = expected_values
+
+        downsampled_image = downsampling.apply(image, cx)
+
+        assert downsampled_image.size == size
+        assert downsampled_image.dpi == dpi
+        assert downsampled_image.ext == ext
+        assert downsampled_image.filename == filename
+
+    def it_saves_a_downsampled_image_at_a_whole_dpi(self, request):
+        PIL_Image = pytest.importorskip('PIL.Image')
+        save_ = method_mock(request, PIL_Image.Image, 'save', autospec=True)
+        downsampling = DownsamplePolicy(dpi=100)
+        with open(test_image_path, 'rb') as f:
+            image = Image(f.read(), 'python-icon.jpeg')
+
+        downsampling.apply(image, int(Inches(1) * 1.013))
+
+        dpi = save_.call_args[1]['dpi']
+        assert dpi == (100, 100)
+        assert all(isinstance(value, int) for value in dpi)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('python-icon.jpeg',   None, Inches(1),   (100, 100), 'jpg',
+         'python-icon.jpeg'),
+        ('python-icon.jpeg',   80,   Inches(0.5), (50, 50),   'jpg',
+         'python-icon.jpeg'),
+        ('monty-truth.png',    None, Inches(1),   (100, 143), 'png',
+         'monty-truth.png'),
+        ('monty-truth.png',    80,   Inches(1),   (100, 143), 'jpg',
+         'monty-truth.jpg'),
+        ('python-powered.png', 80,   Inches(1),   (100, 40),  'png',
+         'python-powered.png'),
+    ])
+    def downsample_fixture(self, request):
+        filename, jpeg_quality, cx, size, ext, expected_filename = (
+            request.param
+        )
+        downsampling = DownsamplePolicy(dpi=100, jpeg_quality=jpeg_quality)
+        with open(absjoin(test_file_dir, filename), 'rb') as f:
+            image = Image(f.read(), filename)
+        expected_values = (size, (100, 100), ext, expected_filename)
+        return downsampling, image, cx, expected_values
+
+    @pytest.fixture(params=[
+        ((4000, 3000), (300, 300), 'jpg', None,      None,      150,
+         (2000, 1500)),
+        ((4000, 3000), (300, 300), 'jpg', Inches(4), None,      150,
+         (600, 450)),
+        ((4000, 3000), (300, 300), 'png', None,      Inches(1), 150,
+         (200, 150)),
+        ((4000, 3000), (300, 300), 'jpg', Inches(4), Inches(1), 150,
+         (600, 150)),
+        ((4000, 3000), (72, 72),   'jpg', None,      None,      150,
+         (4000, 3000)),
+        ((400, 300),   (72, 72),   'gif', Inches(8), None,      150,
+         (400, 300)),
+        ((400, 300),   (72, 72),   'wmf', Inches(1), None,      150,
+         (400, 300)),
+    ])
+    def px_size_fixture(self, request):
+        size, dpi, ext, cx, cy, target_dpi, expected_value = request.param
+        downsampling = DownsamplePolicy(dpi=target_dpi)
+        image_ = instance_mock(
+            request, Image, size=size, dpi=dpi, ext=ext
+        )
+        return downsampling, image_, cx, cy, expected_value
+
+
+class Describe_ImageCache(object):
+
+    def it_is_disabled_by_default(self):
+        cache = _ImageCache()
+        cache.put('key', Image(b'1234', None))
+        assert cache.get('key') is None
+
+    def it_returns_the_image_cached_under_a_key(self):
+        cache, image = _ImageCache(max_bytes=10), Image(b'blob', None)
+        cache.put('key', image)
+        assert cache.get('key') is image
+        assert cache.get('other key') is None
+
+    def it_evicts_the_least_recently_used_images(self):
+        cache = _ImageCache(max_bytes=10)
+        images = [Image(b'1234', None) for _ in range(3)]
+        cache.put('a', images[0])
+        cache.put('b', images[1])
+        cache.get('a')
+        cache.put('c', images[2])
+        assert cache.get('a') is images[0]
+        assert cache.get('b') is None
+        assert cache.get('c') is images[2]
+
+    def it_doesnt_cache_an_image_larger_than_its_bound(self):
+        cache = _ImageCache(max_bytes=3)
+        cache.put('key', Image(b'1234', None))
+        assert cache.get('key') is None
+
+    def it_can_be_cleared(self):
+        cache = _ImageCache(max_bytes=10)
+        cache.put('key', Image(b'1234', None))
+        cache.clear()
+        assert cache.get('key') is None
+        assert cache._nbytes == 0
@@ -9,6 +9,7 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import RelationshipCollection
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
@@ -92,7 +93,7 @@ class DescribePresentationPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         prs_part, file_, package_ = save_fixture
         prs_part.save(file_)
-        package_.save.assert_called_once_with(file_)
+        package_.save.assert_called_once_with(file_, None, None, False)
 
     def it_can_add_a_new_slide(self, add_slide_fixture):
         prs_part, slide_layout_, SlidePart_, partname = add_slide_fixture[:4]
@@ -110,6 +111,47 @@ class DescribePresentationPart(object):
         assert rId is rId_
         assert slide is slide_
 
+    def it_can_add_several_new_slides(
+            self, request, package_, slide_layout_, SlidePart_):
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None,
+            element('p:presentation/p:sldIdLst/p:sldId{r:id=rId1}'), package_
+        )
+        prs_part.rels.add_relationship(RT.SLIDE_MASTER, 'master', 'rId1')
+        slide_parts_ = [
+            instance_mock(request, SlidePart, name='slide_part_%d' % n)
+            for n in range(3)
+        ]
+        sld = element('p:sld/p:cSld/p:spTree')
+        slide_parts_[0].slide.element = sld
+        SlidePart_.new.side_effect = slide_parts_
+
+        rIds_and_slides = prs_part.add_slides(slide_layout_, 3)
+
+        slide_parts_[0].slide.shapes.clone_layout_placeholders\
+            .assert_called_once_with(slide_layout_)
+        calls = SlidePart_.new.call_args_list
+        assert calls[0] == call(
+            PackURI('/ppt/slides/slide2.xml'), package_, slide_layout_.part
+        )
+        for n, call_ in enumerate(calls[1:], 3):
+            partname, package, slide_layout_part, sld_copy = call_[0]
+            assert partname == PackURI('/ppt/slides/slide%d.xml' % n)
+            assert package is package_
+            assert slide_layout_part is slide_layout_.part
+            assert sld_copy is not sld
+            assert sld_copy.xml == sld.xml
+        assert rIds_and_slides == [
+            ('rId2', slide_parts_[0].slide), ('rId3', slide_parts_[1].slide),
+            ('rId4', slide_parts_[2].slide)
+        ]
+        assert prs_part.related_parts['rId4'] is slide_parts_[2]
+
+    def it_adds_no_slides_when_count_is_zero(self, slide_layout_, SlidePart_):
+        prs_part = PresentationPart(None, None, element('p:presentation'))
+        assert prs_part.add_slides(slide_layout_, 0) == []
+        assert SlidePart_.new.call_count == 0
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_id_fixture):
         prs_part, slide_part_, expected_value = slide_id_fixture
         _slide_id = prs_part.slide_id(slide_part_)
@@ -120,6 +162,53 @@ class DescribePresentationPart(object):
         with pytest.raises(ValueError):
             prs_part.slide_id(slide_part_)
 
+    def it_finds_the_index_of_a_slide_part(self, slide_id_fixture):
+        prs_part, slide_part_, _ = slide_id_fixture
+        assert prs_part.slide_index(slide_part_) == 1
+
+    def it_raises_on_slide_index_not_found(self, slide_id_raises_fixture):
+        prs_part, slide_part_ = slide_id_raises_fixture
+        with pytest.raises(ValueError):
+            prs_part.slide_index(slide_part_)
+
+    def it_indexes_its_slides_once_until_they_change(
+            self, related_parts_prop_):
+        prs_elm = element(
+            'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
+            'b,id=257})'
+        )
+        sldIdLst = prs_elm[0]
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, prs_elm
+        )
+        related_parts_prop_.return_value = {'a': 'A', 'b': 'B', 'c': 'C'}
+        slide_ids = prs_part._slide_ids
+        assert prs_part._slide_ids is slide_ids
+        assert slide_ids.rIds == {256: 'a', 257: 'b'}
+        assert slide_ids.positions == {'A': 0, 'B': 1}
+
+        sldIdLst.insert(0, sldIdLst[1])
+        assert prs_part._slide_ids is not slide_ids
+        assert prs_part._slide_ids.positions == {'A': 1, 'B': 0}
+        slide_ids = prs_part._slide_ids
+        sldIdLst.add_sldId('c')
+        assert prs_part._slide_ids is not slide_ids
+        assert prs_part._slide_ids.slide_ids == [257, 256, 258]
+        slide_ids = prs_part._slide_ids
+        sldIdLst[0].set('id', '300')
+        assert prs_part._slide_ids is not slide_ids
+        assert prs_part._slide_ids.rIds == {300: 'b', 256: 'a', 258: 'c'}
+        slide_ids = prs_part._slide_ids
+        prs_part.rels.add_relationship(RT.SLIDE, 'D', 'rId1')
+        assert prs_part._slide_ids is not slide_ids
+        slide_ids = prs_part._slide_ids
+        rels = RelationshipCollection('/')
+        rels.add_relationship(RT.SLIDE, 'E', 'rId1')
+        rels.pop('rId1')
+        assert prs_part._slide_ids is slide_ids
+        prs_part.rels.pop('rId1')
+        assert prs_part._slide_ids is not slide_ids
+
     def it_finds_a_slide_by_slide_id(self, get_slide_fixture):
         prs_part, slide_id, expected_value = get_slide_fixture
         slide = prs_part.get_slide(slide_id)
@@ -161,7 +250,9 @@ class DescribePresentationPart(object):
             'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
             'b,id=257},p:sldId{r:id=c,id=258})'
         )
-        prs_part = PresentationPart(None, None, prs_elm)
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, prs_elm
+        )
         slide_id = 257 if is_present else 666
         expected_value = slide_ if is_present else None
         related_parts_prop_.return_value = {
@@ -253,7 +344,9 @@ class DescribePresentationPart(object):
             'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
             'b,id=257},p:sldId{r:id=c,id=258})'
         )
-        prs_part = PresentationPart(None, None, prs_elm)
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, prs_elm
+        )
         expected_value = 257
         related_parts_prop_.return_value = {
             'a': None, 'b': slide_part_, 'c': None
@@ -266,7 +359,9 @@ class DescribePresentationPart(object):
             'p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id='
             'b,id=257},p:sldId{r:id=c,id=258})'
         )
-        prs_part = PresentationPart(None, None, prs_elm)
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, prs_elm
+        )
         related_parts_prop_.return_value = {'a': None, 'b': None, 'c': None}
         return prs_part, slide_part_
 
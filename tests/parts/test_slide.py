@@ -53,12 +53,16 @@ class DescribeBaseSlidePart(object):
         image_part, rId = slide.get_or_add_image_part(image_file)
 
         slide._package.get_or_add_image_part.assert_called_once_with(
-            image_file
+            image_file, None, None, None
         )
         slide.relate_to.assert_called_once_with(image_part_, RT.IMAGE)
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_knows_the_sizes_an_image_is_displayed_at(self, sizes_fixture):
+        base_slide, rId, expected_value = sizes_fixture
+        assert base_slide.image_display_sizes(rId) == expected_value
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -85,6 +89,27 @@ class DescribeBaseSlidePart(object):
         base_slide = BaseSlidePart(None, None, sld, None)
         return base_slide, expected_value
 
+    @pytest.fixture(params=[
+        ('p:pic/(p:blipFill/a:blip{r:embed=rId9},p:spPr/a:xfrm/a:ext{cx=4,cy='
+         '3})', []),
+        ('p:pic/(p:blipFill/a:blip{r:embed=rId1},p:spPr/a:xfrm/a:ext{cx=4,cy='
+         '3})', [(4, 3)]),
+        ('(p:pic/(p:blipFill/a:blip{r:embed=rId1},p:spPr/a:xfrm/a:ext{cx=4,cy'
+         '=3}),p:pic/(p:blipFill/a:blip{r:embed=rId1},p:spPr/a:xfrm/a:ext{cx='
+         '8,cy=2}))', [(4, 3), (8, 2)]),
+        ('p:pic/(p:blipFill/(a:blip{r:embed=rId1},a:srcRect{l=25000,r=25000,'
+         'b=50000}),p:spPr/a:xfrm/a:ext{cx=4,cy=3})', [(8, 6)]),
+        ('p:pic/(p:blipFill/a:blip{r:embed=rId1},p:spPr)', None),
+        ('p:grpSp/p:pic/(p:blipFill/a:blip{r:embed=rId1},p:spPr/a:xfrm/a:ext{'
+         'cx=4,cy=3})', None),
+        ('p:sp/p:spPr/a:blipFill/a:blip{r:embed=rId1}', None),
+    ])
+    def sizes_fixture(self, request):
+        spTree_cxml, expected_value = request.param
+        sld = element('p:sld/p:cSld/p:spTree/%s' % spTree_cxml)
+        base_slide = BaseSlidePart(None, None, sld, None)
+        return base_slide, 'rId1', expected_value
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -467,6 +492,18 @@ class DescribeSlidePart(object):
         )
         assert isinstance(slide_part, SlidePart)
 
+    def it_can_create_a_slide_part_from_given_XML(self, new_fixture):
+        slide_layout_part_, partname, package_, SlidePart_init_ = (
+            new_fixture[:4]
+        )
+        sld = element('p:sld/p:cSld')
+
+        SlidePart.new(partname, package_, slide_layout_part_, sld)
+
+        SlidePart_init_.assert_called_once_with(
+            partname, CT.PML_SLIDE, sld, package_
+        )
+
     def it_provides_access_to_its_slide(self, slide_fixture):
         slide_part, Slide_, sld, slide_ = slide_fixture
         slide = slide_part.slide
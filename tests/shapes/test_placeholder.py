@@ -11,7 +11,7 @@ import pytest
 from pptx.chart.data import ChartData
 from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.oxml.shapes.shared import ST_Direction, ST_PlaceholderSize
-from pptx.parts.image import ImagePart
+from pptx.parts.image import DownsamplePolicy, Image, ImagePart
 from pptx.parts.slide import NotesSlidePart, SlideLayoutPart, SlidePart
 from pptx.shapes.placeholder import (
     BasePlaceholder, _BaseSlidePlaceholder, ChartPlaceholder,
@@ -503,9 +503,11 @@ class DescribePicturePlaceholder(object):
         picture_ph, image_file, pic = insert_fixture[:3]
         PlaceholderPicture_, placeholder_picture_ = insert_fixture[3:]
 
-        placeholder_picture = picture_ph.insert_picture(image_file)
+        placeholder_picture = picture_ph.insert_picture(image_file, False)
 
-        picture_ph._new_placeholder_pic.assert_called_once_with(image_file)
+        picture_ph._new_placeholder_pic.assert_called_once_with(
+            image_file, False
+        )
         picture_ph._replace_placeholder_with.assert_called_once_with(pic)
         PlaceholderPicture_.assert_called_once_with(pic, picture_ph._parent)
         assert placeholder_picture is placeholder_picture_
@@ -513,31 +515,54 @@ class DescribePicturePlaceholder(object):
     def it_creates_a_pic_element_to_help(self, pic_fixture):
         picture_ph, image_file, expected_xml = pic_fixture
         pic = picture_ph._new_placeholder_pic(image_file)
-        picture_ph._get_or_add_image.assert_called_once_with(image_file)
+        picture_ph._get_or_add_image.assert_called_once_with(
+            image_file, None
+        )
         assert pic.xml == expected_xml
 
     def it_adds_an_image_to_help(self, get_or_add_fixture):
-        placeholder, image_file, expected_value = get_or_add_fixture
+        placeholder, image_file, image_, policy_ = get_or_add_fixture[:4]
+        expected_value = get_or_add_fixture[4]
 
-        value = placeholder._get_or_add_image(image_file)
+        value = placeholder._get_or_add_image(image_file, policy_)
 
         placeholder.part.get_or_add_image_part.assert_called_once_with(
-            image_file
+            image_, 400, None, policy_
         )
         assert value == expected_value
 
+    def it_knows_the_size_an_image_fills_it_at(self, fill_fixture):
+        placeholder, image_size, expected_value = fill_fixture
+        assert placeholder._fill_extents(image_size) == expected_value
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ((400, 300), (None, 300)),
+        ((800, 300), (None, 300)),
+        ((300, 400), (400, None)),
+        ((4, 3), (None, 300)),
+    ])
+    def fill_fixture(self, request):
+        image_size, expected_value = request.param
+        sp = element('p:sp/p:spPr/a:xfrm/a:ext{cx=400,cy=300}')
+        placeholder = PicturePlaceholder(sp, None)
+        return placeholder, image_size, expected_value
+
     @pytest.fixture
-    def get_or_add_fixture(self, part_prop_, image_part_):
-        placeholder = PicturePlaceholder(None, None)
+    def get_or_add_fixture(self, part_prop_, image_part_, Image_, image_,
+                           policy_):
+        sp = element('p:sp/p:spPr/a:xfrm/a:ext{cx=400,cy=300}')
+        placeholder = PicturePlaceholder(sp, None)
         image_file, rId, desc, image_size = 'f.png', 'rId6', 'desc', (42, 24)
+        Image_.from_file.return_value = image_
+        image_.size = (300, 600)
         part_prop_.return_value.get_or_add_image_part.return_value = (
             image_part_, rId
         )
         image_part_.desc, image_part_._px_size = desc, image_size
         expected_value = rId, desc, image_size
-        return placeholder, image_file, expected_value
+        return placeholder, image_file, image_, policy_, expected_value
 
     @pytest.fixture
     def insert_fixture(self, PlaceholderPicture_, placeholder_picture_,
@@ -581,6 +606,14 @@ class DescribePicturePlaceholder(object):
             request, PicturePlaceholder, '_get_or_add_image'
         )
 
+    @pytest.fixture
+    def Image_(self, request):
+        return class_mock(request, 'pptx.shapes.placeholder.Image')
+
+    @pytest.fixture
+    def image_(self, request):
+        return instance_mock(request, Image)
+
     @pytest.fixture
     def image_part_(self, request):
         return instance_mock(request, ImagePart)
@@ -607,6 +640,10 @@ class DescribePicturePlaceholder(object):
     def placeholder_picture_(self, request):
         return instance_mock(request, PlaceholderPicture)
 
+    @pytest.fixture
+    def policy_(self, request):
+        return instance_mock(request, DownsamplePolicy)
+
     @pytest.fixture
     def _replace_placeholder_with_(self, request):
         return method_mock(
@@ -14,6 +14,7 @@ from pptx.enum.shapes import (
 )
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
+from pptx.package import Package
 from pptx.parts.image import ImagePart
 from pptx.parts.slide import SlidePart
 from pptx.shapes.autoshape import Shape
@@ -103,6 +104,73 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    def it_can_get_a_shape_by_id(self, get_by_id_fixture):
+        shapes, shape_id, BaseShapeFactory_, calls, expected_value = (
+            get_by_id_fixture
+        )
+        shape = shapes.get_by_id(shape_id, 'default')
+        assert BaseShapeFactory_.call_args_list == calls
+        assert shape == expected_value
+
+    def it_can_get_a_shape_by_name(self, get_by_name_fixture):
+        shapes, name, BaseShapeFactory_, calls, expected_value = (
+            get_by_name_fixture
+        )
+        shape = shapes.get_by_name(name, 'default')
+        assert BaseShapeFactory_.call_args_list == calls
+        assert shape == expected_value
+
+    def it_indexes_its_shapes_once_until_the_tree_changes(
+            self, _caches_proxies_):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:sp/p:nvSpPr/p:'
+            'cNvPr{id=3,name=Bar})'
+        )
+        shapes = _BaseShapes(spTree, None)
+        index = shapes._index
+        spTree[0].xpath('.//p:cNvPr')[0].set('descr', 'foobar')
+        assert shapes._index is index
+        spTree[0].xpath('.//p:cNvPr')[0].set('name', 'Baz')
+        assert shapes._index is not index
+        assert list(shapes._index.by_name) == ['Bar', 'Baz']
+        index = shapes._index
+        spTree.remove(spTree[0])
+        assert shapes._index is not index
+        assert shapes._index.shape_elms == list(spTree)
+
+    def it_can_return_the_same_shape_each_time(self, _caches_proxies_):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:sp/p:nvSpPr/p:'
+            'cNvPr{id=3,name=Bar})'
+        )
+        shapes = _BaseShapes(spTree, None)
+        assert shapes[0] is not shapes[0]
+
+        _caches_proxies_.return_value = True
+        shape = shapes[0]
+        assert list(shapes) == [shape, shapes[1]]
+        assert list(shapes)[0] is shape
+        assert shapes.get_by_id(2) is shape
+        assert shapes.get_by_name('Foo') is shape
+        assert shapes[1] is shapes.get_by_id(3)
+
+        spTree.remove(spTree[1])
+        assert shapes[0] is not shape
+        assert shapes[0] is shapes[0]
+
+        shape = shapes[0]
+        spTree[0].xpath('.//p:cNvPr')[0].set('descr', 'foobar')
+        assert shapes[0] is shape
+        spTree[0].xpath('.//p:cNvPr')[0].set('name', 'Baz')
+        assert shapes[0] is not shape
+
+    def it_knows_whether_its_package_caches_proxies(self, request):
+        package_ = instance_mock(request, Package, cache_shape_proxies=True)
+        part_ = instance_mock(request, SlidePart, package=package_)
+        property_mock(request, _BaseShapes, 'part', return_value=part_)
+        shapes = _BaseShapes(element('p:spTree'), None)
+        assert shapes._caches_proxies is True
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
@@ -132,8 +200,41 @@ class Describe_BaseShapes(object):
         )
         return shapes, placeholder_, expected_xml
 
+    @pytest.fixture(params=[
+        (3, 1), (2, 0), (4, 2), (9, None),
+    ])
+    def get_by_id_fixture(
+            self, request, BaseShapeFactory_, shape_, _caches_proxies_):
+        shape_id, sp_idx = request.param
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id='
+            '3},p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=4},p:sp/p:nvSpPr/p:cNvPr{id='
+            '9}))'
+        )
+        shapes = _BaseShapes(spTree, None)
+        if sp_idx is None:
+            return shapes, shape_id, BaseShapeFactory_, [], 'default'
+        calls = [call(spTree[sp_idx], shapes)]
+        return shapes, shape_id, BaseShapeFactory_, calls, shape_
+
+    @pytest.fixture(params=[
+        ('Bar', 1), ('Foo', 0), ('Baz', None),
+    ])
+    def get_by_name_fixture(
+            self, request, BaseShapeFactory_, shape_, _caches_proxies_):
+        name, sp_idx = request.param
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:cNvPr{name=Foo},p:sp/p:nvSpPr/p:cNvPr'
+            '{name=Bar},p:sp/p:nvSpPr/p:cNvPr{name=Foo})'
+        )
+        shapes = _BaseShapes(spTree, None)
+        if sp_idx is None:
+            return shapes, name, BaseShapeFactory_, [], 'default'
+        calls = [call(spTree[sp_idx], shapes)]
+        return shapes, name, BaseShapeFactory_, calls, shape_
+
     @pytest.fixture
-    def getitem_fixture(self, BaseShapeFactory_, shape_):
+    def getitem_fixture(self, BaseShapeFactory_, shape_, _caches_proxies_):
         spTree = element('p:spTree/(p:sp,p:sp)')
         shapes = _BaseShapes(spTree, None)
         idx = 1
@@ -141,13 +242,13 @@ class Describe_BaseShapes(object):
         return shapes, idx, BaseShapeFactory_, sp, shape_
 
     @pytest.fixture
-    def getitem_raises_fixture(self):
+    def getitem_raises_fixture(self, _caches_proxies_):
         spTree = element('p:spTree/(p:sp,p:sp)')
         shapes = _BaseShapes(spTree, None)
         return shapes
 
     @pytest.fixture
-    def iter_fixture(self, BaseShapeFactory_):
+    def iter_fixture(self, BaseShapeFactory_, _caches_proxies_):
         spTree = element('p:spTree/(p:sp,p:sp)')
         sps = spTree.xpath('p:sp')
         shapes = _BaseShapes(spTree, None)
@@ -164,7 +265,7 @@ class Describe_BaseShapes(object):
         return shapes, sps
 
     @pytest.fixture
-    def len_fixture(self):
+    def len_fixture(self, _caches_proxies_):
         shapes = _BaseShapes(element('p:spTree/(p:spPr,p:sp,p:sp)'), None)
         expected_count = 2
         return shapes, expected_count
@@ -213,6 +314,12 @@ class Describe_BaseShapes(object):
             return_value=shape_, autospec=True
         )
 
+    @pytest.fixture
+    def _caches_proxies_(self, request):
+        return property_mock(
+            request, _BaseShapes, '_caches_proxies', return_value=False
+        )
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, Shape)
@@ -343,6 +450,23 @@ class DescribeSlidePlaceholders(object):
         placeholders, expected_value = len_fixture
         assert len(placeholders) == expected_value
 
+    def it_can_return_the_same_placeholder_each_time(self, _caches_proxies_):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1},p:sp/p:nvS'
+            'pPr/p:nvPr/p:ph{type=title})'
+        )
+        placeholders = SlidePlaceholders(spTree, None)
+        assert placeholders[1] is not placeholders[1]
+
+        _caches_proxies_.return_value = True
+        placeholder = placeholders[1]
+        assert list(placeholders) == [placeholders[0], placeholder]
+        assert list(placeholders)[1] is placeholder
+
+        spTree.remove(spTree[1])
+        assert placeholders[1] is not placeholder
+        assert placeholders[1] is placeholders[1]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -354,7 +478,9 @@ class DescribeSlidePlaceholders(object):
         ('p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
          'p:sp/p:nvSpPr/p:nvPr/p:ph{type=pic,idx=3})', 3, 1),
     ])
-    def getitem_fixture(self, request, SlideShapeFactory_, placeholder_):
+    def getitem_fixture(
+            self, request, SlideShapeFactory_, placeholder_,
+            _caches_proxies_):
         spTree_cxml, idx, offset = request.param
         spTree = element(spTree_cxml)
         placeholders = SlidePlaceholders(spTree, None)
@@ -368,7 +494,9 @@ class DescribeSlidePlaceholders(object):
          'p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
          'p:pic/p:nvPicPr/p:nvPr/p:ph{type=pic,idx=3})', (1, 0, 2)),
     ])
-    def iter_fixture(self, request, SlideShapeFactory_, placeholder_):
+    def iter_fixture(
+            self, request, SlideShapeFactory_, placeholder_,
+            _caches_proxies_):
         spTree_cxml, sequence = request.param
         spTree = element(spTree_cxml)
         placeholders = SlidePlaceholders(spTree, None)
@@ -386,13 +514,20 @@ class DescribeSlidePlaceholders(object):
          'p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},'
          'p:pic/p:nvPicPr/p:nvPr/p:ph{type=pic,idx=3})',                3),
     ])
-    def len_fixture(self, request):
+    def len_fixture(self, request, _caches_proxies_):
         spTree_cxml, length = request.param
         placeholders = SlidePlaceholders(element(spTree_cxml), None)
         return placeholders, length
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def _caches_proxies_(self, request):
+        return property_mock(
+            request, SlidePlaceholders, '_caches_proxies',
+            return_value=False
+        )
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, _BaseSlidePlaceholder)
@@ -606,7 +741,7 @@ class DescribeSlideShapes(object):
         picture = shapes.add_picture(image_file, x, y, cx, cy)
 
         shapes.part.get_or_add_image_part.assert_called_once_with(
-            image_file
+            image_file, cx, cy, None
         )
         pic = shapes._element.xpath('p:pic')[0]
         shapes._shape_factory.assert_called_once_with(shapes, pic)
@@ -789,7 +924,7 @@ class DescribeSlideShapes(object):
         return shapes, sp, SlideShapeFactory_, shape_
 
     @pytest.fixture(params=[0, 1, 2])
-    def index_fixture(self, request, shape_):
+    def index_fixture(self, request, shape_, _caches_proxies_):
         idx = request.param
         spTree = element('p:spTree/(p:sp,p:sp,p:sp)')
         sps = spTree.xpath('p:sp')
@@ -799,7 +934,7 @@ class DescribeSlideShapes(object):
         return shapes, shape_, expected_value
 
     @pytest.fixture
-    def index_raises_fixture(self, shape_):
+    def index_raises_fixture(self, shape_, _caches_proxies_):
         spTree = element('p:spTree/(p:sp,p:sp,p:sp)')
         shapes = SlideShapes(spTree, None)
         shape_.element = element('p:sp')
@@ -918,6 +1053,12 @@ class DescribeSlideShapes(object):
     def _add_cxnSp_(self, request):
         return method_mock(request, SlideShapes, '_add_cxnSp', autospec=True)
 
+    @pytest.fixture
+    def _caches_proxies_(self, request):
+        return property_mock(
+            request, SlideShapes, '_caches_proxies', return_value=False
+        )
+
     @pytest.fixture
     def chart_data_(self, request):
         return instance_mock(request, ChartData)
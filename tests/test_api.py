@@ -12,7 +12,7 @@ import os
 
 import pytest
 
-from pptx.api import Presentation
+from pptx.api import compact, Presentation
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.parts.presentation import PresentationPart
 
@@ -24,7 +24,7 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, False, False)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -55,3 +55,11 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribeCompact(object):
+
+    def it_compacts_the_package_at_a_path(self, request):
+        Package_ = class_mock(request, 'pptx.api.Package')
+        compact('foo.pptx')
+        Package_.compact.assert_called_once_with('foo.pptx')
@@ -0,0 +1,121 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.extract module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import io
+
+from zipfile import ZipFile
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.extract import (
+    _iter_shape_text, _shape_text, core_properties, iter_notes_text,
+    iter_text, iter_titles
+)
+from pptx.opc.packuri import PackURI
+from pptx.util import Inches
+
+from .unitutil.cxml import element
+from .unitutil.file import absjoin, test_file_dir
+
+
+class DescribeIterText(object):
+
+    def it_generates_the_text_of_each_shape_on_each_slide(self, deck):
+        pptx_file, prs = deck
+        expected_text = [
+            (slide_idx, shape.id, shape.text_frame.text)
+            for slide_idx, slide in enumerate(prs.slides)
+            for shape in slide.shapes
+            if shape.has_text_frame
+        ]
+        assert list(iter_text(pptx_file)) == expected_text
+
+    def it_can_generate_the_title_of_each_slide(self, deck):
+        pptx_file, _ = deck
+        assert list(iter_titles(pptx_file)) == [(0, 'Title 0'), (2, '')]
+
+    def it_can_generate_the_notes_text_of_each_slide(self, deck):
+        pptx_file, _ = deck
+        assert list(iter_notes_text(pptx_file)) == [(1, 'Notes\nfor 1')]
+
+    def it_leaves_entities_in_the_slide_xml_unresolved(self):
+        partname = PackURI('/ppt/slides/slide1.xml')
+        slide_xml = (
+            '<!DOCTYPE p:sld [<!ENTITY x "Foo">]>'
+            '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationm'
+            'l/2006/main" xmlns:a="http://schemas.openxmlformats.org/drawing'
+            'ml/2006/main"><p:cSld><p:spTree><p:sp><p:nvSpPr><p:cNvPr id="2"'
+            '/><p:nvPr/></p:nvSpPr><p:txBody><a:p><a:r><a:t>&x;</a:t></a:r>'
+            '</a:p></p:txBody></p:sp></p:spTree></p:cSld></p:sld>'
+        )
+        stream = io.BytesIO()
+        with ZipFile(stream, 'w') as zipf:
+            zipf.writestr(partname.membername, slide_xml)
+        with ZipFile(stream) as zipf:
+            shape_text = list(_iter_shape_text(zipf, partname))
+        assert shape_text == [(2, None, '')]
+
+    def it_reads_the_text_of_a_shape(self, shape_text_fixture):
+        sp, expected_value = shape_text_fixture
+        assert _shape_text(sp) == expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('p:sp/p:nvSpPr/(p:cNvPr{id=3},p:nvPr)', None),
+        ('p:sp/(p:nvSpPr/(p:cNvPr{id=3},p:nvPr),p:txBody/a:p)',
+         (3, None, '')),
+        ('p:sp/(p:nvSpPr/(p:cNvPr,p:nvPr),p:txBody/a:p/a:r/a:t"Foo")',
+         None),
+        ('p:sp/p:txBody/a:p/a:r/a:t"Foo"', None),
+        ('p:sp/(p:nvSpPr/(p:cNvPr{id=4},p:nvPr/p:ph{type=title}),p:txBody/'
+         'a:p/a:r/a:t"Foo")', (4, 'title', 'Foo')),
+        ('p:sp/(p:nvSpPr/(p:cNvPr{id=5},p:nvPr/p:ph{idx=1}),p:txBody/(a:p/'
+         '(a:r/a:t"Foo",a:br,a:fld/a:t"1"),a:p,a:p/a:r/a:t"Bar"))',
+         (5, 'obj', 'Foo\n1\n\nBar')),
+    ])
+    def shape_text_fixture(self, request):
+        sp_cxml, expected_value = request.param
+        return element(sp_cxml), expected_value
+
+
+class DescribeCoreProperties(object):
+
+    def it_reads_the_core_properties_of_a_presentation(self, deck):
+        pptx_file, _ = deck
+        core_props = core_properties(pptx_file)
+        assert core_props.title == 'Deck title'
+        assert core_props.author == 'Author'
+
+    def but_it_returns_None_when_there_are_none(self):
+        pptx_file = absjoin(test_file_dir, 'no-core-props.pptx')
+        assert core_properties(pptx_file) is None
+
+
+# fixtures -------------------------------------------------------------
+
+@pytest.fixture(scope='module')
+def deck():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = 'Title 0'
+    slide.placeholders[1].text_frame.text = 'First line\nsecond line'
+    slide.placeholders[1].text_frame.add_paragraph().text = 'Second para'
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text = 'Textbox'
+    slide.shapes.add_picture(
+        absjoin(test_file_dir, 'python-icon.jpeg'), 0, 0
+    )
+    slide.notes_slide.notes_text_frame.text = 'Notes\nfor 1'
+    prs.slides.add_slide(prs.slide_layouts[0])
+    prs.core_properties.title = 'Deck title'
+    prs.core_properties.author = 'Author'
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream, Presentation(stream)
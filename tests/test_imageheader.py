@@ -0,0 +1,112 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.imageheader module.
+"""
+
+from __future__ import absolute_import
+
+import pytest
+
+from struct import pack
+
+from pptx.imageheader import probe
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+def _png(*chunks):
+    ihdr = pack('>II', 140, 56) + b'\x08\x02\x00\x00\x00'
+    chunks = (b'IHDR' + ihdr,) + chunks + (b'IDAT', b'IEND')
+    return b'\x89PNG\r\n\x1a\n' + b''.join(
+        pack('>I', len(chunk) - 4) + chunk + b'\x00\x00\x00\x00'
+        for chunk in chunks
+    )
+
+
+def _jpeg(*segments):
+    sof = b'\xFF\xC0' + pack('>HBHHB', 8, 8, 45, 123, 3)
+    return b'\xFF\xD8' + b''.join(
+        marker + pack('>H', len(payload) + 2) + payload
+        for marker, payload in segments
+    ) + sof + b'\xFF\xDA'
+
+
+def _tiff(byte_order, unit=None, res=None):
+    entries = [(256, 3, 123), (257, 4, 45)]
+    if unit is not None:
+        entries.append((296, 3, unit))
+    if res is not None:
+        entries.extend([(282, 5, 8 + 2 + 12*5), (283, 5, 8 + 2 + 12*5 + 8)])
+    entries += [(0, 1, 0)] * (5 - len(entries))
+    fmt = {b'II': '<', b'MM': '>'}[byte_order]
+    ifd = pack(fmt + 'H', len(entries)) + b''.join(
+        pack(fmt + 'HHI', tag, field_type, 1) +
+        (pack(fmt + 'HH', value, 0) if field_type == 3 and fmt == '>'
+         else pack(fmt + 'I', value))
+        for tag, field_type, value in entries
+    )
+    rationals = pack(fmt + 'IIII', res or 0, 1, res or 0, 2)
+    magic = b'II*\x00' if fmt == '<' else b'MM\x00*'
+    return magic + pack(fmt + 'I', 8) + ifd + rationals
+
+
+class DescribeProbe(object):
+
+    def it_reads_the_properties_from_the_image_header(self, probe_fixture):
+        blob, expected_value = probe_fixture
+        assert probe(blob) == expected_value
+
+    def it_reads_the_properties_of_image_files(self, file_fixture):
+        filename, expected_value = file_fixture
+        with open(absjoin(test_file_dir, filename), 'rb') as f:
+            blob = f.read()
+        assert probe(blob) == expected_value
+
+    def it_only_reads_the_image_header(self):
+        blob = memoryview(_jpeg() + b'\x00' * 1024)
+        assert probe(blob) == ('JPEG', (123, 45), None)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (_png(), ('PNG', (140, 56), None)),
+        (_png(b'pHYs' + pack('>IIB', 5906, 11811, 1)),
+         ('PNG', (140, 56), (5906 * 0.0254, 11811 * 0.0254))),
+        (_png(b'pHYs' + pack('>IIB', 1, 2, 0)), ('PNG', (140, 56), None)),
+        (_jpeg(), ('JPEG', (123, 45), None)),
+        (_jpeg((b'\xFF\xE0', b'JFIF\x00\x01\x01' + pack('>BHH', 1, 96, 48))),
+         ('JPEG', (123, 45), (96.0, 48.0))),
+        (_jpeg((b'\xFF\xE0', b'JFIF\x00\x01\x01' + pack('>BHH', 2, 50, 50))),
+         ('JPEG', (123, 45), (127.0, 127.0))),
+        (_jpeg((b'\xFF\xE0', b'JFIF\x00\x01\x01' + pack('>BHH', 0, 1, 1))),
+         ('JPEG', (123, 45), None)),
+        (_jpeg((b'\xFF\xE1', b'Exif\x00\x00' + _tiff(b'MM', 2, 300))),
+         ('JPEG', (123, 45), (300.0, 150.0))),
+        (b'GIF89a' + pack('<HH', 290, 360), ('GIF', (290, 360), None)),
+        (b'BM' + b'\x00' * 12 + pack('<IHH', 12, 211, 71),
+         ('BMP', (211, 71), None)),
+        (b'BM' + b'\x00' * 12 + pack('<Iii', 40, 211, -71) + b'\x00' * 12 +
+         pack('<ii', 3780, 3780), ('BMP', (211, 71), (3780 * 0.0254,) * 2)),
+        (_tiff(b'II'), ('TIFF', (123, 45), None)),
+        (_tiff(b'II', res=72), ('TIFF', (123, 45), (72.0, 36.0))),
+        (_tiff(b'MM', 3, 100), ('TIFF', (123, 45), (254.0, 127.0))),
+        (_tiff(b'MM', 1, 100), ('TIFF', (123, 45), None)),
+        (b'\x89PNG\r\n\x1a\n\x00', None),
+        (_jpeg()[:-14], None),
+        (b'\x01\x00\x09\x00\x00\x03', None),
+        (b'', None),
+    ])
+    def probe_fixture(self, request):
+        blob, expected_value = request.param
+        return blob, expected_value
+
+    @pytest.fixture(params=[
+        ('monty-truth.png',    ('PNG',  (150, 214), None)),
+        ('python-icon.jpeg',   ('JPEG', (204, 204), None)),
+        ('python-powered.png', ('PNG',  (140, 56),  None)),
+        ('python.bmp',         ('BMP',  (211, 71),  None)),
+    ])
+    def file_fixture(self, request):
+        filename, expected_value = request.param
+        return filename, expected_value
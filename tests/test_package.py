@@ -10,14 +10,16 @@ from __future__ import (
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part, _Relationship
 from pptx.opc.packuri import PackURI
 from pptx.package import _ImageParts, Package
 from pptx.parts.coreprops import CorePropertiesPart
-from pptx.parts.image import Image, ImagePart
-
+from pptx.parts.image import DownsamplePolicy, Image, ImagePart
+from pptx.util import Inches
 
+from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import (
     class_mock, instance_mock, method_mock, property_mock
 )
@@ -29,21 +31,112 @@ class DescribePackage(object):
         pkg = Package.open('pptx/templates/default.pptx')
         assert isinstance(pkg.core_properties, CorePropertiesPart)
 
+    def it_can_compact_its_media(self, _image_parts_):
+        package = Package()
+        package.compact_media('downsampling')
+        package._image_parts.compact.assert_called_once_with('downsampling')
+
     def it_can_get_or_add_an_image_part(self, image_part_fixture):
         package, image_file, image_part_ = image_part_fixture
         image_part = package.get_or_add_image_part(image_file)
         package._image_parts.get_or_add_image_part.assert_called_once_with(
-            image_file
+            image_file, None, None, None
         )
         assert image_part is image_part_
 
+    def it_applies_its_image_downsampling_by_default(
+            self, downsampling_fixture):
+        package, downsampling, expected_downsampling = downsampling_fixture
+        package.get_or_add_image_part('foobar.png', 42, 24, downsampling)
+        package._image_parts.get_or_add_image_part.assert_called_once_with(
+            'foobar.png', 42, 24, expected_downsampling
+        )
+
     def it_knows_the_next_available_image_partname(self, next_fixture):
         package, ext, expected_value = next_fixture
         partname = package.next_image_partname(ext)
         assert partname == expected_value
 
+    def it_keeps_the_image_index_of_each_package_apart(self):
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        prs, other_prs = Presentation(), Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        prs.slides.add_slide(prs.slide_layouts[6])
+        other_slide = other_prs.slides.add_slide(other_prs.slide_layouts[6])
+        picture = slide.shapes.add_picture(image_path, 0, 0)
+        other_slide.shapes.add_picture(image_path, 0, 0)
+        other_package = other_prs.part.package
+        sha1_index = other_package._image_parts._image_parts_by_sha1
+        removals = other_package.rels_removals
+
+        picture.click_action.hyperlink.address = 'http://foo/bar'
+        picture.click_action.hyperlink.address = None
+        del slide.part.rels[picture._pic.blipFill.blip.rEmbed]
+        prs.part.drop_rel(prs.slides._sldIdLst[1].rId)
+
+        assert other_package.rels_removals == removals
+        assert other_package._image_parts._image_parts_by_sha1 is sha1_index
+
+    def it_updates_its_image_index_when_an_image_is_dropped(self):
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        other_path = absjoin(test_file_dir, 'monty-truth.png')
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        picture = slide.shapes.add_picture(image_path, 0, 0)
+        other_picture = slide.shapes.add_picture(other_path, 0, 0)
+        package = prs.part.package
+        image_parts = package._image_parts
+        sha1_index = image_parts._image_parts_by_sha1
+        rId = picture._pic.blipFill.blip.rEmbed
+        image_part = slide.part.related_parts[rId]
+        removals = package.rels_removals
+
+        picture.click_action.hyperlink.address = 'http://foo/bar'
+        picture.click_action.hyperlink.address = None
+        del slide.part.rels[rId]
+
+        assert package.rels_removals == removals
+        assert image_parts._image_parts_by_sha1 is sha1_index
+        assert image_parts._find_by_sha1(image_part.sha1) is None
+        assert image_parts._find_by_sha1(other_picture.image.sha1) is not None
+        slide.part.relate_to(image_part, RT.IMAGE)
+        assert image_parts._find_by_sha1(image_part.sha1) is image_part
+        assert image_parts._image_parts_by_sha1 is sha1_index
+
+    def it_keeps_a_dropped_image_related_again_from_a_new_slide(self):
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        other_path = absjoin(test_file_dir, 'monty-truth.png')
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        picture = slide.shapes.add_picture(image_path, 0, 0)
+        rId = picture._pic.blipFill.blip.rEmbed
+        image_part = slide.part.related_parts[rId]
+        del slide.part.rels[rId]
+
+        new_slide = prs.slides.add_slide(prs.slide_layouts[6])
+        new_slide.part.relate_to(image_part, RT.IMAGE)
+        other_picture = new_slide.shapes.add_picture(other_path, 0, 0)
+
+        image_parts = prs.part.package._image_parts
+        assert image_parts._find_by_sha1(image_part.sha1) is image_part
+        other_rId = other_picture._pic.blipFill.blip.rEmbed
+        other_image_part = new_slide.part.related_parts[other_rId]
+        assert other_image_part.partname != image_part.partname
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        (None,    None,      None),
+        (None,    'policy',  'policy'),
+        (False,   'policy',  None),
+        ('other', 'policy',  'other'),
+    ])
+    def downsampling_fixture(self, request, _image_parts_):
+        downsampling, default, expected_downsampling = request.param
+        package = Package()
+        package.image_downsampling = default
+        return package, downsampling, expected_downsampling
+
     @pytest.fixture
     def image_part_fixture(self, _image_parts_, image_part_):
         package = Package()
@@ -111,13 +204,130 @@ class Describe_ImageParts(object):
         ImagePart_.new.assert_called_once_with(package_, image_)
         assert image_part is image_part_
 
+    def it_can_add_a_downsampled_image_part(self, downsample_fixture):
+        image_parts, image_file, downsampling_, image_ = downsample_fixture[:4]
+        small_image_, ImagePart_, package_, image_part_ = (
+            downsample_fixture[4:]
+        )
+
+        image_part = image_parts.get_or_add_image_part(
+            image_file, 42, 24, downsampling_
+        )
+
+        downsampling_.key.assert_called_once_with(image_, 42, 24)
+        image_parts._find_by_sha1.assert_called_once_with('key')
+        downsampling_.apply.assert_called_once_with(image_, 42, 24)
+        ImagePart_.new.assert_called_once_with(package_, small_image_)
+        assert image_part is image_part_
+        assert image_part.downsampled_from == 'key'
+
+    def it_drops_unreferenced_and_duplicate_images(self, compact_fixture):
+        prs, slide, image_parts = compact_fixture
+        dup_part = ImagePart.new(prs.part.package, Image.from_file(
+            absjoin(test_file_dir, 'python-icon.jpeg')
+        ))
+        rId = slide.part.relate_to(dup_part, RT.IMAGE)
+        slide.shapes._add_pic_from_image_part(dup_part, rId, 0, 0, 6, 6)
+        picture = slide.shapes.add_picture(
+            absjoin(test_file_dir, 'monty-truth.png'), 0, 0
+        )
+        slide.shapes._spTree.remove(picture._element)
+        image_part = slide.part.related_parts['rId2']
+
+        image_parts.compact()
+
+        assert list(image_parts) == [image_part]
+        assert slide.part.related_parts == {
+            'rId1': prs.slide_layouts[6].part,
+            'rId2': image_part,
+            rId: image_part,
+        }
+
+    def it_can_downsample_images_as_it_compacts(self, compact_fixture):
+        prs, slide, image_parts = compact_fixture
+        shapes = slide.shapes
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        shapes.add_picture(image_path, 0, 0, Inches(2))
+
+        image_parts.compact(DownsamplePolicy(dpi=40))
+
+        assert shapes[0].image.size == (80, 80)
+        assert shapes[1].image.size == (80, 80)
+        assert len(list(image_parts)) == 1
+
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
         image_parts, sha1, expected_value = find_fixture
         image_part = image_parts._find_by_sha1(sha1)
         assert image_part is expected_value
 
+    def it_indexes_the_image_parts_by_sha1_once(
+            self, _iter_, image_part_, package_):
+        image_parts = _ImageParts(package_)
+        image_part_.sha1 = 'foobar'
+        _iter_.return_value = iter((image_part_,))
+        assert image_parts._find_by_sha1('foobar') is image_part_
+        assert image_parts._find_by_sha1('barfoo') is None
+        _iter_.assert_called_once_with()
+
+    def it_indexes_downsampled_image_parts_by_key(
+            self, _iter_, image_part_, package_):
+        image_parts = _ImageParts(package_)
+        image_part_.sha1 = 'foobar'
+        image_part_.downsampled_from = ('barfoo', (42, 24), None)
+        _iter_.return_value = iter((image_part_,))
+        key = ('barfoo', (42, 24), None)
+        assert image_parts._find_by_sha1(key) is image_part_
+        assert image_parts._find_by_sha1('barfoo') is None
+
+    def it_indexes_an_image_part_it_adds(self, add_index_fixture):
+        image_parts, image_file, ImagePart_, image_part_ = add_index_fixture
+        image_part = image_parts.get_or_add_image_part(image_file)
+        assert image_parts.get_or_add_image_part(image_file) is image_part
+        assert image_part is image_part_
+        assert ImagePart_.new.call_count == 1
+
+    def it_indexes_again_after_a_relationship_is_removed(
+            self, _iter_, image_part_, package_):
+        image_parts = _ImageParts(package_)
+        image_part_.sha1 = 'foobar'
+        _iter_.side_effect = lambda: iter((image_part_,))
+        image_parts._find_by_sha1('foobar')
+        package_.rels_removals = 1
+        assert image_parts._find_by_sha1('foobar') is image_part_
+        assert _iter_.call_count == 2
+
+    def it_updates_its_index_as_image_parts_leave_and_return(
+            self, _iter_, image_part_, package_, request):
+        other_image_part_ = instance_mock(request, ImagePart)
+        image_parts = _ImageParts(package_)
+        image_part_.sha1, image_part_.downsampled_from = 'foobar', 'key'
+        other_image_part_.sha1, other_image_part_.downsampled_from = (
+            'barfoo', None
+        )
+        _iter_.return_value = iter((image_part_, other_image_part_))
+        sha1_index = image_parts._image_parts_by_sha1
+
+        image_parts.forget(image_part_)
+        assert sha1_index == {'barfoo': other_image_part_}
+        image_parts.remember(image_part_)
+        assert image_parts._find_by_sha1('foobar') is image_part_
+        assert image_parts._find_by_sha1('key') is image_part_
+        assert image_parts._image_parts_by_sha1 is sha1_index
+        _iter_.assert_called_once_with()
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def add_index_fixture(self, package_, Image_, image_, _iter_,
+                          ImagePart_, image_part_):
+        image_parts = _ImageParts(package_)
+        image_file = 'foobar.png'
+        Image_.from_file.return_value = image_
+        image_.sha1 = 'foobar'
+        _iter_.return_value = iter(())
+        ImagePart_.new.return_value = image_part_
+        return image_parts, image_file, ImagePart_, image_part_
+
     @pytest.fixture
     def add_fixture(self, package_, Image_, image_, _find_by_sha1_,
                     ImagePart_, image_part_):
@@ -131,10 +341,36 @@ class Describe_ImageParts(object):
             image_part_
         )
 
+    @pytest.fixture
+    def compact_fixture(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        slide.shapes.add_picture(image_path, 0, 0, Inches(1))
+        return prs, slide, prs.part.package._image_parts
+
+    @pytest.fixture
+    def downsample_fixture(self, package_, Image_, image_, _find_by_sha1_,
+                           ImagePart_, image_part_, request):
+        image_parts = _ImageParts(package_)
+        image_file = 'foobar.png'
+        downsampling_ = instance_mock(request, DownsamplePolicy)
+        small_image_ = instance_mock(request, Image)
+        Image_.from_file.return_value = image_
+        image_.sha1 = 'foobar'
+        downsampling_.key.return_value = 'key'
+        downsampling_.apply.return_value = small_image_
+        _find_by_sha1_.return_value = None
+        ImagePart_.new.return_value = image_part_
+        return (
+            image_parts, image_file, downsampling_, image_, small_image_,
+            ImagePart_, package_, image_part_
+        )
+
     @pytest.fixture(params=[True, False])
-    def find_fixture(self, request, _iter_, image_part_):
+    def find_fixture(self, request, _iter_, image_part_, package_):
         image_part_is_present = request.param
-        image_parts = _ImageParts(None)
+        image_parts = _ImageParts(package_)
         _iter_.return_value = iter((image_part_,))
         sha1 = 'foobar'
         if image_part_is_present:
@@ -204,4 +440,6 @@ class Describe_ImageParts(object):
 
     @pytest.fixture
     def package_(self, request):
-        return instance_mock(request, Package)
+        package_ = instance_mock(request, Package)
+        package_.rels_removals = 0
+        return package_
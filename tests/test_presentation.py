@@ -10,7 +10,9 @@ from __future__ import (
 
 import pytest
 
+from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
+from pptx.parts.image import DownsamplePolicy
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
 from pptx.presentation import Presentation
@@ -44,10 +46,32 @@ class DescribePresentation(object):
         prs, prs_part_ = part_fixture
         assert prs.part is prs_part_
 
+    def it_can_compact_its_media(self, prs_part_, request):
+        prs = Presentation(None, prs_part_)
+        package_ = prs_part_.package = instance_mock(request, Package)
+        prs.compact_media('downsampling')
+        package_.compact_media.assert_called_once_with('downsampling')
+
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         prs, core_properties_ = core_props_fixture
         assert prs.core_properties is core_properties_
 
+    def it_knows_whether_it_caches_shape_proxies(self, request, prs_part_):
+        prs = Presentation(None, prs_part_)
+        package_ = instance_mock(request, Package, cache_shape_proxies=False)
+        prs_part_.package = package_
+        assert prs.cache_shape_proxies is False
+        prs.cache_shape_proxies = 1
+        assert package_.cache_shape_proxies is True
+        assert prs.cache_shape_proxies is True
+
+    def it_knows_its_image_downsampling(self, downsampling_fixture):
+        prs, package_, downsampling_ = downsampling_fixture
+        assert prs.image_downsampling is None
+        prs.image_downsampling = downsampling_
+        assert package_.image_downsampling is downsampling_
+        assert prs.image_downsampling is downsampling_
+
     def it_provides_access_to_its_notes_master(self, notes_master_fixture):
         prs, notes_master_ = notes_master_fixture
         assert prs.notes_master is notes_master_
@@ -85,7 +109,12 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, None, None, False)
+
+    def it_can_save_with_save_options(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        prs.save(file_, compression=1, workers=4, append=True)
+        prs_part_.save.assert_called_once_with(file_, 1, 4, True)
 
     # fixtures -------------------------------------------------------
 
@@ -122,6 +151,14 @@ class DescribePresentation(object):
         expected_xml = xml(expected_cxml)
         return prs, SlideMasters_, slide_masters_, expected_xml
 
+    @pytest.fixture
+    def downsampling_fixture(self, request, prs_part_):
+        prs = Presentation(None, prs_part_)
+        package_ = instance_mock(request, Package, image_downsampling=None)
+        downsampling_ = instance_mock(request, DownsamplePolicy)
+        prs_part_.package = package_
+        return prs, package_, downsampling_
+
     @pytest.fixture
     def notes_master_fixture(self, prs_part_, notes_master_):
         prs = Presentation(None, prs_part_)
@@ -424,8 +424,9 @@ class DescribeSlides(object):
             slides[2]
 
     def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
-        slides, slide, expected_value = index_fixture
-        index = slides.index(slide)
+        slides, slide_, prs_part_, expected_value = index_fixture
+        index = slides.index(slide_)
+        prs_part_.slide_index.assert_called_once_with(slide_.part)
         assert index == expected_value
 
     def it_raises_on_slide_not_in_collection(self, raises_fixture):
@@ -454,6 +455,20 @@ class DescribeSlides(object):
         assert slides._sldIdLst.xml == expected_xml
         assert slide is slide_
 
+    def it_can_add_several_new_slides(self, slide_layout_, prs_part_,
+                                      part_prop_):
+        slides = Slides(element('p:sldIdLst/p:sldId{r:id=rId1,id=256}'), None)
+        prs_part_.add_slides.return_value = [('rId2', 'A'), ('rId3', 'B')]
+
+        new_slides = slides.add_slides(slide_layout_, 2)
+
+        prs_part_.add_slides.assert_called_once_with(slide_layout_, 2)
+        assert slides._sldIdLst.xml == xml(
+            'p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{r:id=rId2,id=257}'
+            ',p:sldId{r:id=rId3,id=258})'
+        )
+        assert new_slides == ['A', 'B']
+
     def it_finds_a_slide_by_slide_id(self, get_fixture):
         slides, slide_id, default, prs_part_, expected_value = get_fixture
         slide = slides.get(slide_id, default)
@@ -499,18 +514,12 @@ class DescribeSlides(object):
         return slides
 
     @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
+    def index_fixture(self, request, part_prop_, prs_part_, slide_):
         idx = request.param
         sldIdLst = element('p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})')
         slides = Slides(sldIdLst, None)
-        _slides = [
-            Slide(element('p:sld'), None),
-            Slide(element('p:sld'), None)
-        ]
-        part_prop_.return_value.related_slide.side_effect = (
-            _slides
-        )
-        return slides, _slides[idx], idx
+        prs_part_.slide_index.return_value = idx
+        return slides, slide_, prs_part_, idx
 
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
@@ -533,10 +542,10 @@ class DescribeSlides(object):
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, part_prop_, prs_part_, slide_):
         slides = Slides(element('p:sldIdLst'), None)
-        slide = Slide(element('p:sld'), None)
-        return slides, slide
+        prs_part_.slide_index.side_effect = ValueError
+        return slides, slide_
 
     # fixture components ---------------------------------------------
 
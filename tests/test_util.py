@@ -10,7 +10,9 @@ import platform
 import pytest
 
 from pptx.compat import to_unicode
-from pptx.util import Length, Centipoints, Cm, Emu, Inches, Mm, Pt, Px
+from pptx.util import (
+    Length, Centipoints, Cm, Emu, Inches, Mm, Pt, Px, lazyproperty
+)
 
 
 def test_to_unicode_raises_on_non_string():
@@ -62,3 +64,32 @@ class DescribeLength(object):
     def units_fixture(self, request):
         emu, units_prop_name, expected_length_in_units = request.param
         return emu, units_prop_name, expected_length_in_units
+
+
+class Describe_lazyproperty(object):
+
+    def it_computes_the_value_only_once(self, obj):
+        assert obj.value is obj.value
+        assert obj.calls == [1]
+
+    def it_caches_the_value_in_a_slot_on_a_slotted_class(self, obj):
+        value = obj.value
+        assert obj._value is value
+        assert not hasattr(obj, '__dict__')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def obj(self):
+        class Slotted(object):
+            __slots__ = ('calls', '_value')
+
+            def __init__(self):
+                self.calls = []
+
+            @lazyproperty
+            def value(self):
+                self.calls.append(1)
+                return object()
+
+        return Slotted()